@@ -1,3 +1,18 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import UserActivityCounters, UserActivityBitmap
+
+
+@admin.register(UserActivityCounters)
+class UserActivityCountersAdmin(admin.ModelAdmin):
+    list_display = ('user', 'workout_count', 'meal_count', 'post_count', 'comment_count', 'updated_at')
+    search_fields = ('user__username', 'user__email')
+    readonly_fields = [field.name for field in UserActivityCounters._meta.fields]
+
+
+@admin.register(UserActivityBitmap)
+class UserActivityBitmapAdmin(admin.ModelAdmin):
+    list_display = ('user', 'active_days', 'updated_at')
+    search_fields = ('user__username', 'user__email')
+    readonly_fields = ('user', 'updated_at')
+    exclude = ('bits',)
@@ -0,0 +1,28 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from analytics.services import ActivityBitmapService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-user daily activity bitmaps from workouts, meals and posts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', '-i', type=int, action='append', help='Only rebuild this user (repeatable)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Number of users rebuilt per batch')
+
+    def handle(self, *args, **options):
+        user_ids = options.get('user_id')
+        chunk_size = options['chunk_size']
+
+        if not user_ids:
+            user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+
+        written = 0
+
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            written += ActivityBitmapService.rebuild(chunk)
+            self.stdout.write(f'Rebuilt {min(start + chunk_size, len(user_ids))}/{len(user_ids)} users...')
+
+        self.stdout.write(self.style.SUCCESS(f'Activity bitmaps rebuilt: {written} users with activity.'))
@@ -0,0 +1,28 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from analytics.services import ActivityCountersService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the per-user activity counters from workouts, meals, posts and comments, fixing drifted rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', '-i', type=int, action='append', help='Only reconcile this user (repeatable)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Number of users reconciled per batch')
+
+    def handle(self, *args, **options):
+        user_ids = options.get('user_id')
+        chunk_size = options['chunk_size']
+
+        if not user_ids:
+            user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+
+        fixed = 0
+
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            fixed += ActivityCountersService.reconcile(chunk)
+            self.stdout.write(f'Reconciled {min(start + chunk_size, len(user_ids))}/{len(user_ids)} users...')
+
+        self.stdout.write(self.style.SUCCESS(f'Activity counters reconciled: {fixed} rows created or corrected.'))
@@ -0,0 +1,97 @@
+import datetime
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+# (counter kind, model, timestamp field)
+ACTIVITY_SOURCES = (
+    ('workout', 'workouts.WorkoutCheckin', 'workout_date'),
+    ('meal', 'nutrition.Meal', 'meal_time'),
+    ('post', 'social_feed.Post', 'created_at'),
+    ('comment', 'social_feed.Comment', 'created_at'),
+)
+
+
+def local_midnight(day):
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def backfill_activity_counters(apps, schema_editor):
+    UserActivityCounters = apps.get_model('analytics', 'UserActivityCounters')
+
+    # Current local calendar periods; weeks start on Sunday
+    today = timezone.localdate()
+    week_start = today - datetime.timedelta(days=(today.weekday() + 1) % 7)
+    month_start = today.replace(day=1)
+    next_month = (month_start + datetime.timedelta(days=32)).replace(day=1)
+    week_range = (local_midnight(week_start), local_midnight(week_start + datetime.timedelta(days=7)))
+    month_range = (local_midnight(month_start), local_midnight(next_month))
+
+    counters = {}
+
+    for kind, label, field in ACTIVITY_SOURCES:
+        aggregates = apps.get_model(label).objects.order_by().values('user_id').annotate(
+            total=Count('id'),
+            last=Max(field),
+            week=Count('id', filter=Q(**{f'{field}__gte': week_range[0], f'{field}__lt': week_range[1]})),
+            month=Count('id', filter=Q(**{f'{field}__gte': month_range[0], f'{field}__lt': month_range[1]})),
+        )
+
+        for row in aggregates:
+            user_counters = counters.setdefault(row['user_id'], UserActivityCounters(
+                user_id=row['user_id'], week_start=week_start, month_start=month_start
+            ))
+            setattr(user_counters, f'{kind}_count', row['total'])
+            setattr(user_counters, f'last_{kind}_at', row['last'])
+            setattr(user_counters, f'{kind}s_this_week', row['week'])
+            setattr(user_counters, f'{kind}s_this_month', row['month'])
+
+    UserActivityCounters.objects.bulk_create(counters.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('nutrition', '0005_meal_groups'),
+        ('social_feed', '0005_alter_post_meal_alter_post_workout_checkin'),
+        ('workouts', '0018_delete_workoutdailysummary'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityCounters',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='activity_counters', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('workout_count', models.PositiveIntegerField(default=0)),
+                ('meal_count', models.PositiveIntegerField(default=0)),
+                ('post_count', models.PositiveIntegerField(default=0)),
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('last_workout_at', models.DateTimeField(blank=True, null=True)),
+                ('last_meal_at', models.DateTimeField(blank=True, null=True)),
+                ('last_post_at', models.DateTimeField(blank=True, null=True)),
+                ('last_comment_at', models.DateTimeField(blank=True, null=True)),
+                ('week_start', models.DateField(blank=True, null=True)),
+                ('workouts_this_week', models.PositiveIntegerField(default=0)),
+                ('meals_this_week', models.PositiveIntegerField(default=0)),
+                ('posts_this_week', models.PositiveIntegerField(default=0)),
+                ('comments_this_week', models.PositiveIntegerField(default=0)),
+                ('month_start', models.DateField(blank=True, null=True)),
+                ('workouts_this_month', models.PositiveIntegerField(default=0)),
+                ('meals_this_month', models.PositiveIntegerField(default=0)),
+                ('posts_this_month', models.PositiveIntegerField(default=0)),
+                ('comments_this_month', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User activity counters',
+                'verbose_name_plural': 'User activity counters',
+            },
+        ),
+        migrations.RunPython(backfill_activity_counters, migrations.RunPython.noop),
+    ]
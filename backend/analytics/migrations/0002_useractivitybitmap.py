@@ -0,0 +1,65 @@
+import datetime
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+# Day of bit 0 of every bitmap (analytics.models.ACTIVITY_BITMAP_EPOCH at the time of this migration)
+ACTIVITY_BITMAP_EPOCH = datetime.date(2020, 1, 1)
+
+# (model, timestamp field) of the activities that make a day active
+ACTIVITY_SOURCES = (
+    ('workouts.WorkoutCheckin', 'workout_date'),
+    ('nutrition.Meal', 'meal_time'),
+    ('social_feed.Post', 'created_at'),
+)
+
+
+def backfill_activity_bitmaps(apps, schema_editor):
+    UserActivityBitmap = apps.get_model('analytics', 'UserActivityBitmap')
+    epoch_start = timezone.make_aware(datetime.datetime.combine(ACTIVITY_BITMAP_EPOCH, datetime.time.min))
+    values = {}
+
+    for label, field in ACTIVITY_SOURCES:
+        active_days = (
+            apps.get_model(label).objects.filter(**{f'{field}__gte': epoch_start})
+            .order_by()
+            .annotate(day=TruncDate(field))
+            .values_list('user_id', 'day')
+            .distinct()
+        )
+
+        for user_id, day in active_days:
+            values[user_id] = values.get(user_id, 0) | 1 << (day - ACTIVITY_BITMAP_EPOCH).days
+
+    # Bit n little-endian, as UserActivityBitmap.to_bytes
+    UserActivityBitmap.objects.bulk_create([
+        UserActivityBitmap(user_id=user_id, bits=value.to_bytes((value.bit_length() + 7) // 8, 'little'))
+        for user_id, value in values.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserActivityBitmap',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='activity_bitmap', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('bits', models.BinaryField(default=bytes)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'User activity bitmap',
+                'verbose_name_plural': 'User activity bitmaps',
+            },
+        ),
+        migrations.RunPython(backfill_activity_bitmaps, migrations.RunPython.noop),
+    ]
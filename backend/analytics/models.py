@@ -1,3 +1,264 @@
-from django.db import models
+from datetime import date, timedelta
 
-# Create your models here.
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.utils import timezone
+
+from core.utils import local_datetime, week_start_for
+
+
+# Day represented by bit 0 of every activity bitmap. Activity before this date is not tracked.
+ACTIVITY_BITMAP_EPOCH = date(2020, 1, 1)
+
+
+class UserActivityCounters(models.Model):
+    """
+    Denormalized per-user activity counters.
+    Keeps totals, last activity timestamps and current week/month counts for workouts, meals, posts and comments,
+    so "how many" and "last when" questions are answered by a primary key read instead of COUNT/MAX scans.
+    Rows are maintained by the create/delete signals in analytics.signals and can be rebuilt with the
+    `reconcile_activity_counters` management command.
+    """
+    KINDS = ('workout', 'meal', 'post', 'comment')
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='activity_counters')
+
+    workout_count = models.PositiveIntegerField(default=0)
+    meal_count = models.PositiveIntegerField(default=0)
+    post_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+
+    last_workout_at = models.DateTimeField(null=True, blank=True)
+    last_meal_at = models.DateTimeField(null=True, blank=True)
+    last_post_at = models.DateTimeField(null=True, blank=True)
+    last_comment_at = models.DateTimeField(null=True, blank=True)
+
+    # Calendar week (starting on Sunday) and month the period counters below refer to, in local time
+    week_start = models.DateField(null=True, blank=True)
+    workouts_this_week = models.PositiveIntegerField(default=0)
+    meals_this_week = models.PositiveIntegerField(default=0)
+    posts_this_week = models.PositiveIntegerField(default=0)
+    comments_this_week = models.PositiveIntegerField(default=0)
+
+    month_start = models.DateField(null=True, blank=True)
+    workouts_this_month = models.PositiveIntegerField(default=0)
+    meals_this_month = models.PositiveIntegerField(default=0)
+    posts_this_month = models.PositiveIntegerField(default=0)
+    comments_this_month = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'User activity counters'
+        verbose_name_plural = 'User activity counters'
+
+    def __str__(self):
+        return f'Activity counters of {self.user_id}'
+
+    @staticmethod
+    def _plural(kind):
+        return f'{kind}s'
+
+    @staticmethod
+    def current_periods(today=None):
+        """
+        Return the (week_start, month_start) dates of the current local calendar periods.
+        """
+        today = today or timezone.localdate()
+
+        return week_start_for(today), today.replace(day=1)
+
+    def _roll_periods(self, today=None):
+        """
+        Reset the week/month counters when the stored periods are no longer the current ones.
+        """
+        week_start, month_start = self.current_periods(today)
+
+        if self.week_start != week_start:
+            self.week_start = week_start
+            for kind in self.KINDS:
+                setattr(self, f'{self._plural(kind)}_this_week', 0)
+
+        if self.month_start != month_start:
+            self.month_start = month_start
+            for kind in self.KINDS:
+                setattr(self, f'{self._plural(kind)}_this_month', 0)
+
+    def _bump(self, kind, timestamp, step):
+        """
+        Apply ``step`` (+1/-1) to the total and to the period counters the timestamp falls into.
+        """
+        day = timezone.localdate(timestamp)
+        fields = [f'{kind}_count']
+
+        if self.week_start <= day < self.week_start + timedelta(days=7):
+            fields.append(f'{self._plural(kind)}_this_week')
+
+        if (day.year, day.month) == (self.month_start.year, self.month_start.month):
+            fields.append(f'{self._plural(kind)}_this_month')
+
+        for field in fields:
+            setattr(self, field, max(getattr(self, field) + step, 0))
+
+    @classmethod
+    def record(cls, user_id, kind, timestamp):
+        """
+        Register a new activity of ``kind`` for the user.
+        Locks the counters row so concurrent check-ins of the same user are serialized.
+        """
+        timestamp = local_datetime(timestamp)
+
+        with transaction.atomic():
+            counters, _ = cls.objects.select_for_update().get_or_create(user_id=user_id)
+            counters._roll_periods()
+            counters._bump(kind, timestamp, 1)
+
+            last_field = f'last_{kind}_at'
+            last_value = getattr(counters, last_field)
+
+            if last_value is None or timestamp > last_value:
+                setattr(counters, last_field, timestamp)
+
+            counters.save()
+
+        return counters
+
+    @classmethod
+    def discard(cls, user_id, kind, timestamp, latest_lookup):
+        """
+        Unregister a deleted activity of ``kind`` for the user.
+        ``latest_lookup`` is a callable returning the user's most recent remaining timestamp; it is only called
+        when the deleted activity was the latest one.
+        Missing rows are never created here, so deleting a user does not resurrect its counters.
+        """
+        timestamp = local_datetime(timestamp)
+
+        with transaction.atomic():
+            counters = cls.objects.select_for_update().filter(user_id=user_id).first()
+
+            if counters is None:
+                return None
+
+            counters._roll_periods()
+            counters._bump(kind, timestamp, -1)
+
+            last_field = f'last_{kind}_at'
+            last_value = getattr(counters, last_field)
+
+            if last_value is not None and timestamp >= last_value:
+                setattr(counters, last_field, latest_lookup())
+
+            counters.save()
+
+        return counters
+
+    def snapshot(self, today=None):
+        """
+        Return the counters as a dict, reporting zero for week/month periods that are no longer current.
+        """
+        week_start, month_start = self.current_periods(today)
+        data = {}
+
+        for kind in self.KINDS:
+            plural = self._plural(kind)
+            data[f'{kind}_count'] = getattr(self, f'{kind}_count')
+            data[f'last_{kind}'] = getattr(self, f'last_{kind}_at')
+            data[f'{plural}_this_week'] = getattr(self, f'{plural}_this_week') if self.week_start == week_start else 0
+            data[f'{plural}_this_month'] = getattr(self, f'{plural}_this_month') if self.month_start == month_start else 0
+
+        return data
+
+
+class UserActivityBitmap(models.Model):
+    """
+    Compact per-user daily activity history.
+    Bit ``n`` of ``bits`` (little-endian) is set when the user registered a workout, a meal or a post on the local day
+    ``ACTIVITY_BITMAP_EPOCH + n``, so years of activity fit in a few hundred bytes and every bitmap shares the same
+    day alignment. Cohort retention and DAU/WAU/MAU reports are computed from these with bit operations in memory.
+    Rows are maintained by analytics.signals and can be rebuilt with the `build_activity_bitmaps` command.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='activity_bitmap')
+    bits = models.BinaryField(default=bytes)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'User activity bitmap'
+        verbose_name_plural = 'User activity bitmaps'
+
+    def __str__(self):
+        return f'Activity bitmap of {self.user_id}'
+
+    @staticmethod
+    def day_index(day):
+        """
+        Return the bit position of ``day``, or None when it predates the epoch.
+        """
+        index = (day - ACTIVITY_BITMAP_EPOCH).days
+
+        return index if index >= 0 else None
+
+    @staticmethod
+    def to_bytes(value):
+        return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+    @staticmethod
+    def from_bytes(value):
+        return int.from_bytes(bytes(value), 'little')
+
+    def as_int(self):
+        return self.from_bytes(self.bits)
+
+    def is_active_on(self, day):
+        index = self.day_index(day)
+
+        return index is not None and bool(self.as_int() >> index & 1)
+
+    def active_days(self):
+        """
+        Return the number of days with activity.
+        """
+        return self.as_int().bit_count()
+
+    @classmethod
+    def mark(cls, user_id, day):
+        """
+        Flag ``day`` as active for the user.
+        """
+        index = cls.day_index(day)
+
+        if index is None:
+            return None
+
+        with transaction.atomic():
+            bitmap, _ = cls.objects.select_for_update().get_or_create(user_id=user_id)
+            value = bitmap.as_int()
+
+            if not value >> index & 1:
+                bitmap.bits = cls.to_bytes(value | 1 << index)
+                bitmap.save()
+
+        return bitmap
+
+    @classmethod
+    def unmark(cls, user_id, day):
+        """
+        Clear the ``day`` flag for the user. The caller is responsible for checking that no activity is left that day.
+        """
+        index = cls.day_index(day)
+
+        if index is None:
+            return None
+
+        with transaction.atomic():
+            bitmap = cls.objects.select_for_update().filter(user_id=user_id).first()
+
+            if bitmap is None:
+                return None
+
+            value = bitmap.as_int()
+
+            if value >> index & 1:
+                bitmap.bits = cls.to_bytes(value & ~(1 << index))
+                bitmap.save()
+
+        return bitmap
@@ -0,0 +1,18 @@
+from rest_framework.permissions import BasePermission
+
+from clients.models import Client
+
+
+class IsClientOwnerOrAdmin(BasePermission):
+    message = 'Only the client owner or an administrator can access its analytics.'
+
+    def has_permission(self, request, view):
+        user = request.user
+
+        if not user or not user.is_authenticated:
+            return False
+
+        if user.is_staff:
+            return True
+
+        return Client.objects.filter(pk=view.kwargs.get('client_id'), owners=user).exists()
@@ -211,3 +211,62 @@ class GroupDetailSerializer(serializers.Serializer):
     # Rankings
     top_members = serializers.ListField(child=serializers.DictField())
 
+
+
+class EngagementPointSerializer(serializers.Serializer):
+    """Serializer for the active users of a single day"""
+    date = serializers.DateField()
+    dau = serializers.IntegerField()
+    wau = serializers.IntegerField()
+    mau = serializers.IntegerField()
+    stickiness = serializers.FloatField()
+
+
+class EngagementSerializer(serializers.Serializer):
+    """Serializer for DAU/WAU/MAU and stickiness over a date range"""
+    start = serializers.DateField()
+    end = serializers.DateField()
+    series = EngagementPointSerializer(many=True)
+    average_dau = serializers.FloatField()
+    average_wau = serializers.FloatField()
+    average_mau = serializers.FloatField()
+    stickiness = serializers.FloatField()
+
+
+class RetentionPointSerializer(serializers.Serializer):
+    """Serializer for the retention of a cohort in one period after signup"""
+    period = serializers.IntegerField()
+    period_start = serializers.DateField()
+    active_users = serializers.IntegerField()
+    rate = serializers.FloatField()
+
+
+class CohortSerializer(serializers.Serializer):
+    """Serializer for a signup cohort"""
+    cohort_start = serializers.DateField()
+    size = serializers.IntegerField()
+    retention = RetentionPointSerializer(many=True)
+
+
+class CohortRetentionSerializer(serializers.Serializer):
+    """Serializer for cohort retention"""
+    period = serializers.CharField()
+    cohorts = CohortSerializer(many=True)
+
+
+class TimeSeriesPointSerializer(serializers.Serializer):
+    """Serializer for the activity of a single time bucket"""
+    bucket = serializers.DateField()
+    workouts = serializers.IntegerField()
+    meals = serializers.IntegerField()
+    posts = serializers.IntegerField()
+    new_users = serializers.IntegerField()
+    xp = serializers.FloatField()
+
+
+class TimeSeriesSerializer(serializers.Serializer):
+    """Serializer for bucketed activity trends"""
+    interval = serializers.CharField()
+    start = serializers.DateField()
+    end = serializers.DateField()
+    series = TimeSeriesPointSerializer(many=True)
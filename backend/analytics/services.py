@@ -1,9 +1,14 @@
 from datetime import timedelta
 from django.contrib.auth.models import User
-from django.db.models import Count, Max, Avg, Case, When, IntegerField
+from django.db.models import (
+    Count, Max, Avg, Case, When, IntegerField, Q, Sum, F, Value, DateTimeField, ExpressionWrapper
+)
+from django.db.models.functions import Coalesce, TruncDate, TruncDay, TruncWeek, TruncMonth
 from django.utils import timezone
 
+from analytics.models import UserActivityCounters, UserActivityBitmap, ACTIVITY_BITMAP_EPOCH, week_start_for
 from clients.models import Client
+from core.utils import local_day_range
 from gamification.models import Season
 from groups.models import Group, GroupMembers
 from nutrition.models import Meal, MealStreak
@@ -12,6 +17,17 @@ from social_feed.models import Post, Comment, PostLike, CommentLike, Report
 from workouts.models import WorkoutCheckin, WorkoutStreak
 
 
+def for_client(queryset, client, lookup='employer'):
+    """
+    Restrict ``queryset`` to the given client through ``lookup``; returns it unchanged when ``client`` is None.
+    Activity tables carry a denormalized ``employer`` so the lookup hits their (employer, date) indexes.
+    """
+    if client is None:
+        return queryset
+
+    return queryset.filter(**{lookup: client})
+
+
 class DateRangeService:
     """Service for managing date ranges used in analytics."""
 
@@ -31,34 +47,527 @@ class DateRangeService:
         }
 
 
+class ActivityCountersService:
+    """Service for building and reconciling the per-user activity counters."""
+
+    # (counter kind, model, timestamp field)
+    SOURCES = (
+        ('workout', WorkoutCheckin, 'workout_date'),
+        ('meal', Meal, 'meal_time'),
+        ('post', Post, 'created_at'),
+        ('comment', Comment, 'created_at'),
+    )
+
+    @staticmethod
+    def build_counters(user_ids, today=None):
+        """
+        Compute counters from the raw activity tables for the given users.
+        Runs one GROUP BY query per activity table and returns unsaved UserActivityCounters keyed by user id.
+        """
+        week_start, month_start = UserActivityCounters.current_periods(today)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        week_range = (local_day_range(week_start)[0], local_day_range(week_start + timedelta(days=7))[0])
+        month_range = (local_day_range(month_start)[0], local_day_range(next_month)[0])
+
+        counters = {
+            user_id: UserActivityCounters(user_id=user_id, week_start=week_start, month_start=month_start)
+            for user_id in user_ids
+        }
+
+        for kind, model, field in ActivityCountersService.SOURCES:
+            plural = f'{kind}s'
+            aggregates = (
+                model.objects.filter(user_id__in=user_ids)
+                .order_by()
+                .values('user_id')
+                .annotate(
+                    total=Count('id'),
+                    last=Max(field),
+                    week=Count('id', filter=Q(**{f'{field}__gte': week_range[0], f'{field}__lt': week_range[1]})),
+                    month=Count('id', filter=Q(**{f'{field}__gte': month_range[0], f'{field}__lt': month_range[1]})),
+                )
+            )
+
+            for item in aggregates:
+                row = counters[item['user_id']]
+                setattr(row, f'{kind}_count', item['total'])
+                setattr(row, f'last_{kind}_at', item['last'])
+                setattr(row, f'{plural}_this_week', item['week'])
+                setattr(row, f'{plural}_this_month', item['month'])
+
+        return counters
+
+    @staticmethod
+    def reconcile(user_ids, today=None):
+        """
+        Rebuild the counters of the given users from the raw tables and upsert the rows that drifted.
+        Returns the number of rows created or corrected.
+        """
+        user_ids = list(user_ids)
+        expected = ActivityCountersService.build_counters(user_ids, today)
+        current = UserActivityCounters.objects.in_bulk(user_ids)
+        fields = [
+            field.attname for field in UserActivityCounters._meta.concrete_fields
+            if field.attname not in ('user_id', 'updated_at')
+        ]
+
+        drifted = [
+            row for user_id, row in expected.items()
+            if user_id not in current
+            or any(getattr(current[user_id], field) != getattr(row, field) for field in fields)
+        ]
+
+        if drifted:
+            UserActivityCounters.objects.bulk_create(
+                drifted,
+                update_conflicts=True,
+                unique_fields=['user'],
+                update_fields=fields + ['updated_at'],
+            )
+
+        return len(drifted)
+
+    @staticmethod
+    def get_for_user(user):
+        """
+        Return the user's counters row, building it from the raw tables the first time it is requested.
+        """
+        try:
+            return user.activity_counters
+        except UserActivityCounters.DoesNotExist:
+            ActivityCountersService.reconcile([user.id])
+
+            return UserActivityCounters.objects.get(user=user)
+
+
+class ActivityBitmapService:
+    """Service for building the per-user daily activity bitmaps."""
+
+    # (model, timestamp field) of the activities that make a day active
+    SOURCES = (
+        (WorkoutCheckin, 'workout_date'),
+        (Meal, 'meal_time'),
+        (Post, 'created_at'),
+    )
+
+    @staticmethod
+    def build_bitmaps(user_ids):
+        """
+        Compute the activity bitmaps of the given users from the raw activity tables.
+        Runs one query per table over the distinct (user, local day) pairs and returns bitmap integers keyed by user id.
+        """
+        epoch_start = local_day_range(ACTIVITY_BITMAP_EPOCH)[0]
+        values = dict.fromkeys(user_ids, 0)
+
+        for model, field in ActivityBitmapService.SOURCES:
+            active_days = (
+                model.objects.filter(user_id__in=user_ids, **{f'{field}__gte': epoch_start})
+                .order_by()
+                .annotate(day=TruncDate(field))
+                .values_list('user_id', 'day')
+                .distinct()
+            )
+
+            for user_id, day in active_days:
+                values[user_id] |= 1 << UserActivityBitmap.day_index(day)
+
+        return values
+
+    @staticmethod
+    def rebuild(user_ids):
+        """
+        Rebuild and upsert the bitmaps of the given users. Rows of users without any activity are removed.
+        Returns the number of rows written.
+        """
+        values = ActivityBitmapService.build_bitmaps(list(user_ids))
+        rows = [
+            UserActivityBitmap(user_id=user_id, bits=UserActivityBitmap.to_bytes(value))
+            for user_id, value in values.items()
+            if value
+        ]
+
+        UserActivityBitmap.objects.filter(user_id__in=[user_id for user_id, value in values.items() if not value]).delete()
+
+        if rows:
+            UserActivityBitmap.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['user'],
+                update_fields=['bits', 'updated_at'],
+            )
+
+        return len(rows)
+
+
+class RetentionAnalyticsService:
+    """
+    Service for cohort retention and DAU/WAU/MAU reports computed from the activity bitmaps.
+    Every user bitmap is a Python integer aligned on ACTIVITY_BITMAP_EPOCH, so windows, masks and per-day counts are
+    computed with whole-integer bit operations instead of scanning activity rows.
+    """
+
+    @staticmethod
+    def smear(value, width):
+        """
+        Return a bitmap where bit ``n`` is set if any of the bits ``n - width + 1 .. n`` of ``value`` is set,
+        i.e. "active at least once in the trailing ``width`` days".
+        """
+        span = 1
+
+        while span < width:
+            shift = min(span, width - span)
+            value |= value << shift
+            span += shift
+
+        return value
+
+    @staticmethod
+    def column_counts(values, length):
+        """
+        Count, for each of the first ``length`` bit positions, how many of ``values`` have that bit set.
+        Uses a bit-sliced adder: plane ``i`` holds bit ``i`` of every per-day counter, so each value is added to all
+        days at once with a handful of big-integer XOR/AND operations.
+        """
+        planes = []
+
+        for value in values:
+            carry = value
+            index = 0
+
+            while carry:
+                if index == len(planes):
+                    planes.append(carry)
+                    break
+
+                plane = planes[index]
+                planes[index] = plane ^ carry
+                carry = plane & carry
+                index += 1
+
+        counts = [0] * length
+        mask = (1 << length) - 1
+
+        for weight, plane in enumerate(planes):
+            bits = format(plane & mask, f'0{length}b')[::-1] if length else ''
+
+            for position, bit in enumerate(bits):
+                if bit == '1':
+                    counts[position] += 1 << weight
+
+        return counts
+
+    @staticmethod
+    def _window(value, start_index, length):
+        """
+        Return the ``length`` bits of ``value`` starting at ``start_index`` (which may be negative).
+        """
+        if start_index >= 0:
+            value >>= start_index
+        else:
+            value <<= -start_index
+
+        return value & ((1 << length) - 1)
+
+    @staticmethod
+    def _period_start(day, period):
+        if period == 'week':
+            return week_start_for(day)
+
+        return day.replace(day=1)
+
+    @staticmethod
+    def _add_periods(day, period, count):
+        if period == 'week':
+            return day + timedelta(weeks=count)
+
+        month = day.month - 1 + count
+
+        return day.replace(year=day.year + month // 12, month=month % 12 + 1, day=1)
+
+    @staticmethod
+    def _range_mask(start, end):
+        """
+        Return the bitmap mask covering the days in [start, end).
+        """
+        low = max((start - ACTIVITY_BITMAP_EPOCH).days, 0)
+        high = max((end - ACTIVITY_BITMAP_EPOCH).days, 0)
+
+        return ((1 << (high - low)) - 1) << low if high > low else 0
+
+    @staticmethod
+    def get_engagement(start, end):
+        """
+        Return daily DAU, WAU and MAU (users active on the day, in the trailing 7 and 30 days) between ``start`` and
+        ``end`` inclusive, with the DAU/MAU stickiness ratio.
+        """
+        length = (end - start).days + 1
+        lookback = 29
+        base_index = (start - ACTIVITY_BITMAP_EPOCH).days - lookback
+
+        daily, weekly, monthly = [], [], []
+
+        for bits in UserActivityBitmap.objects.values_list('bits', flat=True).iterator():
+            window = RetentionAnalyticsService._window(
+                UserActivityBitmap.from_bytes(bits), base_index, length + lookback
+            )
+
+            if not window:
+                continue
+
+            daily.append(window >> lookback)
+            weekly.append(RetentionAnalyticsService.smear(window, 7) >> lookback)
+            monthly.append(RetentionAnalyticsService.smear(window, 30) >> lookback)
+
+        dau = RetentionAnalyticsService.column_counts(daily, length)
+        wau = RetentionAnalyticsService.column_counts(weekly, length)
+        mau = RetentionAnalyticsService.column_counts(monthly, length)
+
+        series = [
+            {
+                'date': start + timedelta(days=offset),
+                'dau': dau[offset],
+                'wau': wau[offset],
+                'mau': mau[offset],
+                'stickiness': round(dau[offset] / mau[offset], 4) if mau[offset] else 0.0,
+            }
+            for offset in range(length)
+        ]
+
+        average_dau = sum(dau) / length
+        average_wau = sum(wau) / length
+        average_mau = sum(mau) / length
+
+        return {
+            'start': start,
+            'end': end,
+            'series': series,
+            'average_dau': round(average_dau, 2),
+            'average_wau': round(average_wau, 2),
+            'average_mau': round(average_mau, 2),
+            'stickiness': round(average_dau / average_mau, 4) if average_mau else 0.0,
+        }
+
+    @staticmethod
+    def get_cohort_retention(start, end, period='month', periods=12):
+        """
+        Return retention by signup cohort.
+        Users are grouped by the week/month they joined between ``start`` and ``end``; for each following period
+        (0 = the signup period itself, up to ``periods``) the share of the cohort with any activity in that period is
+        reported. Periods that have not started yet are omitted.
+        """
+        today = timezone.localdate()
+        first_cohort = RetentionAnalyticsService._period_start(start, period)
+        after_last_cohort = RetentionAnalyticsService._add_periods(
+            RetentionAnalyticsService._period_start(end, period), period, 1
+        )
+
+        signups = User.objects.filter(
+            date_joined__gte=local_day_range(first_cohort)[0],
+            date_joined__lt=local_day_range(after_last_cohort)[0],
+        ).values_list('date_joined', 'activity_bitmap__bits')
+
+        cohorts = {}
+
+        for date_joined, bits in signups.iterator():
+            cohort_start = RetentionAnalyticsService._period_start(timezone.localdate(date_joined), period)
+            cohorts.setdefault(cohort_start, []).append(UserActivityBitmap.from_bytes(bits) if bits else 0)
+
+        results = []
+        cohort_start = first_cohort
+
+        while cohort_start < after_last_cohort:
+            members = cohorts.get(cohort_start, [])
+            retention = []
+
+            for offset in range(periods + 1):
+                period_start = RetentionAnalyticsService._add_periods(cohort_start, period, offset)
+
+                if period_start > today:
+                    break
+
+                period_end = RetentionAnalyticsService._add_periods(cohort_start, period, offset + 1)
+                mask = RetentionAnalyticsService._range_mask(period_start, period_end)
+                active_users = sum(1 for value in members if value & mask)
+
+                retention.append({
+                    'period': offset,
+                    'period_start': period_start,
+                    'active_users': active_users,
+                    'rate': round(active_users / len(members), 4) if members else 0.0,
+                })
+
+            results.append({
+                'cohort_start': cohort_start,
+                'size': len(members),
+                'retention': retention,
+            })
+            cohort_start = RetentionAnalyticsService._add_periods(cohort_start, period, 1)
+
+        return {
+            'period': period,
+            'cohorts': results,
+        }
+
+
+class TimeSeriesService:
+    """
+    Service for bucketed activity trends.
+    Each metric is computed with a single GROUP BY over the truncated timestamp, in the project time zone.
+    """
+
+    INTERVALS = ('day', 'week', 'month')
+
+    # metric -> (model, timestamp field, user id field, client lookup, points field)
+    SOURCES = {
+        'workouts': (WorkoutCheckin, 'workout_date', 'user_id', 'employer', 'base_points'),
+        'meals': (Meal, 'meal_time', 'user_id', 'employer', 'base_points'),
+        'posts': (Post, 'created_at', 'user_id', 'employer', None),
+        'new_users': (User, 'date_joined', 'id', 'profile__employer', None),
+    }
+
+    @staticmethod
+    def bucket_start(day, interval):
+        """Returns the first day of the bucket containing ``day``. Weeks start on Sunday."""
+        if interval == 'week':
+            return week_start_for(day)
+
+        if interval == 'month':
+            return day.replace(day=1)
+
+        return day
+
+    @staticmethod
+    def next_bucket(day, interval):
+        if interval == 'week':
+            return day + timedelta(days=7)
+
+        if interval == 'month':
+            return (day + timedelta(days=32)).replace(day=1)
+
+        return day + timedelta(days=1)
+
+    @staticmethod
+    def _truncate(field, interval):
+        """
+        Returns the bucket expression for ``field``.
+        The database truncates weeks to Monday, so timestamps are shifted one day forward and the bucket one day back
+        to get Sunday-based weeks.
+        """
+        tzinfo = timezone.get_default_timezone()
+
+        if interval == 'week':
+            shifted = ExpressionWrapper(F(field) + timedelta(days=1), output_field=DateTimeField())
+
+            return TruncWeek(shifted, tzinfo=tzinfo)
+
+        if interval == 'month':
+            return TruncMonth(field, tzinfo=tzinfo)
+
+        return TruncDay(field, tzinfo=tzinfo)
+
+    @staticmethod
+    def _scope(queryset, user_id_field, client_lookup, client=None, group=None):
+        queryset = for_client(queryset, client, client_lookup)
+
+        if group is not None:
+            member_ids = GroupMembers.objects.filter(group=group, pending=False).values('member_id')
+            queryset = queryset.filter(**{f'{user_id_field}__in': member_ids})
+
+        return queryset
+
+    @staticmethod
+    def get_timeseries(start, end, interval='day', client=None, group=None):
+        """
+        Returns workouts, meals, posts, new users and XP per bucket between ``start`` and ``end`` (local dates,
+        inclusive). XP is the points awarded to workouts and meals in the bucket.
+        """
+        first_bucket = TimeSeriesService.bucket_start(start, interval)
+        range_start = local_day_range(start)[0]
+        range_end = local_day_range(end)[1]
+
+        buckets = {}
+        bucket = first_bucket
+
+        while bucket <= end:
+            buckets[bucket] = {
+                'bucket': bucket,
+                'workouts': 0,
+                'meals': 0,
+                'posts': 0,
+                'new_users': 0,
+                'xp': 0.0,
+            }
+            bucket = TimeSeriesService.next_bucket(bucket, interval)
+
+        for metric, (model, field, user_id_field, client_lookup, points_field) in TimeSeriesService.SOURCES.items():
+            queryset = TimeSeriesService._scope(
+                model.objects.filter(**{f'{field}__gte': range_start, f'{field}__lt': range_end}),
+                user_id_field,
+                client_lookup,
+                client,
+                group,
+            )
+            aggregates = {'total': Count('pk')}
+
+            if points_field:
+                aggregates['points'] = Sum(points_field)
+
+            rows = (
+                queryset.order_by()
+                .annotate(bucket=TimeSeriesService._truncate(field, interval))
+                .values('bucket')
+                .annotate(**aggregates)
+            )
+
+            for row in rows:
+                day = row['bucket'].date()
+
+                if interval == 'week':
+                    day -= timedelta(days=1)
+
+                item = buckets[day]
+                item[metric] = row['total']
+                item['xp'] += row.get('points') or 0.0
+
+        for item in buckets.values():
+            item['xp'] = round(item['xp'], 2)
+
+        return {
+            'interval': interval,
+            'start': start,
+            'end': end,
+            'series': list(buckets.values()),
+        }
+
+
 class UserAnalyticsService:
     """Service for user-related analytics queries."""
 
     @staticmethod
-    def get_active_user_ids(since):
+    def get_active_user_ids(since, client=None):
         """
-        Get set of user IDs that had any activity since the given date.
+        Get set of user IDs that had any activity since the given date, optionally restricted to a client.
         Optimized to use a single query with UNION-like behavior.
         """
         active_ids = set()
 
         # Batch query for workouts
         active_ids.update(
-            WorkoutCheckin.objects.filter(workout_date__gte=since)
+            for_client(WorkoutCheckin.objects.filter(workout_date__gte=since), client)
             .values_list('user_id', flat=True)
             .distinct()
         )
 
         # Batch query for meals
         active_ids.update(
-            Meal.objects.filter(meal_time__gte=since)
+            for_client(Meal.objects.filter(meal_time__gte=since), client)
             .values_list('user_id', flat=True)
             .distinct()
         )
 
         # Batch query for posts
         active_ids.update(
-            Post.objects.filter(created_at__gte=since)
+            for_client(Post.objects.filter(created_at__gte=since), client)
             .values_list('user_id', flat=True)
             .distinct()
         )
@@ -66,22 +575,23 @@ class UserAnalyticsService:
         return active_ids
 
     @staticmethod
-    def get_user_queryset_with_stats():
+    def get_user_queryset_with_stats(client=None):
         """
-        Returns optimized user queryset with all necessary annotations.
-        Uses select_related and prefetch_related to avoid N+1 queries.
+        Returns optimized user queryset with all necessary annotations, optionally restricted to a client's employees.
+        Activity counts and last activity dates are read from the denormalized activity counters
+        instead of joining and aggregating the activity tables.
         """
-        return User.objects.filter(
+        return for_client(User.objects.filter(
             is_staff=False,
             is_superuser=False
-        ).select_related('profile').annotate(
-            workout_count=Count('workouts', distinct=True),
-            meal_count=Count('meals', distinct=True),
-            post_count=Count('posts', distinct=True),
-            last_workout=Max('workouts__workout_date'),
-            last_meal=Max('meals__meal_time'),
-            last_post=Max('posts__created_at'),
-            group_count=Count('profile__groups', distinct=True)
+        ), client, 'profile__employer').select_related('profile').annotate(
+            workout_count=Coalesce(F('activity_counters__workout_count'), Value(0)),
+            meal_count=Coalesce(F('activity_counters__meal_count'), Value(0)),
+            post_count=Coalesce(F('activity_counters__post_count'), Value(0)),
+            last_workout=F('activity_counters__last_workout_at'),
+            last_meal=F('activity_counters__last_meal_at'),
+            last_post=F('activity_counters__last_post_at'),
+            group_count=Count('groupmembers', filter=Q(groupmembers__pending=False), distinct=True)
         )
 
     @staticmethod
@@ -145,24 +655,21 @@ class UserAnalyticsService:
     def get_user_detail_stats(user):
         """
         Get detailed statistics for a single user.
-        Optimized with aggregations instead of multiple count() calls.
+        Counts and last activity dates come from the user's activity counters row.
         """
-        # Get all counts in one aggregation
+        counters = ActivityCountersService.get_for_user(user).snapshot()
+
         activity_stats = {
-            'workout_count': WorkoutCheckin.objects.filter(user=user).count(),
-            'meal_count': Meal.objects.filter(user=user).count(),
-            'post_count': Post.objects.filter(user=user).count(),
-            'comment_count': Comment.objects.filter(user=user).count(),
+            'workout_count': counters['workout_count'],
+            'meal_count': counters['meal_count'],
+            'post_count': counters['post_count'],
+            'comment_count': counters['comment_count'],
         }
 
-        # Get last activities in one aggregation per model
         last_activities = {
-            'last_workout': WorkoutCheckin.objects.filter(user=user)
-            .aggregate(last=Max('workout_date'))['last'],
-            'last_meal': Meal.objects.filter(user=user)
-            .aggregate(last=Max('meal_time'))['last'],
-            'last_post': Post.objects.filter(user=user)
-            .aggregate(last=Max('created_at'))['last'],
+            'last_workout': counters['last_workout'],
+            'last_meal': counters['last_meal'],
+            'last_post': counters['last_post'],
         }
 
         # Calculate last activity
@@ -315,9 +822,13 @@ class GroupAnalyticsService:
                 'top_performer_score': None,
             }
 
-        # Total activities
-        total_workouts = WorkoutCheckin.objects.filter(user_id__in=member_ids).count()
-        total_meals = Meal.objects.filter(user_id__in=member_ids).count()
+        # Total activities, summed from the members' activity counters
+        totals = UserActivityCounters.objects.filter(user_id__in=member_ids).aggregate(
+            workouts=Sum('workout_count'),
+            meals=Sum('meal_count'),
+        )
+        total_workouts = totals['workouts'] or 0
+        total_meals = totals['meals'] or 0
         workouts_week = WorkoutCheckin.objects.filter(
             user_id__in=member_ids,
             workout_date__gte=week_start
@@ -504,10 +1015,11 @@ class SystemAnalyticsService:
     """Service for system-wide analytics."""
 
     @staticmethod
-    def get_system_stats():
+    def get_system_stats(client=None):
         """
         Get comprehensive system statistics with optimized queries.
         Uses aggregations and conditional counts to minimize database hits.
+        When ``client`` is given every figure is restricted to that client, sharing the same queries.
         """
         time_ranges = DateRangeService.get_time_ranges()
         now = time_ranges['now']
@@ -515,45 +1027,37 @@ class SystemAnalyticsService:
         week_start = time_ranges['week_start']
         month_start = time_ranges['month_start']
 
+        users = for_client(User.objects.filter(is_staff=False, is_superuser=False), client, 'profile__employer')
+        clients = Client.objects.all() if client is None else Client.objects.filter(pk=client.pk)
+
         # User statistics
-        total_users = User.objects.filter(is_staff=False, is_superuser=False).count()
+        total_users = users.count()
 
         # Active users (optimized)
-        active_user_ids = UserAnalyticsService.get_active_user_ids(week_start)
+        active_user_ids = UserAnalyticsService.get_active_user_ids(week_start, client)
         active_users = len(active_user_ids)
         inactive_users = total_users - active_users
 
-        new_users_this_month = User.objects.filter(
-            is_staff=False,
-            is_superuser=False,
-            date_joined__gte=month_start
-        ).count()
-
-        new_users_this_week = User.objects.filter(
-            is_staff=False,
-            is_superuser=False,
-            date_joined__gte=week_start
-        ).count()
-
-        new_users_today = User.objects.filter(
-            is_staff=False,
-            is_superuser=False,
-            date_joined__gte=today_start
-        ).count()
+        new_users_this_month = users.filter(date_joined__gte=month_start).count()
+        new_users_this_week = users.filter(date_joined__gte=week_start).count()
+        new_users_today = users.filter(date_joined__gte=today_start).count()
 
         # Group statistics
-        total_groups = Group.objects.count()
+        if client is None:
+            total_groups = Group.objects.count()
+        else:
+            total_groups = Group.objects.filter(Q(client=client) | Q(clients=client)).distinct().count()
 
         # Client statistics
-        total_clients = Client.objects.count()
-        active_clients = Client.objects.filter(is_active=True).count()
+        total_clients = clients.count()
+        active_clients = clients.filter(is_active=True).count()
         inactive_clients = total_clients - active_clients
-        new_clients_this_month = Client.objects.filter(created_at__gte=month_start).count()
-        new_clients_this_week = Client.objects.filter(created_at__gte=week_start).count()
-        new_clients_today = Client.objects.filter(created_at__gte=today_start).count()
+        new_clients_this_month = clients.filter(created_at__gte=month_start).count()
+        new_clients_this_week = clients.filter(created_at__gte=week_start).count()
+        new_clients_today = clients.filter(created_at__gte=today_start).count()
 
         # Workout statistics - optimized with single aggregate query
-        workout_stats = WorkoutCheckin.objects.aggregate(
+        workout_stats = for_client(WorkoutCheckin.objects.all(), client).aggregate(
             total=Count('id'),
             today=Count(Case(When(workout_date__gte=today_start, then=1), output_field=IntegerField())),
             week=Count(Case(When(workout_date__gte=week_start, then=1), output_field=IntegerField())),
@@ -561,7 +1065,7 @@ class SystemAnalyticsService:
         )
 
         # Meal statistics - optimized with single aggregate query
-        meal_stats = Meal.objects.aggregate(
+        meal_stats = for_client(Meal.objects.all(), client).aggregate(
             total=Count('id'),
             today=Count(Case(When(meal_time__gte=today_start, then=1), output_field=IntegerField())),
             week=Count(Case(When(meal_time__gte=week_start, then=1), output_field=IntegerField())),
@@ -569,14 +1073,14 @@ class SystemAnalyticsService:
         )
 
         # Social feed statistics - optimized with single aggregate query
-        post_stats = Post.objects.aggregate(
+        post_stats = for_client(Post.objects.all(), client).aggregate(
             total=Count('id'),
             today=Count(Case(When(created_at__gte=today_start, then=1), output_field=IntegerField())),
             week=Count(Case(When(created_at__gte=week_start, then=1), output_field=IntegerField())),
             month=Count(Case(When(created_at__gte=month_start, then=1), output_field=IntegerField()))
         )
 
-        comment_stats = Comment.objects.aggregate(
+        comment_stats = for_client(Comment.objects.all(), client).aggregate(
             total=Count('id'),
             today=Count(Case(When(created_at__gte=today_start, then=1), output_field=IntegerField())),
             week=Count(Case(When(created_at__gte=week_start, then=1), output_field=IntegerField())),
@@ -584,14 +1088,14 @@ class SystemAnalyticsService:
         )
 
         # Combine PostLike and CommentLike statistics
-        post_like_stats = PostLike.objects.aggregate(
+        post_like_stats = for_client(PostLike.objects.all(), client, 'user__profile__employer').aggregate(
             total=Count('id'),
             today=Count(Case(When(created_at__gte=today_start, then=1), output_field=IntegerField())),
             week=Count(Case(When(created_at__gte=week_start, then=1), output_field=IntegerField())),
             month=Count(Case(When(created_at__gte=month_start, then=1), output_field=IntegerField()))
         )
 
-        comment_like_stats = CommentLike.objects.aggregate(
+        comment_like_stats = for_client(CommentLike.objects.all(), client, 'user__profile__employer').aggregate(
             total=Count('id'),
             today=Count(Case(When(created_at__gte=today_start, then=1), output_field=IntegerField())),
             week=Count(Case(When(created_at__gte=week_start, then=1), output_field=IntegerField())),
@@ -604,30 +1108,32 @@ class SystemAnalyticsService:
         likes_this_week = (post_like_stats['week'] or 0) + (comment_like_stats['week'] or 0)
         likes_this_month = (post_like_stats['month'] or 0) + (comment_like_stats['month'] or 0)
 
-        pending_reports = Report.objects.filter(status='pending').count()
+        pending_reports = for_client(
+            Report.objects.filter(status='pending'), client, 'reported_by__profile__employer'
+        ).count()
 
         # Gamification statistics
-        profile_stats = Profile.objects.filter(
+        profile_stats = for_client(Profile.objects.filter(
             user__is_staff=False,
             user__is_superuser=False
-        ).aggregate(
+        ), client).aggregate(
             avg_level=Avg('level'),
             avg_score=Avg('score')
         )
 
-        workout_streak_stats = WorkoutStreak.objects.aggregate(
+        workout_streak_stats = for_client(WorkoutStreak.objects.all(), client, 'user__profile__employer').aggregate(
             avg_streak=Avg('current_streak')
         )
 
-        meal_streak_stats = MealStreak.objects.aggregate(
+        meal_streak_stats = for_client(MealStreak.objects.all(), client, 'user__profile__employer').aggregate(
             avg_streak=Avg('current_streak')
         )
 
         # Season statistics
-        active_seasons = Season.objects.filter(
+        active_seasons = for_client(Season.objects.filter(
             start_date__lte=now.date(),
             end_date__gte=now.date()
-        ).count()
+        ), client, 'client').count()
 
         return {
             'total_users': total_users,
@@ -676,16 +1182,16 @@ class ActivityFeedService:
     """Service for activity feed generation."""
 
     @staticmethod
-    def get_recent_activities(limit=20, activity_type=None):
+    def get_recent_activities(limit=20, activity_type=None, client=None):
         """
-        Get recent activities across the system.
+        Get recent activities across the system, optionally restricted to a client.
         Optimized with select_related to avoid N+1 queries.
         """
         activities = []
 
         # Workout activities
         if not activity_type or activity_type == 'workout':
-            workouts = WorkoutCheckin.objects.select_related('user').order_by('-workout_date')[:limit]
+            workouts = for_client(WorkoutCheckin.objects.all(), client).select_related('user').order_by('-workout_date')[:limit]
 
             for workout in workouts:
                 duration_minutes = int(workout.duration.total_seconds() / 60)
@@ -706,7 +1212,7 @@ class ActivityFeedService:
 
         # Meal activities
         if not activity_type or activity_type == 'meal':
-            meals = Meal.objects.select_related('user', 'meal_type').order_by('-meal_time')[:limit]
+            meals = for_client(Meal.objects.all(), client).select_related('user', 'meal_type').order_by('-meal_time')[:limit]
 
             for meal in meals:
                 activities.append({
@@ -725,10 +1231,10 @@ class ActivityFeedService:
 
         # New user activities
         if not activity_type or activity_type == 'user_joined':
-            new_users = User.objects.filter(
+            new_users = for_client(User.objects.filter(
                 is_staff=False,
                 is_superuser=False
-            ).order_by('-date_joined')[:limit]
+            ), client, 'profile__employer').order_by('-date_joined')[:limit]
 
             for user in new_users:
                 activities.append({
@@ -747,7 +1253,12 @@ class ActivityFeedService:
 
         # New group activities
         if not activity_type or activity_type == 'group_created':
-            new_groups = Group.objects.select_related('created_by').order_by('-created_at')[:limit]
+            new_groups = Group.objects.all()
+
+            if client is not None:
+                new_groups = new_groups.filter(Q(client=client) | Q(clients=client)).distinct()
+
+            new_groups = new_groups.select_related('created_by').order_by('-created_at')[:limit]
 
             for group in new_groups:
                 activities.append({
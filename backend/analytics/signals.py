@@ -0,0 +1,101 @@
+from django.db.models import Max
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.utils import local_date, local_day_range
+from nutrition.models import Meal
+from social_feed.models import Post, Comment
+from workouts.models import WorkoutCheckin
+from .models import UserActivityCounters, UserActivityBitmap
+
+# Model -> (counter kind, timestamp field)
+TRACKED_ACTIVITIES = {
+    WorkoutCheckin: ('workout', 'workout_date'),
+    Meal: ('meal', 'meal_time'),
+    Post: ('post', 'created_at'),
+    Comment: ('comment', 'created_at'),
+}
+
+# Activities that mark a day as active in the user's activity bitmap
+BITMAP_ACTIVITIES = {
+    WorkoutCheckin: 'workout_date',
+    Meal: 'meal_time',
+    Post: 'created_at',
+}
+
+
+def _latest_lookup(model, user_id, timestamp_field):
+    def lookup():
+        return model.objects.filter(user_id=user_id).aggregate(last=Max(timestamp_field))['last']
+
+    return lookup
+
+
+# ---------------------------------- Activity Counters Signals ---------------------------------- #
+@receiver(post_save, sender=WorkoutCheckin)
+@receiver(post_save, sender=Meal)
+@receiver(post_save, sender=Post)
+@receiver(post_save, sender=Comment)
+def increment_activity_counters(sender, instance, created, **kwargs):
+    """
+    Increment the user's activity counters when a new workout, meal, post or comment is created.
+    """
+    if not created:
+        return
+
+    kind, timestamp_field = TRACKED_ACTIVITIES[sender]
+    UserActivityCounters.record(instance.user_id, kind, getattr(instance, timestamp_field))
+
+
+@receiver(post_delete, sender=WorkoutCheckin)
+@receiver(post_delete, sender=Meal)
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=Comment)
+def decrement_activity_counters(sender, instance, **kwargs):
+    """
+    Decrement the user's activity counters when a workout, meal, post or comment is deleted.
+    """
+    kind, timestamp_field = TRACKED_ACTIVITIES[sender]
+    UserActivityCounters.discard(
+        instance.user_id,
+        kind,
+        getattr(instance, timestamp_field),
+        _latest_lookup(sender, instance.user_id, timestamp_field),
+    )
+
+
+# ---------------------------------- Activity Bitmap Signals ---------------------------------- #
+def _has_activity_on(user_id, day):
+    start, end = local_day_range(day)
+
+    return any(
+        model.objects.filter(user_id=user_id, **{f'{field}__gte': start, f'{field}__lt': end}).exists()
+        for model, field in BITMAP_ACTIVITIES.items()
+    )
+
+
+@receiver(post_save, sender=WorkoutCheckin)
+@receiver(post_save, sender=Meal)
+@receiver(post_save, sender=Post)
+def mark_activity_day(sender, instance, created, **kwargs):
+    """
+    Flag the activity day in the user's bitmap when a workout, meal or post is created.
+    """
+    if not created:
+        return
+
+    day = local_date(getattr(instance, BITMAP_ACTIVITIES[sender]))
+    UserActivityBitmap.mark(instance.user_id, day)
+
+
+@receiver(post_delete, sender=WorkoutCheckin)
+@receiver(post_delete, sender=Meal)
+@receiver(post_delete, sender=Post)
+def unmark_activity_day(sender, instance, **kwargs):
+    """
+    Clear the activity day in the user's bitmap when its last workout, meal or post is deleted.
+    """
+    day = local_date(getattr(instance, BITMAP_ACTIVITIES[sender]))
+
+    if not _has_activity_on(instance.user_id, day):
+        UserActivityBitmap.unmark(instance.user_id, day)
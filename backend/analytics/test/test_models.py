@@ -0,0 +1,203 @@
+"""
+Tests for analytics models
+"""
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from analytics.models import UserActivityCounters, UserActivityBitmap, ACTIVITY_BITMAP_EPOCH, week_start_for
+from analytics.services import ActivityCountersService, UserAnalyticsService
+from clients.models import Client
+from nutrition.models import Meal, MealConfig
+from profiles.models import Profile
+from social_feed.models import Post, Comment
+from workouts.models import WorkoutCheckin
+
+
+class UserActivityCountersTest(TestCase):
+    """Test UserActivityCounters maintenance and reconciliation"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='counteruser', email='counter@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Counter Company',
+            cnpj='11222333000144',
+            contact_email='counter@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        self.meal_config = MealConfig.objects.create(
+            meal_name='breakfast',
+            interval_start=timezone.now().time().replace(hour=6, minute=0),
+            interval_end=timezone.now().time().replace(hour=10, minute=0),
+        )
+
+    def _counters(self):
+        return UserActivityCounters.objects.get(user=self.user)
+
+    def test_week_start_is_sunday(self):
+        """Weeks start on Sunday"""
+        today = timezone.localdate()
+        week_start = week_start_for(today)
+
+        self.assertEqual(week_start.weekday(), 6)
+        self.assertLessEqual(week_start, today)
+        self.assertLess(today - week_start, timedelta(days=7))
+
+    def test_workout_creation_increments_counters(self):
+        """Creating a workout updates totals, last date and current periods"""
+        workout_date = timezone.now() - timedelta(minutes=5)
+        WorkoutCheckin.objects.create(user=self.user, workout_date=workout_date, duration=timedelta(minutes=30))
+
+        counters = self._counters()
+        self.assertEqual(counters.workout_count, 1)
+        self.assertEqual(counters.last_workout_at, workout_date)
+        self.assertEqual(counters.workouts_this_week, 1)
+        self.assertEqual(counters.workouts_this_month, 1)
+        # A post is created for the workout by the social feed signals
+        self.assertEqual(counters.post_count, 1)
+
+    def test_old_activity_does_not_count_in_current_periods(self):
+        """Activities outside the current week/month only count in the totals"""
+        WorkoutCheckin.objects.create(
+            user=self.user,
+            workout_date=timezone.now() - timedelta(days=70),
+            duration=timedelta(minutes=30)
+        )
+
+        counters = self._counters()
+        self.assertEqual(counters.workout_count, 1)
+        self.assertEqual(counters.workouts_this_week, 0)
+        self.assertEqual(counters.workouts_this_month, 0)
+
+    def test_deleting_latest_activity_recomputes_last_date(self):
+        """Deleting the latest meal decrements counters and falls back to the previous meal date"""
+        older = Meal.objects.create(
+            user=self.user,
+            meal_type=self.meal_config,
+            meal_time=timezone.now() - timedelta(days=2),
+        )
+        newer = Meal.objects.create(
+            user=self.user,
+            meal_type=self.meal_config,
+            meal_time=timezone.now() - timedelta(minutes=1),
+        )
+
+        newer.delete()
+
+        counters = self._counters()
+        self.assertEqual(counters.meal_count, 1)
+        self.assertEqual(counters.last_meal_at, older.meal_time)
+
+    def test_comment_counters(self):
+        """Comments are counted for their author"""
+        post = Post.objects.create(user=self.user, content_type='social', content_text='Hello')
+        comment = Comment.objects.create(post=post, user=self.user, text='First!')
+
+        self.assertEqual(self._counters().comment_count, 1)
+
+        comment.delete()
+
+        counters = self._counters()
+        self.assertEqual(counters.comment_count, 0)
+        self.assertIsNone(counters.last_comment_at)
+
+    def test_snapshot_zeroes_stale_periods(self):
+        """Period counters from a past week/month are reported as zero"""
+        WorkoutCheckin.objects.create(user=self.user, workout_date=timezone.now(), duration=timedelta(minutes=30))
+        counters = self._counters()
+
+        snapshot = counters.snapshot(today=timezone.localdate() + timedelta(days=40))
+
+        self.assertEqual(snapshot['workout_count'], 1)
+        self.assertEqual(snapshot['workouts_this_week'], 0)
+        self.assertEqual(snapshot['workouts_this_month'], 0)
+
+    def test_reconcile_fixes_drift(self):
+        """Reconciliation rebuilds drifted rows from the raw tables"""
+        WorkoutCheckin.objects.create(user=self.user, workout_date=timezone.now(), duration=timedelta(minutes=30))
+        UserActivityCounters.objects.filter(user=self.user).update(workout_count=42, posts_this_week=0)
+
+        fixed = ActivityCountersService.reconcile([self.user.id])
+
+        self.assertEqual(fixed, 1)
+        counters = self._counters()
+        self.assertEqual(counters.workout_count, 1)
+        self.assertEqual(counters.posts_this_week, 1)
+        self.assertEqual(ActivityCountersService.reconcile([self.user.id]), 0)
+
+    def test_reconcile_command_creates_missing_rows(self):
+        """The management command creates counters for users without a row"""
+        call_command('reconcile_activity_counters', stdout=StringIO())
+
+        self.assertTrue(UserActivityCounters.objects.filter(user=self.user).exists())
+
+    def test_user_detail_stats_reads_counters(self):
+        """get_user_detail_stats answers counts without scanning the activity tables"""
+        WorkoutCheckin.objects.create(user=self.user, workout_date=timezone.now(), duration=timedelta(minutes=30))
+        user = User.objects.select_related('profile', 'activity_counters').get(id=self.user.id)
+
+        with self.assertNumQueries(4):  # streaks (2), memberships, employer
+            stats = UserAnalyticsService.get_user_detail_stats(user)
+
+        self.assertEqual(stats['workout_count'], 1)
+        self.assertEqual(stats['post_count'], 1)
+        self.assertTrue(stats['is_active'])
+
+
+class UserActivityBitmapTest(TestCase):
+    """Test UserActivityBitmap maintenance"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='bitmapuser', email='bitmap@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Bitmap Company',
+            cnpj='11222333000155',
+            contact_email='bitmap@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+
+    def test_mark_and_unmark(self):
+        """Days are flagged at their offset from the epoch"""
+        day = ACTIVITY_BITMAP_EPOCH + timedelta(days=100)
+        bitmap = UserActivityBitmap.mark(self.user.id, day)
+
+        self.assertEqual(bitmap.as_int(), 1 << 100)
+        self.assertTrue(bitmap.is_active_on(day))
+        self.assertFalse(bitmap.is_active_on(day + timedelta(days=1)))
+
+        bitmap = UserActivityBitmap.unmark(self.user.id, day)
+
+        self.assertEqual(bitmap.active_days(), 0)
+
+    def test_days_before_epoch_are_ignored(self):
+        """Activity before the epoch is not tracked"""
+        self.assertIsNone(UserActivityBitmap.mark(self.user.id, ACTIVITY_BITMAP_EPOCH - timedelta(days=1)))
+        self.assertFalse(UserActivityBitmap.objects.filter(user=self.user).exists())
+
+    def test_signals_keep_day_while_activity_remains(self):
+        """Deleting one of two activities of a day keeps the day flagged"""
+        workout_date = timezone.now() - timedelta(days=2)
+        day = timezone.localdate(workout_date)
+        first = WorkoutCheckin.objects.create(user=self.user, workout_date=workout_date, duration=timedelta(minutes=30))
+        WorkoutCheckin.objects.create(
+            user=self.user,
+            workout_date=workout_date + timedelta(minutes=1),
+            duration=timedelta(minutes=30)
+        )
+
+        first.delete()
+        self.assertTrue(UserActivityBitmap.objects.get(user=self.user).is_active_on(day))
+
+        # Deleting the remaining workout also removes its post, leaving the day empty
+        WorkoutCheckin.objects.filter(user=self.user).first().delete()
+        self.assertFalse(UserActivityBitmap.objects.get(user=self.user).is_active_on(day))
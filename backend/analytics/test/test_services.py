@@ -12,8 +12,13 @@ from analytics.services import (
     UserAnalyticsService,
     GroupAnalyticsService,
     SystemAnalyticsService,
-    ActivityFeedService
+    ActivityFeedService,
+    ActivityBitmapService,
+    RetentionAnalyticsService,
+    TimeSeriesService
 )
+from analytics.models import UserActivityBitmap
+from core.utils import local_day_range
 from clients.models import Client
 from gamification.models import Season
 from profiles.models import Profile
@@ -445,3 +450,174 @@ class ActivityFeedServiceTest(TestCase):
         self.assertLessEqual(len(activities), 5)
 
 
+class RetentionAnalyticsServiceTest(TestCase):
+    """Test RetentionAnalyticsService"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.today = timezone.localdate()
+        self.alice = User.objects.create_user(username='alice', email='alice@example.com', password='testpass123')
+        self.bob = User.objects.create_user(username='bob', email='bob@example.com', password='testpass123')
+
+    def _join(self, user, day):
+        User.objects.filter(id=user.id).update(date_joined=local_day_range(day)[0])
+
+    def test_smear(self):
+        """Test smear flags the trailing window of every set bit"""
+        self.assertEqual(RetentionAnalyticsService.smear(0b1, 3), 0b111)
+        self.assertEqual(RetentionAnalyticsService.smear(0b1001, 2), 0b11011)
+        self.assertEqual(RetentionAnalyticsService.smear(0b101, 1), 0b101)
+
+    def test_column_counts(self):
+        """Test column_counts matches a naive per-bit count"""
+        values = [0b1011, 0b0110, 0b1111, 0, 0b1000]
+        expected = [sum(value >> bit & 1 for value in values) for bit in range(5)]
+
+        self.assertEqual(RetentionAnalyticsService.column_counts(values, 5), expected)
+        self.assertEqual(RetentionAnalyticsService.column_counts([], 3), [0, 0, 0])
+
+    def test_get_engagement(self):
+        """Test DAU/WAU/MAU counts and stickiness"""
+        day = self.today - timedelta(days=40)
+        UserActivityBitmap.mark(self.alice.id, day)
+        UserActivityBitmap.mark(self.alice.id, day + timedelta(days=10))
+        UserActivityBitmap.mark(self.bob.id, day + timedelta(days=10))
+
+        data = RetentionAnalyticsService.get_engagement(day, day + timedelta(days=10))
+        first, last = data['series'][0], data['series'][-1]
+
+        self.assertEqual(len(data['series']), 11)
+        self.assertEqual((first['dau'], first['wau'], first['mau']), (1, 1, 1))
+        self.assertEqual((last['dau'], last['wau'], last['mau']), (2, 2, 2))
+        # Seven days after alice's first activity she is still in MAU but no longer in WAU
+        seventh = data['series'][7]
+        self.assertEqual((seventh['dau'], seventh['wau'], seventh['mau']), (0, 0, 1))
+        self.assertEqual(last['stickiness'], 1.0)
+
+    def test_get_cohort_retention(self):
+        """Test users are grouped by signup month and retained by month"""
+        cohort_month = (self.today.replace(day=1) - timedelta(days=70)).replace(day=1)
+        second_month = (cohort_month + timedelta(days=32)).replace(day=1)
+        self._join(self.alice, cohort_month + timedelta(days=2))
+        self._join(self.bob, cohort_month + timedelta(days=5))
+        UserActivityBitmap.mark(self.alice.id, cohort_month + timedelta(days=3))
+        UserActivityBitmap.mark(self.alice.id, second_month + timedelta(days=1))
+
+        data = RetentionAnalyticsService.get_cohort_retention(cohort_month, cohort_month, 'month', 2)
+        cohort = data['cohorts'][0]
+
+        self.assertEqual(len(data['cohorts']), 1)
+        self.assertEqual(cohort['cohort_start'], cohort_month)
+        self.assertEqual(cohort['size'], 2)
+        self.assertEqual([point['active_users'] for point in cohort['retention']], [1, 1, 0])
+        self.assertEqual(cohort['retention'][1]['rate'], 0.5)
+
+    def test_rebuild_bitmaps(self):
+        """Test rebuild reproduces the signal-maintained bitmaps and drops empty ones"""
+        profile_owner = User.objects.create_user(username='owner', email='owner@example.com', password='testpass123')
+        employer = Client.objects.create(
+            name='Bitmap Company',
+            cnpj='98765432000110',
+            contact_email='bitmap@example.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=profile_owner
+        )
+        Profile.objects.create(user=self.alice, employer=employer)
+        WorkoutCheckin.objects.create(
+            user=self.alice,
+            workout_date=timezone.now() - timedelta(days=3),
+            duration=timedelta(minutes=30)
+        )
+        UserActivityBitmap.mark(self.bob.id, self.today)
+        expected = UserActivityBitmap.objects.get(user=self.alice).as_int()
+        UserActivityBitmap.objects.filter(user=self.alice).update(bits=b'')
+
+        written = ActivityBitmapService.rebuild([self.alice.id, self.bob.id])
+
+        self.assertEqual(written, 1)
+        self.assertEqual(UserActivityBitmap.objects.get(user=self.alice).as_int(), expected)
+        self.assertFalse(UserActivityBitmap.objects.filter(user=self.bob).exists())
+
+
+class TimeSeriesServiceTest(TestCase):
+    """Test TimeSeriesService"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.owner = User.objects.create_user(username='owner', email='owner@example.com', password='testpass123')
+        self.client = Client.objects.create(
+            name='Series Company',
+            cnpj='12345678000191',
+            contact_email='series@example.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.other_client = Client.objects.create(
+            name='Other Company',
+            cnpj='12345678000192',
+            contact_email='other@example.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.user = User.objects.create_user(username='series', email='series@example.com', password='testpass123')
+        self.other = User.objects.create_user(username='other', email='other@example.com', password='testpass123')
+        Profile.objects.create(user=self.user, employer=self.client)
+        Profile.objects.create(user=self.other, employer=self.other_client)
+
+        # A Saturday and the following Sunday, far enough in the past to belong to closed weeks
+        today = timezone.localdate()
+        self.saturday = today - timedelta(days=(today.weekday() - 5) % 7 + 14)
+        self.sunday = self.saturday + timedelta(days=1)
+
+    def _workout(self, user, day, hour=12):
+        return WorkoutCheckin.objects.create(
+            user=user,
+            workout_date=local_day_range(day)[0] + timedelta(hours=hour),
+            duration=timedelta(minutes=30)
+        )
+
+    def test_daily_buckets_use_local_days(self):
+        """Test late-evening activity counts on its local day"""
+        self._workout(self.user, self.saturday, hour=23)
+        data = TimeSeriesService.get_timeseries(self.saturday, self.sunday, 'day')
+
+        self.assertEqual([item['bucket'] for item in data['series']], [self.saturday, self.sunday])
+        self.assertEqual(data['series'][0]['workouts'], 1)
+        self.assertEqual(data['series'][1]['workouts'], 0)
+        self.assertGreater(data['series'][0]['xp'], 0)
+
+    def test_weekly_buckets_start_on_sunday(self):
+        """Test a Saturday and the next Sunday fall into different weeks"""
+        self._workout(self.user, self.saturday)
+        self._workout(self.user, self.sunday)
+        data = TimeSeriesService.get_timeseries(self.saturday, self.sunday, 'week')
+
+        self.assertEqual(
+            [(item['bucket'], item['workouts']) for item in data['series']],
+            [(self.saturday - timedelta(days=6), 1), (self.sunday, 1)]
+        )
+
+    def test_monthly_buckets_and_client_filter(self):
+        """Test monthly buckets only count users of the requested client"""
+        self._workout(self.user, self.saturday)
+        self._workout(self.other, self.saturday)
+        data = TimeSeriesService.get_timeseries(self.saturday, self.saturday, 'month', client=self.client)
+
+        self.assertEqual(len(data['series']), 1)
+        self.assertEqual(data['series'][0]['bucket'], self.saturday.replace(day=1))
+        self.assertEqual(data['series'][0]['workouts'], 1)
+
+    def test_group_filter(self):
+        """Test the group filter only counts accepted members"""
+        group = Group.objects.create(name='Series Group', created_by=self.owner, owner=self.owner)
+        GroupMembers.objects.create(member=self.user, group=group, pending=False)
+        GroupMembers.objects.create(member=self.other, group=group, pending=True)
+        self._workout(self.user, self.saturday)
+        self._workout(self.other, self.saturday)
+
+        data = TimeSeriesService.get_timeseries(self.saturday, self.saturday, 'day', group=group)
+
+        self.assertEqual(data['series'][0]['workouts'], 1)
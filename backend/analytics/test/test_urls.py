@@ -10,7 +10,10 @@ from analytics.views import (
     GroupListAPIView,
     RecentActivitiesAPIView,
     UserDetailAPIView,
-    GroupDetailAPIView
+    GroupDetailAPIView,
+    EngagementAPIView,
+    CohortRetentionAPIView,
+    TimeSeriesAPIView
 )
 
 
@@ -53,3 +56,20 @@ class AnalyticsURLsTest(TestCase):
         self.assertEqual(url, '/api/v1/analytics/admin/system/activities/')
         self.assertEqual(resolve(url).func.view_class, RecentActivitiesAPIView)
 
+    def test_engagement_url(self):
+        """Test engagement URL resolves correctly"""
+        url = reverse('admin-system-engagement')
+        self.assertEqual(url, '/api/v1/analytics/admin/system/engagement/')
+        self.assertEqual(resolve(url).func.view_class, EngagementAPIView)
+
+    def test_retention_url(self):
+        """Test retention URL resolves correctly"""
+        url = reverse('admin-system-retention')
+        self.assertEqual(url, '/api/v1/analytics/admin/system/retention/')
+        self.assertEqual(resolve(url).func.view_class, CohortRetentionAPIView)
+
+    def test_timeseries_url(self):
+        """Test timeseries URL resolves correctly"""
+        url = reverse('admin-system-timeseries')
+        self.assertEqual(url, '/api/v1/analytics/admin/system/timeseries/')
+        self.assertEqual(resolve(url).func.view_class, TimeSeriesAPIView)
@@ -10,6 +10,7 @@ from faker import Faker
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from analytics.models import UserActivityBitmap
 from clients.models import Client
 from gamification.models import Season
 from profiles.models import Profile
@@ -526,3 +527,194 @@ class GroupDetailAPIViewTest(TestCase):
         self.assertIn('top_members', response.data)
         self.assertIsInstance(response.data['top_members'], list)
 
+
+class EngagementAndRetentionAPIViewTest(TestCase):
+    """Test EngagementAPIView and CohortRetentionAPIView"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        UserActivityBitmap.mark(self.user.id, timezone.localdate())
+
+    def test_non_admin_access_denied(self):
+        """Test non-admin users cannot access engagement and retention"""
+        self.client.force_authenticate(user=self.user)
+
+        for name in ('admin-system-engagement', 'admin-system-retention'):
+            response = self.client.get(reverse(name))
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_engagement_defaults_to_last_30_days(self):
+        """Test engagement returns one point per day of the default range"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('admin-system-engagement'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['series']), 30)
+        self.assertEqual(response.data['series'][-1]['dau'], 1)
+
+    def test_engagement_invalid_range(self):
+        """Test engagement rejects malformed and reversed ranges"""
+        self.client.force_authenticate(user=self.admin)
+        url = reverse('admin-system-engagement')
+
+        self.assertEqual(self.client.get(url, {'start': '2025-13-01'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.client.get(url, {'start': '2025-02-01', 'end': '2025-01-01'}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_retention_current_cohort(self):
+        """Test the signup cohort of the current month is reported"""
+        self.client.force_authenticate(user=self.admin)
+        today = timezone.localdate()
+        response = self.client.get(reverse('admin-system-retention'), {'start': today.isoformat()})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['period'], 'month')
+        cohort = response.data['cohorts'][0]
+        self.assertEqual(cohort['size'], User.objects.filter(date_joined__date__gte=today.replace(day=1)).count())
+        self.assertEqual(cohort['retention'][0]['active_users'], 1)
+
+    def test_retention_invalid_period(self):
+        """Test retention rejects unknown periods"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('admin-system-retention'), {'period': 'year'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TimeSeriesAPIViewTest(TestCase):
+    """Test TimeSeriesAPIView"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.url = reverse('admin-system-timeseries')
+
+    def test_non_admin_access_denied(self):
+        """Test non-admin users cannot access the time series"""
+        user = User.objects.create_user(username='testuser', email='test@example.com', password='testpass123')
+        self.client.force_authenticate(user=user)
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_default_daily_series(self):
+        """Test the default series covers the last 30 days and counts today's signups"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['interval'], 'day')
+        self.assertEqual(len(response.data['series']), 30)
+        self.assertGreaterEqual(response.data['series'][-1]['new_users'], 1)
+
+    def test_invalid_parameters(self):
+        """Test invalid intervals, dates and filters are rejected"""
+        self.client.force_authenticate(user=self.admin)
+
+        self.assertEqual(self.client.get(self.url, {'interval': 'year'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'end': '01/02/2025'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'client': 99999}).status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ClientAnalyticsAPIViewTest(TestCase):
+    """Test the client-scoped analytics endpoints"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.client = APIClient()
+        self.admin = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.owner = User.objects.create_user(username='owner', email='owner@example.com', password='testpass123')
+        self.other_owner = User.objects.create_user(username='other', email='other@example.com', password='testpass123')
+        self.employer = Client.objects.create(
+            name='Owner Company',
+            cnpj='12345678000193',
+            contact_email='owner@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.other_employer = Client.objects.create(
+            name='Other Company',
+            cnpj='12345678000194',
+            contact_email='other@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.other_owner
+        )
+        self.employee = User.objects.create_user(username='employee', email='employee@example.com', password='testpass123')
+        self.outsider = User.objects.create_user(username='outsider', email='outsider@example.com', password='testpass123')
+        Profile.objects.create(user=self.employee, employer=self.employer)
+        Profile.objects.create(user=self.outsider, employer=self.other_employer)
+
+        for user in (self.employee, self.outsider):
+            WorkoutCheckin.objects.create(
+                user=user,
+                workout_date=timezone.now() - timedelta(hours=1),
+                duration=timedelta(minutes=30)
+            )
+
+    def test_owner_sees_only_own_client_stats(self):
+        """Test stats only count the client's employees and activities"""
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(reverse('client-analytics-stats', kwargs={'client_id': self.employer.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_users'], 1)
+        self.assertEqual(response.data['total_workouts'], 1)
+        self.assertEqual(response.data['total_posts'], 1)
+        self.assertEqual(response.data['total_clients'], 1)
+
+    def test_other_owner_access_denied(self):
+        """Test owners of another client cannot access the endpoints"""
+        self.client.force_authenticate(user=self.other_owner)
+
+        for name in ('client-analytics-stats', 'client-analytics-users', 'client-analytics-activities'):
+            response = self.client.get(reverse(name, kwargs={'client_id': self.employer.id}))
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_admin_unknown_client_not_found(self):
+        """Test administrators get 404 for unknown clients"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('client-analytics-stats', kwargs={'client_id': 99999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_user_list_scoped_to_client(self):
+        """Test the user list only contains the client's employees"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(reverse('client-analytics-users', kwargs={'client_id': self.employer.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([user['username'] for user in response.data['results']], ['employee'])
+
+    def test_activities_scoped_to_client(self):
+        """Test the activity feed only contains the client's employees"""
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(
+            reverse('client-analytics-activities', kwargs={'client_id': self.employer.id}),
+            {'type': 'workout'}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({activity['user_id'] for activity in response.data}, {self.employee.id})
@@ -6,7 +6,13 @@ from analytics.views import (
     GroupListAPIView,
     RecentActivitiesAPIView,
     UserDetailAPIView,
-    GroupDetailAPIView
+    GroupDetailAPIView,
+    EngagementAPIView,
+    CohortRetentionAPIView,
+    TimeSeriesAPIView,
+    ClientStatsAPIView,
+    ClientUserListAPIView,
+    ClientRecentActivitiesAPIView
 )
 
 urlpatterns = [
@@ -23,4 +29,16 @@ urlpatterns = [
 
     # Activities
     path('admin/system/activities/', RecentActivitiesAPIView.as_view(), name='admin-system-activities'),
+
+    # Engagement and retention
+    path('admin/system/engagement/', EngagementAPIView.as_view(), name='admin-system-engagement'),
+    path('admin/system/retention/', CohortRetentionAPIView.as_view(), name='admin-system-retention'),
+
+    # Trends
+    path('admin/system/timeseries/', TimeSeriesAPIView.as_view(), name='admin-system-timeseries'),
+
+    # Client-scoped analytics
+    path('clients/<int:client_id>/stats/', ClientStatsAPIView.as_view(), name='client-analytics-stats'),
+    path('clients/<int:client_id>/users/', ClientUserListAPIView.as_view(), name='client-analytics-users'),
+    path('clients/<int:client_id>/activities/', ClientRecentActivitiesAPIView.as_view(), name='client-analytics-activities'),
 ]
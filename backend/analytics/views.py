@@ -1,6 +1,10 @@
+from datetime import datetime, timedelta
+
 from django.contrib.auth.models import User
 from django.db.models import Q
-from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from rest_framework import status
 from rest_framework.generics import ListAPIView
 from rest_framework.pagination import PageNumberPagination
@@ -9,26 +13,46 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from analytics.pagination import StandardResultsSetPagination
+from analytics.permissions import IsClientOwnerOrAdmin
 from analytics.serializer import (
     SystemStatsSerializer,
     UserStatsSerializer,
     GroupStatsSerializer,
     ActivitySerializer,
     UserDetailSerializer,
-    GroupDetailSerializer
+    GroupDetailSerializer,
+    EngagementSerializer,
+    CohortRetentionSerializer,
+    TimeSeriesSerializer
 )
 from analytics.services import (
     DateRangeService,
     UserAnalyticsService,
     GroupAnalyticsService,
     SystemAnalyticsService,
-    ActivityFeedService
+    ActivityFeedService,
+    RetentionAnalyticsService,
+    TimeSeriesService
 )
+from clients.models import Client
+from core.replica import ReplicaReadMixin
 from groups.models import Group
 
 
+def parse_date_param(request, name, default):
+    """
+    Read an optional YYYY-MM-DD query parameter. Raises ValueError for malformed values.
+    """
+    value = request.query_params.get(name)
+
+    if not value:
+        return default
+
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
 @extend_schema(tags=['Admin Analytics'])
-class SystemStatsAPIView(APIView):
+class SystemStatsAPIView(ReplicaReadMixin, APIView):
     """
     GET endpoint for overall system statistics.
     Returns aggregated data about users, workouts, meals, social feed, and moderation.
@@ -48,16 +72,8 @@ class SystemStatsAPIView(APIView):
 
 
 @extend_schema(tags=['Admin Analytics'])
-class UserListAPIView(ListAPIView):
-    """
-    GET endpoint for listing all users with their statistics.
-    Supports pagination, ordering, filtering, and search.
-    """
-    permission_classes = [IsAdminUser]
-    serializer_class = UserStatsSerializer
-    pagination_class = StandardResultsSetPagination
-
-    @extend_schema(
+@extend_schema_view(
+    get=extend_schema(
         summary="List all users with statistics",
         description="Returns paginated list of users with their activity counts, streaks, and engagement metrics.",
         parameters=[
@@ -66,12 +82,27 @@ class UserListAPIView(ListAPIView):
             OpenApiParameter(name='search', description='Search by username, name, or email', type=str),
         ]
     )
+)
+class UserListAPIView(ReplicaReadMixin, ListAPIView):
+    """
+    GET endpoint for listing all users with their statistics.
+    Supports pagination, ordering, filtering, and search.
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = UserStatsSerializer
+    pagination_class = StandardResultsSetPagination
+
+    def get_client(self):
+        """Client the listing is restricted to; None for the system-wide listing."""
+        return None
+
     def get_queryset(self):
         time_ranges = DateRangeService.get_time_ranges()
         week_ago = time_ranges['week_start']
+        client = self.get_client()
 
         # Use optimized queryset from service
-        queryset = UserAnalyticsService.get_user_queryset_with_stats()
+        queryset = UserAnalyticsService.get_user_queryset_with_stats(client)
 
         # Apply search filter
         search = self.request.query_params.get('search', None)
@@ -88,7 +119,7 @@ class UserListAPIView(ListAPIView):
 
         if is_active_param is not None:
             is_active = is_active_param.lower() == 'true'
-            active_ids = UserAnalyticsService.get_active_user_ids(week_ago)
+            active_ids = UserAnalyticsService.get_active_user_ids(week_ago, client)
 
             if is_active:
                 queryset = queryset.filter(id__in=active_ids)
@@ -142,7 +173,7 @@ class UserListAPIView(ListAPIView):
 
 
 @extend_schema(tags=['Admin Analytics'])
-class GroupListAPIView(ListAPIView):
+class GroupListAPIView(ReplicaReadMixin, ListAPIView):
     """
     GET endpoint for listing all groups with their statistics.
     """
@@ -202,13 +233,17 @@ class GroupListAPIView(ListAPIView):
 
 
 @extend_schema(tags=['Admin Analytics'])
-class RecentActivitiesAPIView(APIView):
+class RecentActivitiesAPIView(ReplicaReadMixin, APIView):
     """
     GET endpoint for recent system activities.
     Returns a combined feed of workouts, meals, new users, and new groups.
     """
     permission_classes = [IsAdminUser]
 
+    def get_client(self):
+        """Client the feed is restricted to; None for the system-wide feed."""
+        return None
+
     @extend_schema(
         summary="Get recent system activities",
         description="Returns recent activities across the system including workouts, meals, new users, and new groups.",
@@ -217,7 +252,7 @@ class RecentActivitiesAPIView(APIView):
             OpenApiParameter(name='type', description='Filter by activity type (workout, meal, user_joined, group_created)', type=str),
         ]
     )
-    def get(self, request):
+    def get(self, request, *args, **kwargs):
         limit_param = request.query_params.get('limit', 20)
 
         try:
@@ -229,14 +264,14 @@ class RecentActivitiesAPIView(APIView):
             )
 
         activity_type = request.query_params.get('type', None)
-        activities = ActivityFeedService.get_recent_activities(limit, activity_type)
+        activities = ActivityFeedService.get_recent_activities(limit, activity_type, self.get_client())
         serializer = ActivitySerializer(activities, many=True)
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @extend_schema(tags=['Admin Analytics'])
-class UserDetailAPIView(APIView):
+class UserDetailAPIView(ReplicaReadMixin, APIView):
     """
     GET endpoint for detailed information about a specific user.
     """
@@ -248,7 +283,7 @@ class UserDetailAPIView(APIView):
     )
     def get(self, request, user_id):
         try:
-            user = User.objects.select_related('profile').get(id=user_id)
+            user = User.objects.select_related('profile', 'activity_counters').get(id=user_id)
         except User.DoesNotExist:
             return Response(
                 {'detail': 'User not found.'},
@@ -262,7 +297,7 @@ class UserDetailAPIView(APIView):
 
 
 @extend_schema(tags=['Admin Analytics'])
-class GroupDetailAPIView(APIView):
+class GroupDetailAPIView(ReplicaReadMixin, APIView):
     """
     GET endpoint for detailed information about a specific group.
     """
@@ -286,3 +321,222 @@ class GroupDetailAPIView(APIView):
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+
+
+@extend_schema(tags=['Admin Analytics'])
+class EngagementAPIView(ReplicaReadMixin, APIView):
+    """
+    GET endpoint for daily, weekly and monthly active users and stickiness (DAU/MAU).
+    """
+    permission_classes = [IsAdminUser]
+    max_days = 731
+
+    @extend_schema(
+        summary="Get DAU/WAU/MAU and stickiness",
+        description="Returns, for each day of the range, the users active that day, in the trailing 7 days and in the trailing 30 days. Defaults to the last 30 days.",
+        parameters=[
+            OpenApiParameter(name='start', description='First day of the range (YYYY-MM-DD)', type=str),
+            OpenApiParameter(name='end', description='Last day of the range (YYYY-MM-DD)', type=str),
+        ],
+        responses={200: EngagementSerializer}
+    )
+    def get(self, request):
+        today = timezone.localdate()
+
+        try:
+            end = parse_date_param(request, 'end', today)
+            start = parse_date_param(request, 'start', end - timedelta(days=29))
+        except ValueError:
+            return Response(
+                {'detail': 'Invalid date. Use the YYYY-MM-DD format.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if start > end:
+            return Response(
+                {'detail': 'The start date must be before the end date.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if (end - start).days >= self.max_days:
+            return Response(
+                {'detail': f'The range cannot be longer than {self.max_days} days.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = RetentionAnalyticsService.get_engagement(start, end)
+        serializer = EngagementSerializer(data)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=['Admin Analytics'])
+class CohortRetentionAPIView(ReplicaReadMixin, APIView):
+    """
+    GET endpoint for retention by signup cohort.
+    """
+    permission_classes = [IsAdminUser]
+    periods_choices = ('week', 'month')
+    max_periods = 36
+
+    @extend_schema(
+        summary="Get cohort retention",
+        description="Groups users by signup week/month and returns the share of each cohort active in every following period. Defaults to the cohorts of the last 12 months.",
+        parameters=[
+            OpenApiParameter(name='start', description='Signups from this day on (YYYY-MM-DD)', type=str),
+            OpenApiParameter(name='end', description='Signups up to this day (YYYY-MM-DD)', type=str),
+            OpenApiParameter(name='period', description='Cohort and retention period (week, month)', type=str),
+            OpenApiParameter(name='periods', description='Number of periods after signup to report (default 12)', type=int),
+        ],
+        responses={200: CohortRetentionSerializer}
+    )
+    def get(self, request):
+        today = timezone.localdate()
+        period = request.query_params.get('period', 'month')
+
+        if period not in self.periods_choices:
+            return Response(
+                {'detail': f'Invalid period. Choose one of: {", ".join(self.periods_choices)}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            periods = int(request.query_params.get('periods', 12))
+            end = parse_date_param(request, 'end', today)
+            start = parse_date_param(request, 'start', end - timedelta(days=365))
+        except ValueError:
+            return Response(
+                {'detail': 'Invalid parameters. Dates use the YYYY-MM-DD format and periods must be an integer.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if start > end:
+            return Response(
+                {'detail': 'The start date must be before the end date.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not 0 <= periods <= self.max_periods:
+            return Response(
+                {'detail': f'periods must be between 0 and {self.max_periods}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = RetentionAnalyticsService.get_cohort_retention(start, end, period, periods)
+        serializer = CohortRetentionSerializer(data)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=['Admin Analytics'])
+class TimeSeriesAPIView(ReplicaReadMixin, APIView):
+    """
+    GET endpoint for activity trends.
+    Returns workouts, meals, posts, new users and XP bucketed by day, week or month.
+    """
+    permission_classes = [IsAdminUser]
+    max_buckets = 731
+
+    @extend_schema(
+        summary="Get activity time series",
+        description="Returns per-bucket counts of workouts, meals, posts and new users, plus the XP awarded, in the project time zone. Weeks start on Sunday. Defaults to the last 30 days by day.",
+        parameters=[
+            OpenApiParameter(name='interval', description='Bucket size (day, week, month)', type=str),
+            OpenApiParameter(name='start', description='First day of the range (YYYY-MM-DD)', type=str),
+            OpenApiParameter(name='end', description='Last day of the range (YYYY-MM-DD)', type=str),
+            OpenApiParameter(name='client', description='Only users employed by this client', type=int),
+            OpenApiParameter(name='group', description='Only members of this group', type=int),
+        ],
+        responses={200: TimeSeriesSerializer}
+    )
+    def get(self, request):
+        today = timezone.localdate()
+        interval = request.query_params.get('interval', 'day')
+
+        if interval not in TimeSeriesService.INTERVALS:
+            return Response(
+                {'detail': f'Invalid interval. Choose one of: {", ".join(TimeSeriesService.INTERVALS)}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            end = parse_date_param(request, 'end', today)
+            start = parse_date_param(request, 'start', end - timedelta(days=29))
+            client_id = request.query_params.get('client')
+            group_id = request.query_params.get('group')
+            client = Client.objects.get(id=int(client_id)) if client_id else None
+            group = Group.objects.get(id=int(group_id)) if group_id else None
+        except ValueError:
+            return Response(
+                {'detail': 'Invalid parameters. Dates use the YYYY-MM-DD format and ids must be integers.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except (Client.DoesNotExist, Group.DoesNotExist):
+            return Response(
+                {'detail': 'Client or group not found.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if start > end:
+            return Response(
+                {'detail': 'The start date must be before the end date.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if (end - start).days >= self.max_buckets * {'day': 1, 'week': 7, 'month': 31}[interval]:
+            return Response(
+                {'detail': f'The range cannot have more than {self.max_buckets} buckets.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = TimeSeriesService.get_timeseries(start, end, interval, client, group)
+        serializer = TimeSeriesSerializer(data)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class ClientAnalyticsMixin:
+    """
+    Restricts an analytics view to the client in the URL, for its owner or administrators.
+    """
+    permission_classes = [IsClientOwnerOrAdmin]
+
+    def get_client(self):
+        if not hasattr(self, '_client'):
+            self._client = get_object_or_404(Client, pk=self.kwargs['client_id'])
+
+        return self._client
+
+
+@extend_schema(tags=['Client Analytics'])
+class ClientStatsAPIView(ReplicaReadMixin, ClientAnalyticsMixin, APIView):
+    """
+    GET endpoint for the statistics of a single client.
+    Same figures as the system statistics, restricted to the client's employees and activities.
+    """
+
+    @extend_schema(
+        summary="Get client statistics",
+        description="Returns the system statistics restricted to a client. Available to the client owner and administrators.",
+        responses={200: SystemStatsSerializer}
+    )
+    def get(self, request, client_id):
+        stats = SystemAnalyticsService.get_system_stats(self.get_client())
+        serializer = SystemStatsSerializer(stats)
+
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(tags=['Client Analytics'])
+class ClientUserListAPIView(ClientAnalyticsMixin, UserListAPIView):
+    """
+    GET endpoint for listing the employees of a client with their statistics.
+    Supports the same pagination, ordering, filtering, and search as the system user list.
+    """
+
+
+@extend_schema(tags=['Client Analytics'])
+class ClientRecentActivitiesAPIView(ClientAnalyticsMixin, RecentActivitiesAPIView):
+    """
+    GET endpoint for the recent activities of a client's employees.
+    """
@@ -6,6 +6,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from clients.models import Client
 from groups.models import GroupMembers
 from profiles.models import Profile
+from profiles.services import create_streaks
 
 
 class UserSimpleSerializer(serializers.ModelSerializer):
@@ -88,9 +89,9 @@ class UserSerializer(serializers.ModelSerializer):
         validated_data.pop('password2', None)
         # Create user with hashed password
         user = User.objects.create_user(**validated_data)
-        profile = Profile.objects.create(user=user, employer=employer)
-        profile.groups.add(employer.main_group)
+        Profile.objects.create(user=user, employer=employer)
         GroupMembers.objects.create(member=user, group=employer.main_group, pending=False)
+        create_streaks([user.id])
 
         return user
 
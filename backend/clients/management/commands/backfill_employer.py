@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db.models import OuterRef, Subquery
+
+from notifications.models import Notification
+from nutrition.models import Meal
+from profiles.models import Profile
+from social_feed.models import Post, Comment
+from workouts.models import WorkoutCheckin
+
+DENORMALIZED_MODELS = {
+    'workouts': WorkoutCheckin,
+    'meals': Meal,
+    'posts': Post,
+    'comments': Comment,
+    'notifications': Notification,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill the denormalized employer of workouts, meals, posts, comments and notifications from the user profiles, '
+        'in primary key chunks so large tables are never locked by a single UPDATE.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '-m', '--model',
+            choices=list(DENORMALIZED_MODELS),
+            action='append',
+            help='Only backfill this table (repeatable). Default: all of them'
+        )
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Rows updated per statement (default: 5000)')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        employer_of_user = Subquery(Profile.objects.filter(user_id=OuterRef('user_id')).values('employer_id')[:1])
+
+        for name in options.get('model') or DENORMALIZED_MODELS:
+            model = DENORMALIZED_MODELS[name]
+            pending = model.objects.filter(employer__isnull=True).order_by('pk')
+            missing = pending.count()
+            last_pk = 0
+            processed = 0
+
+            while True:
+                chunk = list(pending.filter(pk__gt=last_pk).values_list('pk', flat=True)[:chunk_size])
+
+                if not chunk:
+                    break
+
+                model.objects.filter(pk__in=chunk).update(employer_id=employer_of_user)
+                last_pk = chunk[-1]
+                processed += len(chunk)
+                self.stdout.write(f'{name}: {processed}/{missing} rows processed...')
+
+            left = model.objects.filter(employer__isnull=True).count()
+            self.stdout.write(self.style.SUCCESS(
+                f'{name}: employer filled for {missing - left} rows ({left} rows left, their users have no profile).'
+            ))
@@ -10,6 +10,7 @@ from clients.models import Client
 from gamification.models import Season
 from groups.models import Group
 from profiles.models import Profile
+from profiles.services import create_streaks
 
 
 class Command(BaseCommand):
@@ -100,6 +101,7 @@ class Command(BaseCommand):
 
                     self.stdout.write(self.style.NOTICE('Creating profile for owner user.'))
                     Profile.objects.create(user=owner, employer=client)
+                    create_streaks([owner.id])
                     Season.objects.create(
                         client=client,
                         name=fake.word().capitalize() + ' Season',
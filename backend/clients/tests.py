@@ -1,3 +1,66 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+
+from clients.models import Client
+from notifications.models import Notification
+from profiles.models import Profile
+from social_feed.models import Post, Comment
+from workouts.models import WorkoutCheckin
+
+
+class BackfillEmployerCommandTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='backfill', email='backfill@example.com', password='pass1234')
+        self.orphan = User.objects.create_user(username='orphan', email='orphan@example.com', password='pass1234')
+        self.employer = Client.objects.create(
+            name='Backfill Company',
+            cnpj='55666777000188',
+            contact_email='backfill@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.employer)
+
+    def test_rows_created_with_employer(self):
+        """New comments and notifications copy the employer from the profile"""
+        post = Post.objects.create(user=self.user, content_type='social', content_text='Hello')
+        comment = Comment.objects.create(post=post, user=self.user, text='Hi')
+        notification = Notification.objects.create(
+            user=self.user, notification_type='broadcast', title='Title', body='Body'
+        )
+        orphan_notification = Notification.objects.create(
+            user=self.orphan, notification_type='broadcast', title='Title', body='Body'
+        )
+
+        self.assertEqual(comment.employer, self.employer)
+        self.assertEqual(notification.employer, self.employer)
+        self.assertIsNone(orphan_notification.employer)
+
+    def test_backfill_in_chunks(self):
+        """The command fills every table in chunks and skips users without a profile"""
+        WorkoutCheckin.objects.create(
+            user=self.user,
+            workout_date=timezone.now() - timedelta(hours=1),
+            duration=timedelta(minutes=30)
+        )
+        post = Post.objects.create(user=self.user, content_type='social', content_text='Hello')
+        Comment.objects.create(post=post, user=self.user, text='Hi')
+        Notification.objects.create(user=self.user, notification_type='broadcast', title='Title', body='Body')
+        Notification.objects.create(user=self.orphan, notification_type='broadcast', title='Title', body='Body')
+
+        for model in (WorkoutCheckin, Post, Comment, Notification):
+            model.objects.update(employer=None)
+
+        call_command('backfill_employer', chunk_size=1, stdout=StringIO())
+
+        for model in (WorkoutCheckin, Post, Comment):
+            self.assertFalse(model.objects.filter(employer__isnull=True).exists())
 
-# Create your tests here.
+        self.assertEqual(Notification.objects.filter(employer=self.employer).count(), 1)
+        self.assertTrue(Notification.objects.filter(user=self.orphan, employer__isnull=True).exists())
@@ -11,6 +11,7 @@ from rest_framework.views import APIView
 from clients.models import Client
 from clients.serializer import ClientSerializer
 from profiles.models import Profile
+from profiles.services import create_streaks
 from groups.services import create_group_for_client
 
 
@@ -92,8 +93,8 @@ class CreateClientWithOwnerAPIView(APIView):
 
                 client = Client.objects.create(**client_data)
 
-                # Create Parent Group
-                new_group =create_group_for_client(
+                # Create Parent Group (the owner joins it as its creator)
+                create_group_for_client(
                     client=client,
                     name=client.name,
                     owner=owner,
@@ -102,8 +103,8 @@ class CreateClientWithOwnerAPIView(APIView):
                 )
 
                 # Create profile for the owner
-                owner_profile = Profile.objects.create(user=owner, employer=client)
-                owner_profile.groups.add(new_group)
+                Profile.objects.create(user=owner, employer=client)
+                create_streaks([owner.id])
                 # Return data from the created customer
                 serializer = ClientSerializer(client)
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
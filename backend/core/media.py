@@ -0,0 +1,228 @@
+"""
+Media variants pipeline.
+
+Models storing uploaded proofs/post media extend MediaVariantsModel, which adds a small WebP thumbnail and a
+compressed JPEG preview stored next to the original (``<upload dir>/variants/``). Uploads are only marked pending;
+process_pending_media, run every minute by the scheduler (see notifications runapscheduler), builds the variants
+outside the request. Videos get their variants from a poster frame extracted with ffmpeg when the binary is
+available (FFMPEG_BINARY setting); without it they are marked processed with no variants, and clients keep using
+the original file.
+
+BatchedMediaListSerializer signs the media URLs of a whole page in one batch (core.storage_backends.batch_media_urls)
+before the page is rendered.
+"""
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from io import BytesIO
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import models
+from django.utils import timezone
+from django_apscheduler.util import close_old_connections
+from PIL import Image, ImageOps, UnidentifiedImageError
+from rest_framework import serializers
+
+from core.storage_backends import batch_media_urls
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = (320, 320)
+PREVIEW_SIZE = (1280, 1280)
+THUMBNAIL_QUALITY = 75
+PREVIEW_QUALITY = 80
+VIDEO_EXTENSIONS = ('.mp4', '.mov')
+PROCESS_BATCH_SIZE = 50
+
+# Models whose media is processed by process_pending_media
+MEDIA_MODELS = ('workouts.WorkoutCheckinProof', 'nutrition.MealProof', 'social_feed.ContentFilePost')
+
+
+def media_variant_path(instance, filename):
+    """
+    Store variants in a ``variants`` folder next to the original file.
+    """
+    return os.path.join(os.path.dirname(instance.file.name), 'variants', filename)
+
+
+class MediaVariantsModel(models.Model):
+    """
+    Abstract base adding the thumbnail/preview variants of the ``file`` field of the concrete model.
+    ``variants_processed_at`` stays empty until the pipeline has handled the file.
+    """
+    thumbnail = models.FileField(upload_to=media_variant_path, max_length=255, null=True, blank=True, editable=False)
+    preview = models.FileField(upload_to=media_variant_path, max_length=255, null=True, blank=True, editable=False)
+    variants_processed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    class Meta:
+        abstract = True
+
+    @property
+    def is_video(self):
+        return self.file.name.lower().endswith(VIDEO_EXTENSIONS)
+
+    def build_variants(self):
+        """
+        Create the thumbnail and preview of the file and mark it processed.
+        Files that cannot be decoded are marked processed without variants, so they are not retried forever.
+        """
+        try:
+            image = self._poster_frame() if self.is_video else self._open_image()
+        except (OSError, UnidentifiedImageError, Image.DecompressionBombError, subprocess.SubprocessError) as e:
+            logger.warning('[media] could not read %s: %s', self.file.name, e)
+            image = None
+
+        stem = os.path.splitext(os.path.basename(self.file.name))[0]
+
+        if image is not None:
+            self.thumbnail.save(f'{stem}_thumb.webp', ContentFile(encode_thumbnail(image)), save=False)
+            self.preview.save(f'{stem}_preview.jpg', ContentFile(encode_preview(image)), save=False)
+
+        self.variants_processed_at = timezone.now()
+        self.save(update_fields=['thumbnail', 'preview', 'variants_processed_at'])
+
+        return image is not None
+
+    def _open_image(self):
+        with self.file.open('rb') as file:
+            image = Image.open(file)
+            image.load()
+
+        return ImageOps.exif_transpose(image)
+
+    def _poster_frame(self):
+        """
+        Return a representative frame of the video, or None when ffmpeg is not available.
+        """
+        ffmpeg = shutil.which(getattr(settings, 'FFMPEG_BINARY', 'ffmpeg'))
+
+        if ffmpeg is None:
+            return None
+
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'source' + os.path.splitext(self.file.name)[1].lower())
+            poster = os.path.join(directory, 'poster.png')
+
+            with self.file.open('rb') as file, open(source, 'wb') as target:
+                shutil.copyfileobj(file, target)
+
+            subprocess.run(
+                [ffmpeg, '-loglevel', 'error', '-y', '-i', source, '-vf', 'thumbnail', '-frames:v', '1', poster],
+                check=True, timeout=60, capture_output=True,
+            )
+
+            with Image.open(poster) as image:
+                image.load()
+
+                return image.copy()
+
+
+def _resized(image, size):
+    image = image.copy()
+    image.thumbnail(size, Image.Resampling.LANCZOS)
+
+    return image
+
+
+def encode_thumbnail(image):
+    """
+    Return the WebP bytes of ``image`` fitted in THUMBNAIL_SIZE (transparency is kept).
+    """
+    thumbnail = _resized(image, THUMBNAIL_SIZE)
+
+    if thumbnail.mode not in ('RGB', 'RGBA'):
+        thumbnail = thumbnail.convert('RGBA' if 'A' in thumbnail.getbands() else 'RGB')
+
+    buffer = BytesIO()
+    thumbnail.save(buffer, 'WEBP', quality=THUMBNAIL_QUALITY, method=4)
+
+    return buffer.getvalue()
+
+
+def encode_preview(image):
+    """
+    Return the progressive JPEG bytes of ``image`` fitted in PREVIEW_SIZE.
+    """
+    preview = _resized(image, PREVIEW_SIZE).convert('RGB')
+    buffer = BytesIO()
+    preview.save(buffer, 'JPEG', quality=PREVIEW_QUALITY, optimize=True, progressive=True)
+
+    return buffer.getvalue()
+
+
+@close_old_connections
+def process_pending_media(batch_size=PROCESS_BATCH_SIZE):
+    """
+    Build the variants of up to ``batch_size`` pending files of each media model.
+    Returns the run metrics (files processed, variants created and duration).
+    """
+    started = time.monotonic()
+    processed = created = 0
+
+    for label in MEDIA_MODELS:
+        model = apps.get_model(label)
+
+        for instance in model.objects.filter(variants_processed_at__isnull=True).order_by('id')[:batch_size]:
+            processed += 1
+            created += instance.build_variants()
+
+    metrics = {
+        'files_processed': processed,
+        'variants_created': created,
+        'duration_ms': round((time.monotonic() - started) * 1000, 2),
+    }
+    logger.info(
+        '[media] processed=%(files_processed)s with_variants=%(variants_created)s duration=%(duration_ms)sms',
+        metrics
+    )
+
+    return metrics
+
+
+def collect_file_names(instances, paths):
+    """
+    Return the names of the files reached from ``instances`` through the dotted ``paths`` (e.g. "proofs.file").
+    To-many relations are followed with ``.all()``, so they should be prefetched.
+    """
+    names = set()
+
+    def walk(obj, attributes):
+        if obj is None:
+            return
+
+        if isinstance(obj, models.Manager):
+            for item in obj.all():
+                walk(item, attributes)
+            return
+
+        if not attributes:
+            if getattr(obj, 'name', None):
+                names.add(obj.name)
+            return
+
+        walk(getattr(obj, attributes[0], None), attributes[1:])
+
+    for instance in instances:
+        for path in paths:
+            walk(instance, path.split('.'))
+
+    return names
+
+
+class BatchedMediaListSerializer(serializers.ListSerializer):
+    """
+    List serializer signing the URLs of every file of the page in one batch before rendering it, instead of one
+    signature per file. The child serializer lists the file paths to sign in ``Meta.media_paths``.
+    """
+
+    def to_representation(self, data):
+        instances = list(data.all() if isinstance(data, models.Manager) else data)
+        paths = getattr(self.child.Meta, 'media_paths', ())
+
+        with batch_media_urls(collect_file_names(instances, paths)):
+            return super().to_representation(instances)
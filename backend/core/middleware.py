@@ -0,0 +1,22 @@
+from rest_framework.permissions import SAFE_METHODS
+
+from core.replica import mark_recent_write
+
+
+class ReplicaStickinessMiddleware:
+    """
+    Flag users after a successful write so their next reads skip the replica until it has caught up.
+    Runs on the response, once DRF has authenticated the request user (JWT included).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        user = getattr(request, 'user', None)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400 and user and user.is_authenticated:
+            mark_recent_write(user)
+
+        return response
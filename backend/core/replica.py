@@ -0,0 +1,113 @@
+"""
+Read-replica routing.
+
+Views opt in with ReplicaReadMixin: their safe requests read from the alias named by the REPLICA_DATABASE setting,
+unless the requesting user wrote something in the last REPLICA_STICKY_SECONDS (read-your-writes). Writes, and reads
+inside a transaction on the primary, always use the default alias. Without REPLICA_DATABASE everything stays on
+the default database.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+_read_alias = ContextVar('replica_read_alias', default=None)
+
+STICKY_CACHE_KEY = 'replica-sticky:{user_id}'
+
+
+def replica_alias():
+    return getattr(settings, 'REPLICA_DATABASE', None)
+
+
+def current_read_alias():
+    """
+    Return the alias reads are routed to in the current context, or None for the default database.
+    """
+    return _read_alias.get()
+
+
+@contextmanager
+def read_from_replica():
+    """
+    Route the reads of the block to the replica, when one is configured.
+    """
+    token = _read_alias.set(replica_alias())
+
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def mark_recent_write(user):
+    """
+    Keep ``user`` reading from the primary for the next REPLICA_STICKY_SECONDS.
+    The flag lives in the default cache, which must be shared between workers for stickiness to hold across them.
+    """
+    cache.set(STICKY_CACHE_KEY.format(user_id=user.pk), True, timeout=getattr(settings, 'REPLICA_STICKY_SECONDS', 5))
+
+
+def has_recent_write(user):
+    return bool(cache.get(STICKY_CACHE_KEY.format(user_id=user.pk)))
+
+
+class ReplicaRouter:
+    """
+    Database router sending the reads of replica-enabled requests to the replica and everything else to default.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = _read_alias.get()
+
+        # A transaction on the primary must see its own writes
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows as the primary
+        databases = {DEFAULT_DB_ALIAS, replica_alias()}
+
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives the schema through replication
+        if db == replica_alias() and db != DEFAULT_DB_ALIAS:
+            return False
+
+        return None
+
+
+class ReplicaReadMixin:
+    """
+    View mixin routing the reads of safe requests to the replica.
+    Authentication runs on the primary; the switch happens afterwards, so users with a recent write keep reading
+    from the primary.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        token = _read_alias.set(None)
+
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        user = request.user
+
+        if request.method in SAFE_METHODS and not (user.is_authenticated and has_recent_write(user)):
+            _read_alias.set(replica_alias())
@@ -27,6 +27,16 @@ except ImportError:
         }
     }
 
+    # Optional streaming replica for read-heavy endpoints (see core.replica)
+    if os.getenv('DB_REPLICA_HOST'):
+        DATABASES['replica'] = {
+            **DATABASES['default'],
+            'HOST': os.getenv('DB_REPLICA_HOST'),
+            'PORT': os.getenv('DB_REPLICA_PORT', os.getenv('DB_PORT')),
+            'TEST': {'MIRROR': 'default'},
+        }
+        REPLICA_DATABASE = 'replica'
+
     # Cloudflare R2 configuration for production
     AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
     AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
@@ -38,6 +48,8 @@ except ImportError:
     AWS_DEFAULT_ACL = None
     AWS_QUERYSTRING_AUTH = True
     AWS_QUERYSTRING_EXPIRE = 3600
+    # Signed URLs are reused from the cache for windows of this length (must stay below AWS_QUERYSTRING_EXPIRE)
+    AWS_SIGNED_URL_CACHE_SECONDS = int(os.getenv('AWS_SIGNED_URL_CACHE_SECONDS', AWS_QUERYSTRING_EXPIRE // 2))
     AWS_S3_CUSTOM_DOMAIN = os.getenv('AWS_S3_CUSTOM_DOMAIN', None)
     AWS_S3_OBJECT_PARAMETERS = {
         'CacheControl': 'max-age=86400',
@@ -101,6 +113,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaStickinessMiddleware',
 ]
 
 ROOT_URLCONF = 'core.urls'
@@ -163,11 +176,31 @@ try:
 except (NameError, AttributeError):
     MEDIA_URL = 'media/'
 
+# ffmpeg binary used for video poster frames by the media pipeline (core.media); videos get no variants without it
+FFMPEG_BINARY = os.getenv('FFMPEG_BINARY', 'ffmpeg')
+
 WSGI_APPLICATION = 'core.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Reads of ReplicaReadMixin views go to REPLICA_DATABASE (when set) except for users that wrote in the last
+# REPLICA_STICKY_SECONDS. Locally, point a 'replica' alias at a second PostgreSQL database or a copy of the SQLite file.
+DATABASE_ROUTERS = ['core.replica.ReplicaRouter']
+REPLICA_STICKY_SECONDS = 5
+
+# Cache shared by every worker (replica stickiness, group memberships); per-process memory when REDIS_URL is not set
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+
+# Upper bound on how long another worker may serve memberships changed elsewhere without a shared cache
+GROUP_MEMBERSHIPS_CACHE_TIMEOUT = 60
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
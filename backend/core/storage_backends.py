@@ -1,13 +1,28 @@
 """
 Custom storage backends para Cloudflare R2
 """
+import hashlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
 from storages.backends.s3boto3 import S3Boto3Storage
 from django.conf import settings
 
+# URLs assinadas em lote para o bloco atual (ver batch_media_urls)
+_batched_urls = ContextVar('batched_media_urls', default=None)
+
+SIGNED_URL_CACHE_KEY = 'r2-url:{bucket}:{digest}'
+
 
 class CloudflareR2Storage(S3Boto3Storage):
     """
-    Storage customizado para Cloudflare R2 com suporte a URLs assinadas
+    Storage customizado para Cloudflare R2 com suporte a URLs assinadas.
+    As URLs assinadas são guardadas no cache compartilhado por janelas (buckets) de AWS_SIGNED_URL_CACHE_SECONDS,
+    menores que AWS_QUERYSTRING_EXPIRE, então uma URL servida do cache ainda vale por pelo menos a diferença entre os
+    dois tempos.
     """
     # Cloudflare R2 não suporta ACLs
     default_acl = None
@@ -30,16 +45,110 @@ class CloudflareR2Storage(S3Boto3Storage):
         if hasattr(settings, 'AWS_QUERYSTRING_EXPIRE'):
             self.querystring_expire = settings.AWS_QUERYSTRING_EXPIRE
 
+        # A janela do cache precisa ser menor que a validade da assinatura
+        cache_seconds = getattr(settings, 'AWS_SIGNED_URL_CACHE_SECONDS', self.querystring_expire // 2)
+        self.url_cache_seconds = max(0, min(cache_seconds, self.querystring_expire - 60))
+
+    def _public_url(self, name):
+        if hasattr(settings, 'AWS_S3_CUSTOM_DOMAIN') and settings.AWS_S3_CUSTOM_DOMAIN:
+            return f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{name}"
+
+        return None
+
+    def _cache_window(self):
+        """
+        Retorna a chave base da janela atual e quantos segundos faltam para ela terminar.
+        """
+        now = time.time()
+        bucket = int(now // self.url_cache_seconds)
+
+        return bucket, max(1, int((bucket + 1) * self.url_cache_seconds - now))
+
+    @staticmethod
+    def _cache_key(bucket, name):
+        return SIGNED_URL_CACHE_KEY.format(bucket=bucket, digest=hashlib.sha1(name.encode()).hexdigest())
+
     def url(self, name, parameters=None, expire=None, http_method=None):
         """
         Gera URL para o arquivo.
         Se AWS_S3_CUSTOM_DOMAIN estiver configurado, usa URL pública.
-        Caso contrário, gera URL assinada temporária.
+        Caso contrário, gera URL assinada temporária, reaproveitando a do lote atual ou do cache quando os parâmetros
+        são os padrões.
         """
         # Se tiver domínio customizado, usa URL pública
-        if hasattr(settings, 'AWS_S3_CUSTOM_DOMAIN') and settings.AWS_S3_CUSTOM_DOMAIN:
-            return f"https://{settings.AWS_S3_CUSTOM_DOMAIN}/{name}"
+        public_url = self._public_url(name)
+
+        if public_url:
+            return public_url
+
+        if parameters is not None or expire is not None or http_method is not None or not self.url_cache_seconds:
+            return super().url(name, parameters=parameters, expire=expire, http_method=http_method)
+
+        batched = _batched_urls.get()
+
+        if batched and name in batched:
+            return batched[name]
+
+        bucket, timeout = self._cache_window()
+        key = self._cache_key(bucket, name)
+        url = cache.get(key)
+
+        if url is None:
+            url = super().url(name)
+            cache.set(key, url, timeout)
+
+        return url
+
+    def urls(self, names):
+        """
+        Retorna {name: url} para vários arquivos com uma leitura e uma escrita no cache; só os ausentes são assinados.
+        """
+        names = {name for name in names if name}
+
+        if not names:
+            return {}
+
+        public_urls = {name: self._public_url(name) for name in names}
+
+        if all(public_urls.values()):
+            return public_urls
+
+        if not self.url_cache_seconds:
+            return {name: super(CloudflareR2Storage, self).url(name) for name in names}
+
+        bucket, timeout = self._cache_window()
+        keys = {self._cache_key(bucket, name): name for name in names}
+        cached = cache.get_many(keys)
+        urls = {keys[key]: url for key, url in cached.items()}
+        signed = {
+            key: super(CloudflareR2Storage, self).url(name) for key, name in keys.items() if key not in cached
+        }
+
+        if signed:
+            cache.set_many(signed, timeout)
+            urls.update({keys[key]: url for key, url in signed.items()})
+
+        return urls
+
+
+@contextmanager
+def batch_media_urls(names, storage=None):
+    """
+    Assina em lote as URLs de ``names`` para o bloco: chamadas a ``url()`` dentro dele usam o resultado do lote.
+    Sem efeito em storages sem ``urls()`` (ex.: FileSystemStorage em desenvolvimento e testes).
+    """
+    storage = storage or default_storage
+    batch_urls = getattr(storage, 'urls', None)
+
+    if batch_urls is None:
+        yield
+        return
 
-        # Caso contrário, gera URL assinada
-        return super().url(name, parameters=parameters, expire=expire, http_method=http_method)
+    urls = dict(_batched_urls.get() or {})
+    urls.update(batch_urls(names))
+    token = _batched_urls.set(urls)
 
+    try:
+        yield
+    finally:
+        _batched_urls.reset(token)
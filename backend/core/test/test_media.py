@@ -0,0 +1,142 @@
+"""
+Tests for the media variants pipeline
+"""
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from clients.models import Client
+from core.media import PREVIEW_SIZE, THUMBNAIL_SIZE, process_pending_media
+from profiles.models import Profile
+from social_feed.models import ContentFilePost, Post
+from social_feed.serializers import ContentFilePostSerializer
+from status.models import StatusRegistry
+
+
+def image_bytes(size=(2400, 1200), image_format='PNG', mode='RGB'):
+    buffer = BytesIO()
+    Image.new(mode, size, 'red').save(buffer, image_format)
+
+    return buffer.getvalue()
+
+
+class MediaVariantsTest(TestCase):
+    """Uploads get resized variants stored next to the original, built outside the request"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        storage = override_settings(
+            MEDIA_ROOT=self.media_root,
+            STORAGES={
+                'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+                'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+            },
+        )
+        storage.enable()
+        self.addCleanup(storage.disable)
+        self.addCleanup(StatusRegistry.clear)
+
+        self.user = User.objects.create_user(username='mediauser', password='pass1234')
+        client = Client.objects.create(
+            name='Media Company',
+            cnpj='11222333000177',
+            contact_email='media@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=client)
+        self.post = Post.objects.create(user=self.user, content_type='social', content_text='media')
+
+    def _upload(self, name, content):
+        media = ContentFilePost(post=self.post)
+        media.file.save(name, ContentFile(content), save=False)
+        media.save()
+
+        return media
+
+    def test_image_variants_are_built_by_the_job(self):
+        media = self._upload('photo.png', image_bytes())
+
+        self.assertIsNone(media.variants_processed_at)
+        self.assertEqual(ContentFilePostSerializer(media).data['thumbnail'], None)
+
+        metrics = process_pending_media()
+
+        media.refresh_from_db()
+        self.assertEqual(metrics['files_processed'], 1)
+        self.assertEqual(metrics['variants_created'], 1)
+        self.assertIsNotNone(media.variants_processed_at)
+        self.assertEqual(os.path.dirname(media.thumbnail.name), 'post_media/variants')
+
+        with Image.open(media.thumbnail.path) as thumbnail:
+            self.assertEqual(thumbnail.format, 'WEBP')
+            self.assertEqual(thumbnail.size, (THUMBNAIL_SIZE[0], THUMBNAIL_SIZE[0] // 2))
+
+        with Image.open(media.preview.path) as preview:
+            self.assertEqual(preview.format, 'JPEG')
+            self.assertEqual(preview.size, (PREVIEW_SIZE[0], PREVIEW_SIZE[0] // 2))
+
+        data = ContentFilePostSerializer(media).data
+        self.assertTrue(data['thumbnail'].endswith('_thumb.webp'))
+        self.assertTrue(data['preview'].endswith('_preview.jpg'))
+
+        # Processed files are not picked again
+        self.assertEqual(process_pending_media()['files_processed'], 0)
+
+    def test_small_images_are_not_upscaled(self):
+        media = self._upload('small.jpg', image_bytes(size=(100, 50), image_format='JPEG'))
+
+        process_pending_media()
+
+        media.refresh_from_db()
+
+        with Image.open(media.thumbnail.path) as thumbnail:
+            self.assertEqual(thumbnail.size, (100, 50))
+
+    def test_undecodable_files_are_not_retried(self):
+        media = self._upload('broken.png', b'not an image')
+
+        metrics = process_pending_media()
+
+        media.refresh_from_db()
+        self.assertEqual(metrics['variants_created'], 0)
+        self.assertIsNotNone(media.variants_processed_at)
+        self.assertFalse(media.thumbnail)
+
+    def test_videos_without_ffmpeg_keep_the_original_only(self):
+        media = self._upload('clip.mp4', b'fake video')
+
+        with patch('core.media.shutil.which', return_value=None):
+            process_pending_media()
+
+        media.refresh_from_db()
+        self.assertIsNotNone(media.variants_processed_at)
+        self.assertFalse(media.thumbnail)
+        self.assertFalse(media.preview)
+
+    def test_videos_use_a_poster_frame(self):
+        media = self._upload('clip.mov', b'fake video')
+
+        def extract_frame(command, **kwargs):
+            with open(command[-1], 'wb') as poster:
+                poster.write(image_bytes(size=(1920, 1080)))
+
+        with patch('core.media.shutil.which', return_value='/usr/bin/ffmpeg'), \
+                patch('core.media.subprocess.run', side_effect=extract_frame) as run:
+            process_pending_media()
+
+        media.refresh_from_db()
+        self.assertEqual(run.call_args.args[0][0], '/usr/bin/ffmpeg')
+        self.assertTrue(media.thumbnail.name.endswith('clip_thumb.webp'))
+
+        with Image.open(media.preview.path) as preview:
+            self.assertEqual(preview.size, (1280, 720))
@@ -0,0 +1,111 @@
+"""
+Tests for the read-replica routing
+"""
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from unittest.mock import patch
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from core.middleware import ReplicaStickinessMiddleware
+from core.replica import (
+    ReplicaReadMixin, ReplicaRouter, current_read_alias, has_recent_write, mark_recent_write, read_from_replica
+)
+
+
+class AliasView(ReplicaReadMixin, APIView):
+    """Answers with the alias its reads are routed to"""
+
+    def get(self, request):
+        return Response({'alias': current_read_alias()})
+
+    def post(self, request):
+        return Response({'alias': current_read_alias()})
+
+
+@override_settings(REPLICA_DATABASE='replica')
+class ReplicaRouterTest(SimpleTestCase):
+    """Test the router decisions"""
+
+    def setUp(self):
+        self.router = ReplicaRouter()
+
+    def test_reads_outside_replica_context_use_default(self):
+        """Reads are not routed unless a view or block opted in"""
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_reads_in_replica_context(self):
+        """Reads go to the replica and writes to default"""
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_read(User), 'replica')
+            self.assertEqual(self.router.db_for_write(User), DEFAULT_DB_ALIAS)
+
+        self.assertIsNone(current_read_alias())
+
+    def test_reads_inside_transaction_use_default(self):
+        """A transaction on the primary reads its own writes"""
+        with read_from_replica(), patch.object(connections[DEFAULT_DB_ALIAS], 'in_atomic_block', True):
+            self.assertIsNone(self.router.db_for_read(User))
+
+    @override_settings(REPLICA_DATABASE=None)
+    def test_no_replica_configured(self):
+        """Without a replica everything stays on default"""
+        with read_from_replica():
+            self.assertIsNone(self.router.db_for_read(User))
+
+    def test_replica_is_not_migrated(self):
+        """The replica receives the schema through replication"""
+        self.assertFalse(self.router.allow_migrate('replica', 'workouts'))
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, 'workouts'))
+
+
+@override_settings(REPLICA_DATABASE='replica')
+class ReplicaReadMixinTest(TestCase):
+    """Test the view opt-in and read-your-writes stickiness"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='replicauser', password='pass1234')
+        self.factory = APIRequestFactory()
+
+    def _call(self, method):
+        request = getattr(self.factory, method)('/alias/')
+        force_authenticate(request, user=self.user)
+
+        return AliasView.as_view()(request).data['alias']
+
+    def test_safe_requests_read_from_replica(self):
+        """GET requests are routed to the replica and the context is reset afterwards"""
+        self.assertEqual(self._call('get'), 'replica')
+        self.assertIsNone(current_read_alias())
+
+    def test_unsafe_requests_read_from_default(self):
+        """Writes keep reading from the primary"""
+        self.assertIsNone(self._call('post'))
+
+    def test_recent_writer_reads_from_default(self):
+        """A user that just wrote reads from the primary"""
+        mark_recent_write(self.user)
+
+        self.assertIsNone(self._call('get'))
+
+    def test_middleware_marks_successful_writes(self):
+        """Only successful unsafe requests of authenticated users make them sticky"""
+        factory = RequestFactory()
+
+        def call(method, status_code):
+            request = getattr(factory, method)('/')
+            request.user = self.user
+            ReplicaStickinessMiddleware(lambda request: HttpResponse(status=status_code))(request)
+
+        call('get', 200)
+        call('post', 400)
+        self.assertFalse(has_recent_write(self.user))
+
+        call('post', 201)
+        self.assertTrue(has_recent_write(self.user))
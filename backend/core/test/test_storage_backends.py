@@ -0,0 +1,131 @@
+"""
+Tests for the signed URL cache and batch signing of CloudflareR2Storage
+"""
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase, override_settings
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from clients.models import Client
+from core.storage_backends import CloudflareR2Storage, batch_media_urls
+from profiles.models import Profile
+from social_feed.models import ContentFilePost, Post
+from social_feed.serializers import PostListSerializer
+from status.models import StatusRegistry
+
+
+def fake_sign(storage, name, parameters=None, expire=None, http_method=None):
+    return f'https://r2.test/bucket/{name}?signature={expire or "default"}'
+
+
+@override_settings(AWS_S3_CUSTOM_DOMAIN=None, AWS_QUERYSTRING_EXPIRE=3600, AWS_SIGNED_URL_CACHE_SECONDS=1800)
+@patch.object(S3Boto3Storage, 'url', autospec=True, side_effect=fake_sign)
+class CloudflareR2StorageURLTest(SimpleTestCase):
+    """Signed URLs are reused within a cache window and signed in batches"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.storage = CloudflareR2Storage(
+            access_key='key', secret_key='secret', bucket_name='bucket', endpoint_url='https://r2.test'
+        )
+
+    def test_url_is_signed_once_per_window(self, sign):
+        with patch('core.storage_backends.time.time', return_value=1000.0):
+            first = self.storage.url('post_media/a.jpg')
+            second = self.storage.url('post_media/a.jpg')
+
+        self.assertEqual(first, second)
+        self.assertEqual(sign.call_count, 1)
+
+        # A new window signs again
+        with patch('core.storage_backends.time.time', return_value=1000.0 + 1800):
+            self.storage.url('post_media/a.jpg')
+
+        self.assertEqual(sign.call_count, 2)
+
+    def test_cache_window_is_shorter_than_the_signature(self, sign):
+        with override_settings(AWS_SIGNED_URL_CACHE_SECONDS=7200):
+            storage = CloudflareR2Storage(
+                access_key='key', secret_key='secret', bucket_name='bucket', endpoint_url='https://r2.test'
+            )
+
+        self.assertLess(storage.url_cache_seconds, storage.querystring_expire)
+
+    def test_custom_parameters_are_not_cached(self, sign):
+        self.storage.url('post_media/a.jpg', expire=60)
+        self.storage.url('post_media/a.jpg', expire=60)
+
+        self.assertEqual(sign.call_count, 2)
+
+    def test_custom_domain_urls_are_public(self, sign):
+        with override_settings(AWS_S3_CUSTOM_DOMAIN='media.example.com'):
+            self.assertEqual(self.storage.url('post_media/a.jpg'), 'https://media.example.com/post_media/a.jpg')
+            self.assertEqual(
+                self.storage.urls(['post_media/a.jpg']), {'post_media/a.jpg': 'https://media.example.com/post_media/a.jpg'}
+            )
+
+        sign.assert_not_called()
+
+    def test_batch_signs_only_missing_urls(self, sign):
+        cached = self.storage.url('post_media/a.jpg')
+
+        with patch('core.storage_backends.cache.get_many', wraps=cache.get_many) as get_many:
+            urls = self.storage.urls(['post_media/a.jpg', 'post_media/b.jpg', 'post_media/c.jpg', ''])
+
+        self.assertEqual(get_many.call_count, 1)
+        self.assertEqual(set(urls), {'post_media/a.jpg', 'post_media/b.jpg', 'post_media/c.jpg'})
+        self.assertEqual(urls['post_media/a.jpg'], cached)
+        self.assertEqual(sign.call_count, 3)
+
+        # The batch filled the cache for single lookups
+        self.storage.url('post_media/b.jpg')
+        self.assertEqual(sign.call_count, 3)
+
+    def test_url_calls_inside_a_batch_skip_the_cache(self, sign):
+        with batch_media_urls(['post_media/a.jpg', 'post_media/b.jpg'], storage=self.storage):
+            with patch('core.storage_backends.cache.get') as get:
+                url = self.storage.url('post_media/b.jpg')
+
+        get.assert_not_called()
+        self.assertEqual(url, fake_sign(self.storage, 'post_media/b.jpg'))
+        self.assertEqual(sign.call_count, 2)
+
+
+class BatchedMediaListSerializerTest(TestCase):
+    """List serializers sign the media of the whole page before rendering it"""
+
+    def setUp(self):
+        self.addCleanup(StatusRegistry.clear)
+        self.user = User.objects.create_user(username='batchmedia', password='pass1234')
+        client = Client.objects.create(
+            name='Batch Media Company',
+            cnpj='11222333000188',
+            contact_email='batch@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=client)
+
+        for index in range(2):
+            post = Post.objects.create(user=self.user, content_type='social', content_text=f'post {index}')
+            media = ContentFilePost(post=post)
+            media.file.save(f'batch{index}.jpg', ContentFile(b'image'), save=False)
+            media.save()
+
+    def test_page_media_names_are_batched(self):
+        posts = Post.objects.filter(user=self.user).prefetch_related(
+            'content_files', 'workout_checkin__proofs', 'meal__proofs'
+        ).order_by('id')
+        names = list(ContentFilePost.objects.order_by('post_id').values_list('file', flat=True))
+
+        with patch('core.media.batch_media_urls', wraps=batch_media_urls) as batch:
+            data = PostListSerializer(posts, many=True).data
+
+        batch.assert_called_once_with(set(names))
+        self.assertEqual([post['content_files'][0]['file'] for post in data], [default_storage.url(name) for name in names])
@@ -0,0 +1,110 @@
+from datetime import datetime, time, timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def local_datetime(value):
+    """
+    Return ``value`` as an aware datetime. Strings are parsed and naive values are interpreted in the current time zone.
+    """
+    if isinstance(value, str):
+        value = parse_datetime(value)
+
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+
+    return value
+
+
+def local_date(value):
+    """
+    Return the local calendar day (project time zone) of a datetime.
+    """
+    return timezone.localdate(local_datetime(value))
+
+
+def local_day_range(day):
+    """
+    Return the half-open [start, end) aware datetimes covering the local calendar ``day``.
+    Filtering with ``field__gte=start, field__lt=end`` keeps the column bare so btree indexes can be used,
+    unlike ``field__date=day`` which wraps it in a time zone cast.
+    """
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+
+    return start, end
+
+
+def week_start_for(day):
+    """
+    Return the Sunday that opens the week containing ``day``.
+    Weeks start on Sunday, the same convention used by the streak models.
+    """
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def increment_counter(model, step, **lookup):
+    """
+    Add ``step`` to the ``count`` of the ``model`` row identified by ``lookup`` with a single UPDATE.
+    Missing rows are created on increments only and counts never go below zero.
+    """
+    updated = model.objects.filter(**lookup).update(count=Greatest(F('count') + step, 0))
+
+    if updated or step <= 0:
+        return
+
+    try:
+        with transaction.atomic():
+            model.objects.create(count=step, **lookup)
+    except IntegrityError:
+        # Created by a concurrent request in the meantime
+        model.objects.filter(**lookup).update(count=F('count') + step)
+
+
+def violates_constraint(error, model, name):
+    """
+    Return whether the IntegrityError ``error`` was raised by the unique constraint ``name`` of ``model``.
+    PostgreSQL reports the constraint name; SQLite only lists the columns of the violated constraint.
+    """
+    constraint_name = getattr(getattr(error.__cause__, 'diag', None), 'constraint_name', None)
+
+    if constraint_name:
+        return constraint_name == name
+
+    constraint = next(constraint for constraint in model._meta.constraints if constraint.name == name)
+    columns = ', '.join(
+        f'{model._meta.db_table}.{model._meta.get_field(field).column}' for field in constraint.fields
+    )
+
+    return name in str(error) or str(error) == f'UNIQUE constraint failed: {columns}'
+
+
+def filter_local_dates(queryset, field, start_date=None, end_date=None):
+    """
+    Restrict ``queryset`` to the local days from ``start_date`` to ``end_date`` (inclusive, either may be omitted).
+    Dates may be ``date`` objects or YYYY-MM-DD strings; invalid strings raise ValueError.
+    """
+    bounds = {}
+
+    for name, value in (('start_date', start_date), ('end_date', end_date)):
+        if isinstance(value, str):
+            parsed = parse_date(value) if value else None
+
+            if value and parsed is None:
+                raise ValueError(f'{name} must be a date in the YYYY-MM-DD format.')
+
+            value = parsed
+
+        bounds[name] = value
+
+    if bounds['start_date'] is not None:
+        queryset = queryset.filter(**{f'{field}__gte': local_day_range(bounds['start_date'])[0]})
+
+    if bounds['end_date'] is not None:
+        queryset = queryset.filter(**{f'{field}__lt': local_day_range(bounds['end_date'])[1]})
+
+    return queryset
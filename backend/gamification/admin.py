@@ -80,7 +80,7 @@ class GamificationSettingsAdmin(admin.ModelAdmin):
 
 @admin.register(Season)
 class SeasonAdmin(admin.ModelAdmin):
-    list_display = ('name', 'client', 'start_date', 'end_date', 'is_active', 'days_remaining')
+    list_display = ('name', 'client', 'start_date', 'end_date', 'is_active', 'days_remaining', 'closed_at')
     list_filter = ('client', 'start_date', 'end_date')
     search_fields = ('name', 'description', 'client__name')
 
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from gamification.tasks import close_ended_seasons
+
+
+class Command(BaseCommand):
+    help = 'Freeze the standings of every season that has ended (the same job run daily by the scheduler)'
+
+    def handle(self, *args, **options):
+        metrics = close_ended_seasons()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seasons closed: {metrics["seasons_closed"]} ({metrics["user_standings"]} user and '
+            f'{metrics["group_standings"]} group standings, {metrics["duration_ms"]} ms).'
+        ))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from nutrition.models import MealDayCount
+from workouts.models import WorkoutWeekCount
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the weekly workout and daily meal counters used by the streak checks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', '-i', type=int, action='append', help='Only rebuild this user (repeatable)')
+
+    def handle(self, *args, **options):
+        user_ids = options.get('user_id')
+
+        weeks = WorkoutWeekCount.rebuild(user_ids)
+        days = MealDayCount.rebuild(user_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Streak counters rebuilt: {weeks} workout weeks and {days} meal days.'
+        ))
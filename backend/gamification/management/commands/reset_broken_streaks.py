@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from gamification.tasks import reset_broken_streaks
+
+
+class Command(BaseCommand):
+    help = 'Reset the broken workout and meal streaks of every user (the same job run daily by the scheduler)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Only report the streaks that would be reset')
+
+    def handle(self, *args, **options):
+        metrics = reset_broken_streaks(dry_run=options['dry_run'])
+
+        prefix = '[dry-run] ' if metrics['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}Streaks reset: {metrics["workout_streaks_reset"]} workout, '
+            f'{metrics["meal_streaks_reset"]} meal ({metrics["duration_ms"]} ms).'
+        ))
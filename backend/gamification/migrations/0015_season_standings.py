@@ -0,0 +1,73 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamification', '0014_remove_gamificationbonus_gamificatio_user_id_3ed35b_idx_and_more'),
+        ('groups', '0009_group_summary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='season',
+            name='closed_at',
+            field=models.DateTimeField(blank=True, editable=False, help_text='Data em que a classificação final foi congelada', null=True, verbose_name='Encerrada em'),
+        ),
+        migrations.CreateModel(
+            name='SeasonGroupStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.FloatField(default=0.0)),
+                ('position', models.PositiveIntegerField()),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_standings', to='groups.group')),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gamification.season')),
+            ],
+            options={
+                'verbose_name': 'Season group standing',
+                'verbose_name_plural': 'Season group standings',
+                'ordering': ['position', 'group_id'],
+                'indexes': [models.Index(fields=['season', 'position'], name='gamificatio_season__b53b8e_idx')],
+                'constraints': [models.UniqueConstraint(fields=('season', 'group'), name='unique_season_group_standing')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SeasonScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='scores', to='gamification.season')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_scores', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Season score',
+                'verbose_name_plural': 'Season scores',
+                'indexes': [models.Index(fields=['season', '-points'], name='gamificatio_season__b0f3af_idx')],
+                'constraints': [models.UniqueConstraint(fields=('season', 'user'), name='unique_season_score')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SeasonStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('points', models.FloatField(default=0.0)),
+                ('position', models.PositiveIntegerField()),
+                ('season', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gamification.season')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='season_standings', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Season standing',
+                'verbose_name_plural': 'Season standings',
+                'ordering': ['position', 'user_id'],
+                'indexes': [models.Index(fields=['season', 'position'], name='gamificatio_season__07e1b5_idx')],
+                'constraints': [models.UniqueConstraint(fields=('season', 'user'), name='unique_season_standing')],
+            },
+        ),
+    ]
@@ -4,9 +4,13 @@ from datetime import datetime
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.core.cache import cache
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import F
+from django.utils import timezone
 
 from clients.models import Client
+from core.utils import local_date
 from gamification.exceptions import MultipleSeasonsFoundError
 
 DEFAULT_MULTIPLIER_WORKOUT_STREAK = {
@@ -132,6 +136,13 @@ class Season(models.Model):
     start_date = models.DateField(help_text="Data de início da temporada", verbose_name="Data de Início")
     end_date = models.DateField(help_text="Data de término da temporada", verbose_name="Data de Término")
     description = models.TextField(blank=True, help_text="Descrição da temporada", verbose_name="Descrição")
+    closed_at = models.DateTimeField(
+        null=True, blank=True, editable=False, help_text="Data em que a classificação final foi congelada",
+        verbose_name="Encerrada em"
+    )
+
+    ACTIVE_CACHE_KEY = 'active-season:{client_id}:{day}'
+    ACTIVE_CACHE_TIMEOUT = 60 * 60
 
     def __str__(self):
         return self.name
@@ -141,6 +152,37 @@ class Season(models.Model):
         verbose_name_plural = "Seasons"
         unique_together = ("client", "start_date", "end_date")
 
+    @classmethod
+    def _active_key(cls, client_id):
+        return cls.ACTIVE_CACHE_KEY.format(client_id=client_id, day=local_date(timezone.now()))
+
+    @classmethod
+    def active_id_for_client(cls, client_id):
+        """
+        Return the id of the open season of the client covering today, or None.
+        The answer is kept in the shared cache for the day (only after commit when read inside a transaction);
+        Season changes clear it.
+        """
+        key = cls._active_key(client_id)
+        season_id = cache.get(key)
+
+        if season_id is None:
+            today = local_date(timezone.now())
+            season_id = cls.objects.filter(
+                client_id=client_id, start_date__lte=today, end_date__gte=today, closed_at__isnull=True
+            ).order_by('-start_date').values_list('id', flat=True).first() or 0
+
+            if connection.in_atomic_block:
+                transaction.on_commit(lambda: cache.set(key, season_id, cls.ACTIVE_CACHE_TIMEOUT))
+            else:
+                cache.set(key, season_id, cls.ACTIVE_CACHE_TIMEOUT)
+
+        return season_id or None
+
+    @classmethod
+    def clear_active_cache(cls, client_id):
+        cache.delete(cls._active_key(client_id))
+
     @classmethod
     def get_user_active_season(cls, user):
         client = user.profile.employer
@@ -153,6 +195,119 @@ class Season(models.Model):
         return season
 
 
+class SeasonScore(models.Model):
+    """
+    Points a user earned during a season.
+    Every XP change (Gamification.add_xp/remove_xp) is added to the row of the user's open season with a single
+    UPDATE, so in-season standings read one row per user instead of re-scanning check-ins and meals.
+    """
+    season = models.ForeignKey(Season, on_delete=models.CASCADE, related_name="scores")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="season_scores")
+    points = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Season score"
+        verbose_name_plural = "Season scores"
+        constraints = [
+            models.UniqueConstraint(fields=["season", "user"], name="unique_season_score"),
+        ]
+        indexes = [
+            models.Index(fields=["season", "-points"]),
+        ]
+
+    def __str__(self):
+        return f"{self.points} points of {self.user_id} in season {self.season_id}"
+
+    @classmethod
+    def add_points(cls, user, points):
+        """
+        Add ``points`` (negative to discount) to the user's score in the open season of their employer, if any.
+        """
+        if not points:
+            return
+
+        season_id = Season.active_id_for_client(user.profile.employer_id)
+
+        if season_id is None:
+            return
+
+        lookup = {'season_id': season_id, 'user_id': user.id}
+        updated = cls.objects.filter(**lookup).update(points=F('points') + points, updated_at=timezone.now())
+
+        if updated:
+            return
+
+        try:
+            with transaction.atomic():
+                cls.objects.create(points=points, **lookup)
+        except IntegrityError:
+            # Created by a concurrent request in the meantime
+            cls.objects.filter(**lookup).update(points=F('points') + points, updated_at=timezone.now())
+
+
+class SeasonSnapshot(models.Model):
+    """
+    Base of the rows frozen when a season closes: they are written once and refuse later updates.
+    """
+    season = models.ForeignKey(Season, on_delete=models.CASCADE)
+    points = models.FloatField(default=0.0)
+    position = models.PositiveIntegerField()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError(f"{self._meta.verbose_name} rows are immutable.")
+
+        super().save(*args, **kwargs)
+
+
+class SeasonStanding(SeasonSnapshot):
+    """
+    Final points and position of a user in a closed season.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="season_standings")
+
+    class Meta:
+        verbose_name = "Season standing"
+        verbose_name_plural = "Season standings"
+        ordering = ["position", "user_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["season", "user"], name="unique_season_standing"),
+        ]
+        indexes = [
+            models.Index(fields=["season", "position"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.position} {self.user_id} in season {self.season_id}"
+
+
+class SeasonGroupStanding(SeasonSnapshot):
+    """
+    Final points (sum of the season points of its active members), member count and position of a client group in
+    a closed season.
+    """
+    group = models.ForeignKey("groups.Group", on_delete=models.CASCADE, related_name="season_standings")
+    member_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Season group standing"
+        verbose_name_plural = "Season group standings"
+        ordering = ["position", "group_id"]
+        constraints = [
+            models.UniqueConstraint(fields=["season", "group"], name="unique_season_group_standing"),
+        ]
+        indexes = [
+            models.Index(fields=["season", "position"]),
+        ]
+
+    def __str__(self):
+        return f"#{self.position} group {self.group_id} in season {self.season_id}"
+
+
 class GamificationBonus(models.Model):
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name="gamification_bonuses")
     score = models.FloatField(help_text="Pontuacao de bonus aplicada ao objeto")
@@ -1,17 +1,40 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from datetime import datetime
 import calendar
 from faulthandler import dump_traceback
 from math import floor
 
 from django.contrib.auth.models import User
-from django.db.models import Sum
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Count, F, FilteredRelation, Q, Sum, Window
+from django.db.models.functions import Coalesce, Rank
+from django.utils import timezone
 from django.utils.functional import cached_property
 
+from core.utils import local_date
 from gamification.exceptions import NoSeasonFoundError
-from gamification.models import GamificationSettings, Season
+from gamification.models import GamificationSettings, Season, SeasonGroupStanding, SeasonScore, SeasonStanding
 from groups.exceptions import MultipleGroupMembersError, NothingMainGroupError
-from groups.models import Group
+from groups.models import Group, GroupMembers
+from groups.services import only_member
+
+
+def workout_day_points(total_duration_min, base_xp, multiplier, workout_minutes, max_workout_xp):
+    """
+    Return the points of a workout day from its total minutes.
+    Shared by the check-in path and the bulk recalculation, so both score days with the same rules.
+    """
+    if total_duration_min < workout_minutes:
+        points_today = float(base_xp / 2) * multiplier
+    elif total_duration_min == workout_minutes:
+        points_today = float(base_xp) * multiplier
+    elif workout_minutes < total_duration_min < workout_minutes * 2:
+        points_today = float(base_xp * 1.5) * multiplier
+    else:
+        points_today = float(base_xp * 2) * multiplier
+
+    return min(points_today, float(max_workout_xp))
 
 
 class GamificationService(ABC):
@@ -111,63 +134,43 @@ class WorkoutGamification(GamificationService):
         return "multiplier_workout_streak"
 
     def _calculate_day_total_points(self, user, total_duration_min):
-        base_points = self.base_xp(user)
-        workout_minutes_base = self.settings.workout_minutes
-        multiplier = self.get_multiplier(user)
-
-        if total_duration_min < workout_minutes_base:
-            points_today = float(base_points / 2) * multiplier
-        elif total_duration_min == workout_minutes_base:
-            points_today = float(base_points) * multiplier
-        elif workout_minutes_base < total_duration_min < workout_minutes_base * 2:
-            points_today = float(base_points * 1.5) * multiplier
-        else:
-            points_today = float(base_points * 2) * multiplier
+        return workout_day_points(
+            total_duration_min,
+            self.base_xp(user),
+            self.get_multiplier(user),
+            self.settings.workout_minutes,
+            self.settings.max_workout_xp,
+        )
 
-        return min(points_today, float(self.settings.max_workout_xp))
+    def day_points(self, user, total_duration):
+        """
+        Return the points of a whole workout day from its total duration.
+        """
+        return self._calculate_day_total_points(user, total_duration.total_seconds() / 60)
 
     def recalculate_day_points(self, user, workout_day):
-        workouts_in_day = user.workouts.filter(workout_date__date=workout_day)
-        workouts_count = workouts_in_day.count()
-
-        if workouts_count == 0:
-            return 0.0
-
-        total_duration_in_day = workouts_in_day.aggregate(total_duration=Sum('duration'))['total_duration'] or timedelta(0)
-        total_duration_min = total_duration_in_day.total_seconds() / 60
-        points_today = self._calculate_day_total_points(user, total_duration_min)
-        points_per_workout = points_today / workouts_count
+        from workouts.models import WorkoutDailySummary
 
-        workouts_in_day.update(base_points=points_per_workout)
+        summary = WorkoutDailySummary.rebuild(user, workout_day)
 
-        return points_today
+        return summary.awarded_points if summary else 0.0
 
     def calculate(self, user, *args):
-        # Create mode: new check-in is being saved and duration/date are provided.
+        # Create mode: points each workout of the day gets once a new check-in with duration/date is added.
         if len(args) == 2:
-            duration, workout_date = args
-            workouts_in_day = user.workouts.filter(workout_date__date=workout_date.date())
-            total_duration_in_day = workouts_in_day.aggregate(total_duration=Sum('duration'))['total_duration'] or timedelta(0)
-
-            total_duration_min = (total_duration_in_day.total_seconds() / 60) + (duration.total_seconds() / 60)
-            points_today = self._calculate_day_total_points(user, total_duration_min)
-
-            total_workouts_in_day = workouts_in_day.count() + 1
-            points_per_workout = points_today / total_workouts_in_day
+            from workouts.models import WorkoutDailySummary
 
-            workouts_in_day.update(base_points=points_per_workout)
+            duration, workout_date = args
+            summary = WorkoutDailySummary.get_for_day(user.id, local_date(workout_date))
+            points_today = self.day_points(user, summary.total_duration + duration)
 
-            return points_per_workout
+            return points_today / (summary.workout_count + 1)
 
         # Recalculation mode: no args, recompute all workouts that remain for this user.
         if len(args) == 0:
-            workout_days = user.workouts.order_by().values_list('workout_date__date', flat=True).distinct()
-            total_points = 0.0
-
-            for workout_day in workout_days:
-                total_points += self.recalculate_day_points(user, workout_day)
+            from workouts.services import WorkoutPointsRecalculationService
 
-            return total_points
+            return WorkoutPointsRecalculationService(user_ids=[user.id]).run()['total_points']
 
         raise ValueError(
             "WorkoutGamification.calculate expects either: "
@@ -209,10 +212,12 @@ class Gamification:
 
     @staticmethod
     def set_xp(user, xp):
+        SeasonScore.add_points(user, xp - user.profile.score)
         user.profile.score = xp
         user.profile.save()
 
     def add_xp(self, user, xp):
+        SeasonScore.add_points(user, xp)
         user.profile.score += xp
 
         # Recalculate level based on current score
@@ -222,12 +227,15 @@ class Gamification:
         user.profile.save()
 
     def remove_xp(self, user, xp):
+        previous_score = user.profile.score
         user.profile.score -= xp
 
         # Ensure score doesn't go negative
         if user.profile.score < 0:
             user.profile.score = 0
 
+        SeasonScore.add_points(user, user.profile.score - previous_score)
+
         # Recalculate level based on current score
         new_level = self.convert_to_level(user.profile.score)
         user.profile.level = new_level
@@ -278,3 +286,139 @@ class Gamification:
         next_level = self.get_level(user) + 1
 
         return max(int(self.convert_to_xp(next_level) - user_xp), 0)
+
+
+class SeasonStandings:
+    """
+    User and group standings of a season.
+    Closed seasons are served from their frozen SeasonStanding/SeasonGroupStanding rows; open ones are ranked with
+    RANK() over the maintained SeasonScore rows, and groups sum the season points of their active members.
+    """
+    USER_FIELDS = ('user_id', 'user__username', 'user__first_name', 'user__last_name', 'user__profile__photo')
+
+    def __init__(self, season):
+        self.season = season
+        self.closed = season.closed_at is not None
+
+    def _ranked_scores(self):
+        return (
+            SeasonScore.objects.filter(season=self.season)
+            .annotate(position=Window(Rank(), order_by=F('points').desc()))
+            .values(*self.USER_FIELDS, 'points', 'position')
+            .order_by('-points', 'user_id')
+        )
+
+    def _user_rows(self):
+        if self.closed:
+            return SeasonStanding.objects.filter(season=self.season).values(*self.USER_FIELDS, 'points', 'position')
+
+        return self._ranked_scores()
+
+    def _ranked_groups(self):
+        client_groups = Group.objects.filter(Q(client=self.season.client_id) | Q(clients=self.season.client_id))
+        totals = {
+            row['group_id']: row
+            for row in GroupMembers.objects.filter(group__in=client_groups, pending=False)
+            .annotate(season_score=FilteredRelation(
+                'member__season_scores', condition=Q(member__season_scores__season=self.season)
+            ))
+            .order_by().values('group_id')
+            .annotate(member_count=Count('id'), points=Coalesce(Sum('season_score__points'), 0.0))
+        }
+        rows = sorted(
+            (
+                {
+                    'group_id': group_id,
+                    'group__name': name,
+                    'points': totals.get(group_id, {}).get('points', 0.0),
+                    'member_count': totals.get(group_id, {}).get('member_count', 0),
+                }
+                for group_id, name in client_groups.distinct().values_list('id', 'name')
+            ),
+            key=lambda row: (-row['points'], row['group_id'])
+        )
+
+        # Same ties as RANK(): equal points share a position and leave a gap after them
+        for index, row in enumerate(rows):
+            tied = index and row['points'] == rows[index - 1]['points']
+            row['position'] = rows[index - 1]['position'] if tied else index + 1
+
+        return rows
+
+    @staticmethod
+    def _user_entry(row):
+        return {
+            'id': row['user_id'],
+            'username': row['user__username'],
+            'full_name': f"{row['user__first_name']} {row['user__last_name']}".strip(),
+            'photo': default_storage.url(row['user__profile__photo']) if row['user__profile__photo'] else None,
+            'points': row['points'],
+            'position': row['position'],
+        }
+
+    @staticmethod
+    def _group_entry(row):
+        return {
+            'id': row['group_id'],
+            'name': row['group__name'],
+            'points': row['points'],
+            'member_count': row['member_count'],
+            'position': row['position'],
+        }
+
+    def top(self, limit):
+        return [self._user_entry(row) for row in self._user_rows()[:limit]]
+
+    def user(self, user_id):
+        """
+        Return the entry of ``user_id``, or None when they scored nothing in the season.
+        """
+        rows = self._user_rows()
+
+        if self.closed:
+            row = rows.filter(user_id=user_id).first()
+        else:
+            row = rows.filter(only_member(user_id, 'position', user_field='user_id')).first()
+
+        return self._user_entry(row) if row else None
+
+    def groups(self):
+        if self.closed:
+            rows = SeasonGroupStanding.objects.filter(season=self.season).values(
+                'group_id', 'group__name', 'points', 'member_count', 'position'
+            )
+        else:
+            rows = self._ranked_groups()
+
+        return [self._group_entry(row) for row in rows]
+
+
+def close_season(season, now=None):
+    """
+    Freeze the final user and group standings of ``season`` and mark it closed, so later reads use the snapshot and
+    XP stops accruing to it. Returns the number of user and group standings written, or None when the season was
+    already closed.
+    """
+    with transaction.atomic():
+        season = Season.objects.select_for_update().get(pk=season.pk)
+
+        if season.closed_at is not None:
+            return None
+
+        standings = SeasonStandings(season)
+        users = SeasonStanding.objects.bulk_create([
+            SeasonStanding(season=season, user_id=row['user_id'], points=row['points'], position=row['position'])
+            for row in standings._ranked_scores()
+        ], batch_size=1000)
+        groups = SeasonGroupStanding.objects.bulk_create([
+            SeasonGroupStanding(
+                season=season, group_id=row['group_id'], points=row['points'], member_count=row['member_count'],
+                position=row['position'],
+            )
+            for row in standings._ranked_groups()
+        ], batch_size=1000)
+
+        season.closed_at = now or timezone.now()
+        season.save(update_fields=['closed_at'])
+
+    return len(users), len(groups)
@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Season
+
+
+@receiver(post_save, sender=Season)
+@receiver(post_delete, sender=Season)
+def clear_active_season(sender, instance, **kwargs):
+    """
+    Drop the cached open season of the client; cleared again on commit so lookups made meanwhile are dropped too.
+    """
+    Season.clear_active_cache(instance.client_id)
+    transaction.on_commit(lambda: Season.clear_active_cache(instance.client_id))
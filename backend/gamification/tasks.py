@@ -0,0 +1,146 @@
+"""
+Scheduled gamification jobs.
+
+reset_broken_streaks runs once a day (see notifications.scheduler) and replaces per-user calls to
+check_and_reset_streak_if_ended: broken streaks of every user are selected with set-based queries over the
+workout week and meal day counters and reset with bulk UPDATEs.
+
+close_ended_seasons runs once a day as well and freezes the standings of the seasons that ended.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+from django_apscheduler.util import close_old_connections
+
+from core.utils import local_date, local_day_range, week_start_for
+from gamification.models import Season
+from gamification.services import close_season
+from nutrition.models import MealConfig, MealDayCount, MealStreak
+from workouts.models import WorkoutStreak, WorkoutWeekCount
+
+logger = logging.getLogger(__name__)
+
+RESET_CHUNK_SIZE = 1000
+
+
+def broken_workout_streaks(now):
+    """
+    Return the active workout streaks that WorkoutStreak.check_streak_ended(now) considers ended: fewer check-ins
+    than the frequency in the current and previous weeks and no workout in the current week.
+    """
+    week_start = week_start_for(local_date(now))
+    week_start_at, _ = local_day_range(week_start)
+    week_end_at, _ = local_day_range(week_start + timedelta(days=7))
+
+    def week_count(start):
+        return Coalesce(
+            Subquery(WorkoutWeekCount.objects.filter(user=OuterRef('user'), week_start=start).values('count')[:1]),
+            0
+        )
+
+    return WorkoutStreak.objects.filter(current_streak__gt=0).annotate(
+        weekly_checkins=week_count(week_start),
+        previous_week_checkins=week_count(week_start - timedelta(days=7)),
+    ).filter(
+        weekly_checkins__lt=F('frequency'),
+        previous_week_checkins__lt=F('frequency'),
+    ).exclude(
+        last_workout_datetime__gte=week_start_at,
+        last_workout_datetime__lt=week_end_at,
+    )
+
+
+def broken_meal_streaks(now):
+    """
+    Return the active meal streaks that MealStreak.check_streak_ended(now) considers ended: the day of the last
+    meal did not reach the expected number of meals.
+    """
+    today = local_date(now)
+    expected_meals_count = MealConfig.all_meals_count()
+    meals_on_day = Subquery(
+        MealDayCount.objects.filter(user=OuterRef('user'), date=OuterRef('last_meal_day')).values('count')[:1]
+    )
+
+    return MealStreak.objects.filter(current_streak__gt=0, last_meal_datetime__isnull=False).annotate(
+        last_meal_day=TruncDate('last_meal_datetime'),
+    ).annotate(
+        meals_on_last_day=Coalesce(meals_on_day, 0),
+    ).filter(
+        Q(last_meal_day=today, meals_on_last_day__gt=expected_meals_count) |
+        (~Q(last_meal_day=today) & Q(meals_on_last_day__lt=expected_meals_count))
+    )
+
+
+def _reset(model, ids):
+    for start in range(0, len(ids), RESET_CHUNK_SIZE):
+        model.objects.filter(id__in=ids[start:start + RESET_CHUNK_SIZE]).update(current_streak=0)
+
+
+@close_old_connections
+def reset_broken_streaks(now=None, dry_run=False):
+    """
+    Reset every broken workout and meal streak to zero.
+    Returns the run metrics (streaks reset per kind and duration); nothing is written on a dry run.
+    """
+    started = time.monotonic()
+    now = now or timezone.now()
+
+    workout_ids = list(broken_workout_streaks(now).values_list('id', flat=True))
+    meal_ids = list(broken_meal_streaks(now).values_list('id', flat=True))
+
+    if not dry_run:
+        with transaction.atomic():
+            _reset(WorkoutStreak, workout_ids)
+            _reset(MealStreak, meal_ids)
+
+    metrics = {
+        'workout_streaks_reset': len(workout_ids),
+        'meal_streaks_reset': len(meal_ids),
+        'dry_run': dry_run,
+        'duration_ms': round((time.monotonic() - started) * 1000, 2),
+    }
+    logger.info(
+        '[streak_reset] workouts=%(workout_streaks_reset)s meals=%(meal_streaks_reset)s '
+        'dry_run=%(dry_run)s duration=%(duration_ms)sms',
+        metrics
+    )
+
+    return metrics
+
+
+@close_old_connections
+def close_ended_seasons(now=None):
+    """
+    Snapshot the standings of every open season whose end date has passed.
+    Returns the run metrics (seasons closed and standings written).
+    """
+    started = time.monotonic()
+    now = now or timezone.now()
+    closed = users = groups = 0
+
+    for season in Season.objects.filter(end_date__lt=local_date(now), closed_at__isnull=True).order_by('id'):
+        written = close_season(season, now=now)
+
+        if written is not None:
+            closed += 1
+            users += written[0]
+            groups += written[1]
+
+    metrics = {
+        'seasons_closed': closed,
+        'user_standings': users,
+        'group_standings': groups,
+        'duration_ms': round((time.monotonic() - started) * 1000, 2),
+    }
+    logger.info(
+        '[season_close] seasons=%(seasons_closed)s users=%(user_standings)s groups=%(group_standings)s '
+        'duration=%(duration_ms)sms',
+        metrics
+    )
+
+    return metrics
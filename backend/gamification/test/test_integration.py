@@ -276,9 +276,6 @@ class SeasonBonusIntegrationTest(TestCase):
         GroupMembers.objects.filter(group=self.group, member=self.high_score_user).update(pending=False)
         GroupMembers.objects.create(group=self.group, member=self.low_score_user, pending=False)
 
-        self.low_profile.groups.add(self.group)
-        self.high_profile.groups.add(self.group)
-
         # Create season ending soon
         self.season = Season.objects.create(
             client=self.client_obj,
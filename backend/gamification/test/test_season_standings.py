@@ -0,0 +1,201 @@
+"""
+Tests for the season scores, standings snapshots and standings endpoint
+"""
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from core.utils import local_date
+from gamification.models import Season, SeasonGroupStanding, SeasonScore, SeasonStanding
+from gamification.services import Gamification, SeasonStandings, close_season
+from gamification.tasks import close_ended_seasons
+from groups.models import Group, GroupMembers
+from profiles.models import Profile
+
+
+class SeasonStandingsTest(TestCase):
+    """Season points accrue while the season is open and are frozen when it closes"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.api = APIClient()
+        self.today = local_date(timezone.now())
+        self.owner = User.objects.create_user(username='seasonowner', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Season Company',
+            cnpj='11222333000155',
+            contact_email='season@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.other_client = Client.objects.create(
+            name='Other Season Company',
+            cnpj='11222333000156',
+            contact_email='other-season@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.season = Season.objects.create(
+            client=self.client_obj, name='Current', start_date=self.today - timedelta(days=10),
+            end_date=self.today + timedelta(days=10),
+        )
+        self.team_a = Group.objects.create(name='Team A', owner=self.owner, created_by=self.owner)
+        self.team_b = Group.objects.create(name='Team B', owner=self.owner, created_by=self.owner)
+        self.client_obj.groups.add(self.team_a, self.team_b)
+        self.users = []
+
+        for index in range(3):
+            user = User.objects.create_user(username=f'seasonuser{index}', password='pass1234')
+            Profile.objects.create(user=user, employer=self.client_obj, score=100.0)
+            self.users.append(User.objects.select_related('profile').get(id=user.id))
+
+        GroupMembers.objects.create(group=self.team_a, member=self.users[0], pending=False)
+        GroupMembers.objects.create(group=self.team_a, member=self.users[1], pending=False)
+        GroupMembers.objects.create(group=self.team_b, member=self.users[2], pending=False)
+
+    def _points(self, user, season=None):
+        score = SeasonScore.objects.filter(season=season or self.season, user=user).first()
+
+        return score.points if score else None
+
+    def _score(self, *points):
+        gamification = Gamification()
+
+        for user, amount in zip(self.users, points):
+            gamification.add_xp(user, amount)
+
+    def test_xp_changes_accrue_to_the_open_season(self):
+        gamification = Gamification()
+        gamification.add_xp(self.users[0], 10.0)
+        gamification.add_xp(self.users[0], 5.0)
+        gamification.remove_xp(self.users[0], 3.0)
+
+        self.assertEqual(self._points(self.users[0]), 12.0)
+        self.assertIsNone(self._points(self.users[1]))
+
+    def test_removed_xp_only_discounts_what_the_profile_lost(self):
+        self.users[0].profile.score = 2.0
+        self.users[0].profile.save()
+
+        Gamification().remove_xp(self.users[0], 5.0)
+
+        self.assertEqual(self._points(self.users[0]), -2.0)
+
+    def test_no_points_accrue_without_an_open_season(self):
+        Season.objects.filter(id=self.season.id).update(end_date=self.today - timedelta(days=1))
+        Season.clear_active_cache(self.client_obj.id)
+
+        Gamification().add_xp(self.users[0], 10.0)
+
+        self.assertFalse(SeasonScore.objects.exists())
+
+    def test_open_season_standings_are_ranked_live(self):
+        self._score(10.0, 30.0, 10.0)
+
+        standings = SeasonStandings(self.season)
+
+        self.assertFalse(standings.closed)
+        self.assertEqual(
+            [(entry['id'], entry['points'], entry['position']) for entry in standings.top(10)],
+            [(self.users[1].id, 30.0, 1), (self.users[0].id, 10.0, 2), (self.users[2].id, 10.0, 2)]
+        )
+        self.assertEqual(standings.user(self.users[2].id)['position'], 2)
+        self.assertIsNone(standings.user(self.owner.id))
+        self.assertEqual(
+            [(entry['id'], entry['points'], entry['member_count'], entry['position']) for entry in standings.groups()],
+            [(self.team_a.id, 40.0, 2, 1), (self.team_b.id, 10.0, 1, 2)]
+        )
+
+    def test_closing_freezes_the_standings(self):
+        self._score(10.0, 30.0, 20.0)
+
+        self.assertEqual(close_season(self.season), (3, 2))
+        self.assertIsNone(close_season(self.season))
+
+        self.season.refresh_from_db()
+        self.assertIsNotNone(self.season.closed_at)
+
+        # Later XP neither accrues to the closed season nor changes its snapshot
+        Gamification().add_xp(self.users[0], 100.0)
+        GroupMembers.objects.filter(member=self.users[2]).delete()
+
+        self.assertEqual(self._points(self.users[0]), 10.0)
+        standings = SeasonStandings(self.season)
+        self.assertTrue(standings.closed)
+        self.assertEqual([entry['id'] for entry in standings.top(10)], [user.id for user in self.users[1:]] + [self.users[0].id])
+        self.assertEqual(standings.user(self.users[0].id)['position'], 3)
+        self.assertEqual(
+            [(entry['id'], entry['points'], entry['member_count']) for entry in standings.groups()],
+            [(self.team_a.id, 40.0, 2), (self.team_b.id, 20.0, 1)]
+        )
+
+    def test_snapshots_are_immutable(self):
+        self._score(10.0)
+        close_season(self.season)
+
+        standing = SeasonStanding.objects.get(season=self.season, user=self.users[0])
+        standing.points = 1000.0
+
+        with self.assertRaises(ValueError):
+            standing.save()
+
+        group_standing = SeasonGroupStanding.objects.get(season=self.season, group=self.team_a)
+
+        with self.assertRaises(ValueError):
+            group_standing.save()
+
+    def test_scheduled_job_closes_only_ended_seasons(self):
+        ended = Season.objects.create(
+            client=self.other_client, name='Ended', start_date=self.today - timedelta(days=40),
+            end_date=self.today - timedelta(days=1),
+        )
+
+        metrics = close_ended_seasons()
+
+        self.assertEqual(metrics['seasons_closed'], 1)
+        ended.refresh_from_db()
+        self.season.refresh_from_db()
+        self.assertIsNotNone(ended.closed_at)
+        self.assertIsNone(self.season.closed_at)
+        self.assertEqual(close_ended_seasons()['seasons_closed'], 0)
+
+    def test_standings_endpoint(self):
+        self._score(10.0, 30.0, 20.0)
+        self.api.force_authenticate(self.users[0])
+        url = reverse('season-standings', kwargs={'pk': self.season.id})
+
+        response = self.api.get(url, {'top': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['closed'])
+        self.assertEqual([entry['id'] for entry in response.data['top']], [self.users[1].id, self.users[2].id])
+        self.assertEqual(response.data['me']['position'], 3)
+        self.assertEqual(len(response.data['groups']), 2)
+
+        close_season(self.season)
+        response = self.api.get(url)
+
+        self.assertTrue(response.data['closed'])
+        self.assertEqual(len(response.data['top']), 3)
+
+    def test_standings_endpoint_validation_and_scope(self):
+        foreign = Season.objects.create(
+            client=self.other_client, name='Foreign', start_date=self.today, end_date=self.today + timedelta(days=5),
+        )
+        self.api.force_authenticate(self.users[0])
+
+        response = self.api.get(reverse('season-standings', kwargs={'pk': foreign.id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.api.get(reverse('season-standings', kwargs={'pk': self.season.id}), {'top': 'x'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
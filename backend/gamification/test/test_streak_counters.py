@@ -0,0 +1,176 @@
+"""
+Equivalence tests between the streak counters and the rules computed from the raw check-ins/meals
+"""
+import random
+from datetime import datetime, time, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+from django.utils import timezone
+
+from clients.models import Client
+from core.utils import local_date, local_day_range, week_start_for
+from gamification.services import WorkoutGamification
+from nutrition.models import Meal, MealConfig, MealDayCount, MealStreak
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin, WorkoutStreak, WorkoutWeekCount
+
+SEEDS = range(5)
+OPERATIONS = 12
+
+
+def reference_workout_streak_ended(streak, current_date):
+    """The original weekly rule, counting the check-ins between Sunday 00:00 and Saturday 23:59:59"""
+    days_since_sunday = current_date.weekday() + 1
+
+    if days_since_sunday == 7:
+        days_since_sunday = 0
+
+    week_start = current_date - timedelta(days=days_since_sunday)
+    week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
+    previous_week_start = week_start - timedelta(days=7)
+    previous_week_end = week_end - timedelta(days=7)
+
+    checkins_count = WorkoutCheckin.objects.filter(user=streak.user).aggregate(
+        current_week=Count('id', filter=Q(workout_date__gte=week_start, workout_date__lte=week_end)),
+        previous_week=Count('id', filter=Q(workout_date__gte=previous_week_start, workout_date__lte=previous_week_end))
+    )
+    weekly_checkins = checkins_count['current_week'] or 0
+    previous_week_checkins = checkins_count['previous_week'] or 0
+
+    if weekly_checkins < streak.frequency:
+        if week_start <= streak.last_workout_datetime <= week_end:
+            return False
+        else:
+            if previous_week_checkins < streak.frequency:
+                return True
+
+    return False
+
+
+def reference_meal_streak_ended(streak, meal_datetime):
+    """The original daily rule, counting the meals on the day of the last meal"""
+    meal_date = meal_datetime.astimezone().date()
+    last_meal_date = streak.last_meal_datetime.astimezone().date()
+    expected_meals_count = MealConfig.all_meals_count()
+
+    if last_meal_date == meal_date:
+        meals_on_day = Meal.objects.filter(user=streak.user, meal_time__date=meal_date).count()
+
+        return meals_on_day > expected_meals_count
+    else:
+        meals_on_last_day = Meal.objects.filter(user=streak.user, meal_time__date=last_meal_date).count()
+
+        return meals_on_last_day < expected_meals_count
+
+
+class StreakCountersTest(TestCase):
+    """Randomized create/delete sequences keep the counters equivalent to the raw rules"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username='streakuser', email='streak@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Streak Company',
+            cnpj='11222333000110',
+            contact_email='streak@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        self.meal_configs = [
+            MealConfig.objects.create(meal_name=name, interval_start=time(0, 0), interval_end=time(23, 59))
+            for name in ('breakfast', 'lunch', 'dinner')
+        ]
+        # Whole minutes keep every generated datetime out of the last second the original week range skipped
+        self.now = timezone.now().replace(second=0, microsecond=0)
+
+    def _random_datetime(self, rng, days=28):
+        return self.now - timedelta(days=rng.randrange(days), minutes=rng.randrange(24 * 60))
+
+    def test_workout_counters_match_raw_rule(self):
+        """WorkoutStreak.check_streak_ended matches the rule counted from the check-ins"""
+        for seed in SEEDS:
+            rng = random.Random(seed)
+            for workout in WorkoutCheckin.objects.filter(user=self.user):
+                workout.delete()
+
+            for _ in range(OPERATIONS):
+                workouts = list(WorkoutCheckin.objects.filter(user=self.user))
+
+                if workouts and rng.random() < 0.3:
+                    rng.choice(workouts).delete()
+                else:
+                    WorkoutCheckin.objects.create(
+                        user=self.user,
+                        workout_date=self._random_datetime(rng),
+                        duration=timedelta(minutes=rng.randrange(10, 120))
+                    )
+
+                streak = WorkoutStreak.objects.get(user=self.user)
+                streak.frequency = rng.randrange(1, 6)
+                streak.last_workout_datetime = self._random_datetime(rng)
+                current_date = self._random_datetime(rng, days=21)
+
+                # A local datetime puts the original week boundaries on local midnights, like the weekly counters
+                self.assertEqual(
+                    streak.check_streak_ended(current_date),
+                    reference_workout_streak_ended(streak, timezone.localtime(current_date)),
+                    f'seed {seed}'
+                )
+
+    def test_meal_counters_match_raw_rule(self):
+        """MealStreak.check_streak_ended matches the rule counted from the meals"""
+        for seed in SEEDS:
+            rng = random.Random(seed)
+            for meal in Meal.objects.filter(user=self.user):
+                meal.delete()
+
+            for _ in range(OPERATIONS):
+                meals = list(Meal.objects.filter(user=self.user))
+
+                if meals and rng.random() < 0.3:
+                    rng.choice(meals).delete()
+                else:
+                    meal_time = self._random_datetime(rng, days=4)
+                    meal_type = rng.choice(self.meal_configs)
+                    start, end = local_day_range(local_date(meal_time))
+
+                    if not Meal.objects.filter(
+                        user=self.user, meal_type=meal_type, meal_time__gte=start, meal_time__lt=end
+                    ).exists():
+                        Meal.objects.create(user=self.user, meal_type=meal_type, meal_time=meal_time)
+
+                streak = MealStreak.objects.get(user=self.user)
+                streak.last_meal_datetime = self._random_datetime(rng, days=4)
+                meal_datetime = rng.choice([streak.last_meal_datetime, self._random_datetime(rng, days=4)])
+
+                self.assertEqual(
+                    streak.check_streak_ended(meal_datetime),
+                    reference_meal_streak_ended(streak, meal_datetime),
+                    f'seed {seed}'
+                )
+
+    def test_rebuild_command(self):
+        """The command recounts drifted counters"""
+        workout_date = self.now - timedelta(days=1)
+        meal_time = timezone.make_aware(datetime.combine(local_date(self.now) - timedelta(days=1), time(12)))
+        WorkoutCheckin.objects.create(user=self.user, workout_date=workout_date, duration=timedelta(minutes=30))
+        Meal.objects.create(user=self.user, meal_type=self.meal_configs[0], meal_time=meal_time)
+        WorkoutWeekCount.objects.update(count=9)
+        MealDayCount.objects.all().delete()
+
+        call_command('rebuild_streak_counters', stdout=StringIO())
+
+        self.assertEqual(WorkoutWeekCount.get_counts(self.user.id, week_start_for(local_date(workout_date))), [1])
+        self.assertEqual(MealDayCount.get_counts(self.user.id, local_date(meal_time)), [1])
@@ -0,0 +1,101 @@
+"""
+Tests for the scheduled gamification jobs
+"""
+import random
+from datetime import time, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from clients.models import Client
+from core.utils import local_date, local_day_range
+from gamification.services import WorkoutGamification
+from gamification.tasks import reset_broken_streaks
+from nutrition.models import Meal, MealConfig, MealStreak
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin, WorkoutStreak
+
+
+class ResetBrokenStreaksTest(TestCase):
+    """The set-based reset matches the per-user streak rules"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.now = timezone.now()
+        self.owner = User.objects.create_user(username='taskowner', email='owner@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Task Company',
+            cnpj='11222333000121',
+            contact_email='task@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.meal_configs = [
+            MealConfig.objects.create(meal_name=name, interval_start=time(0, 0), interval_end=time(23, 59))
+            for name in ('breakfast', 'lunch')
+        ]
+        rng = random.Random(35)
+
+        for index in range(8):
+            user = User.objects.create_user(username=f'taskuser{index}', password='pass1234')
+            Profile.objects.create(user=user, employer=self.client_obj)
+
+            for _ in range(rng.randrange(1, 6)):
+                WorkoutCheckin.objects.create(
+                    user=user,
+                    workout_date=self.now - timedelta(days=rng.randrange(20), minutes=rng.randrange(600)),
+                    duration=timedelta(minutes=30)
+                )
+
+            for days_ago in sorted(rng.sample(range(6), rng.randrange(1, 4)), reverse=True):
+                day_start, _ = local_day_range(local_date(self.now) - timedelta(days=days_ago))
+
+                for meal_type in rng.sample(self.meal_configs, rng.randrange(1, 3)):
+                    Meal.objects.create(user=user, meal_type=meal_type, meal_time=day_start + timedelta(hours=12))
+
+            WorkoutStreak.objects.filter(user=user).update(
+                current_streak=rng.randrange(1, 10), frequency=rng.randrange(1, 4)
+            )
+            MealStreak.objects.filter(user=user).update(current_streak=rng.randrange(1, 10))
+
+    def _expected(self, model):
+        return {streak.id for streak in model.objects.filter(current_streak__gt=0) if streak.check_streak_ended(self.now)}
+
+    def test_reset_matches_per_user_rules(self):
+        """Exactly the streaks the per-user rules consider ended are reset"""
+        expected_workouts = self._expected(WorkoutStreak)
+        expected_meals = self._expected(MealStreak)
+
+        metrics = reset_broken_streaks(now=self.now)
+
+        self.assertEqual(metrics['workout_streaks_reset'], len(expected_workouts))
+        self.assertEqual(metrics['meal_streaks_reset'], len(expected_meals))
+        self.assertEqual(set(WorkoutStreak.objects.filter(current_streak=0).values_list('id', flat=True)), expected_workouts)
+        self.assertEqual(set(MealStreak.objects.filter(current_streak=0).values_list('id', flat=True)), expected_meals)
+        # Every fixture has at least one broken streak of each kind, so the comparison is meaningful
+        self.assertTrue(expected_workouts and expected_meals)
+
+    def test_dry_run_does_not_write(self):
+        """A dry run reports the broken streaks without resetting them"""
+        metrics = reset_broken_streaks(now=self.now, dry_run=True)
+
+        self.assertTrue(metrics['dry_run'])
+        self.assertFalse(WorkoutStreak.objects.filter(current_streak=0).exists())
+        self.assertFalse(MealStreak.objects.filter(current_streak=0).exists())
+
+    def test_command(self):
+        """The management command runs the job and reports its metrics"""
+        out = StringIO()
+
+        call_command('reset_broken_streaks', dry_run=True, stdout=out)
+
+        self.assertIn('[dry-run] Streaks reset', out.getvalue())
@@ -10,7 +10,7 @@ from datetime import date, timedelta
 from gamification.models import GamificationSettings, Season, GamificationBonus, GamificationPenalty
 from gamification.serializer import GamificationSettingsSerializer, SeasonSerializer
 from clients.models import Client
-from groups.models import Group
+from groups.models import Group, GroupMembers
 from profiles.models import Profile
 from nutrition.models import MealConfig, Meal
 from social_feed.models import Post, Comment
@@ -310,7 +310,7 @@ class GamificationAdjustmentsAPITest(APITestCase):
             owner=self.user,
             main=True,
         )
-        self.profile.groups.add(self.main_group)
+        GroupMembers.objects.create(group=self.main_group, member=self.user, pending=False)
 
         self.meal_config = MealConfig.objects.create(
             meal_name='breakfast',
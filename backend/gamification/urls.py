@@ -1,13 +1,14 @@
 from django.urls import path
 
 from gamification.views import ListGamificationSettingsAPIView, DetailGamificationSettingsAPIView, SeasonList, \
-    SeasonDetail, SeasonByClient, GamificationAdjustmentsAPIView
+    SeasonDetail, SeasonByClient, SeasonStandingsAPIView, GamificationAdjustmentsAPIView
 
 urlpatterns = [
     path('settings/', ListGamificationSettingsAPIView.as_view(), name='list-gamification-settings'),
     path('settings/<int:pk>/', DetailGamificationSettingsAPIView.as_view(), name='detail-gamification-settings'),
     path('seasons/', SeasonList.as_view(), name='season-list'),
     path('seasons/<int:pk>/', SeasonDetail.as_view(), name='season-detail'),
+    path('seasons/<int:pk>/standings/', SeasonStandingsAPIView.as_view(), name='season-standings'),
     path('seasons/client/<int:client_id>/', SeasonByClient.as_view(), name='season-by-client'),
     path('adjustments/', GamificationAdjustmentsAPIView.as_view(), name='gamification-adjustments'),
 ]
@@ -1,10 +1,16 @@
-from django.shortcuts import render
-from drf_spectacular.utils import extend_schema
+from django.shortcuts import get_object_or_404, render
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError as RequestValidationError
 from rest_framework.generics import ListAPIView, ListCreateAPIView, RetrieveUpdateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from core.replica import ReplicaReadMixin
 from gamification.models import GamificationSettings, Season, GamificationBonus, GamificationPenalty
+from gamification.services import SeasonStandings
+from profiles.models import Profile
 from gamification.serializer import (
     GamificationSettingsSerializer,
     SeasonSerializer,
@@ -68,6 +74,47 @@ class SeasonByClient(ListAPIView):
         return Season.objects.filter(client_id=client_id)
 
 
+STANDINGS_MAX_TOP = 100
+
+
+@extend_schema(
+    tags=['Season'],
+    parameters=[OpenApiParameter('top', int, description=f'Number of users from the top (default 10, max {STANDINGS_MAX_TOP})')],
+)
+class SeasonStandingsAPIView(ReplicaReadMixin, APIView):
+    """
+    API view for the user and group standings of a season of the requesting user's employer (any season for admins).
+    Closed seasons are read from their frozen snapshot; open ones from the maintained season scores.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        seasons = Season.objects.all()
+
+        if not request.user.is_staff:
+            seasons = seasons.filter(client_id=Profile.employer_id_of(request.user))
+
+        season = get_object_or_404(seasons, pk=self.kwargs['pk'])
+
+        try:
+            top = int(request.query_params.get('top', 10))
+        except (TypeError, ValueError):
+            raise RequestValidationError({'top': 'Must be an integer.'})
+
+        if not 0 <= top <= STANDINGS_MAX_TOP:
+            raise RequestValidationError({'top': f'Must be between 0 and {STANDINGS_MAX_TOP}.'})
+
+        standings = SeasonStandings(season)
+
+        return Response({
+            'season': season.id,
+            'closed': standings.closed,
+            'top': standings.top(top),
+            'me': standings.user(request.user.id),
+            'groups': standings.groups(),
+        }, status=status.HTTP_200_OK)
+
+
 @extend_schema(tags=['Gamification'], request=GamificationAdjustmentSerializer, responses=GamificationAdjustmentResponseSerializer)
 class GamificationAdjustmentsAPIView(ListCreateAPIView):
     permission_classes = [IsAuthenticated]
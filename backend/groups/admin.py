@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib import messages
 
-from .models import Group, GroupMembers
+from .models import Group, GroupMembers, GroupMemberships, GroupSummary
 
 
 class GroupMembersInline(admin.TabularInline):
@@ -172,7 +172,13 @@ class GroupMembersAdmin(admin.ModelAdmin):
     def approve_members(self, request, queryset):
         """Approve pending members"""
         pending_members = queryset.filter(pending=True)
+        pairs = list(pending_members.values_list('member_id', 'group_id'))
+        member_ids = [member_id for member_id, _ in pairs]
+        group_ids = {group_id for _, group_id in pairs}
         updated = pending_members.update(pending=False)
+        # update() does not send the signals that invalidate the cached memberships and refresh the group summaries
+        GroupMemberships.invalidate(member_ids)
+        GroupSummary.refresh_on_commit(group_ids)
         self.message_user(
             request,
             f'{updated} membro(s) aprovado(s) com sucesso.',
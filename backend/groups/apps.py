@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class GroupsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'groups'
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        import groups.signals  # noqa
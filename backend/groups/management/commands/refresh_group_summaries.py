@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from groups.tasks import refresh_group_summaries
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the member count and points summary of every group (the same job run daily by the scheduler)'
+
+    def handle(self, *args, **options):
+        metrics = refresh_group_summaries()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Group summaries refreshed: {metrics["groups_refreshed"]} ({metrics["duration_ms"]} ms).'
+        ))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def build_group_summaries(apps, schema_editor):
+    """
+    Create the summary of every existing group from its active memberships.
+    """
+    Group = apps.get_model('groups', 'Group')
+    GroupSummary = apps.get_model('groups', 'GroupSummary')
+    active = Q(groupmembers__pending=False)
+    totals = Group.objects.annotate(
+        active_members=Count('groupmembers', filter=active),
+        points=Coalesce(Sum('groupmembers__member__profile__score', filter=active), 0.0),
+    ).values_list('id', 'active_members', 'points')
+
+    GroupSummary.objects.bulk_create(
+        [
+            GroupSummary(group_id=group_id, member_count=member_count, total_points=points)
+            for group_id, member_count, points in totals
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0008_alter_group_photo'),
+        ('profiles', '0010_remove_profile_groups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupSummary',
+            fields=[
+                ('group', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='groups.group')),
+                ('member_count', models.PositiveIntegerField(default=0)),
+                ('total_points', models.FloatField(default=0.0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Group summary',
+                'verbose_name_plural': 'Group summaries',
+            },
+        ),
+        migrations.RunPython(build_group_summaries, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,12 @@
 import secrets
+from collections import namedtuple
 
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db import models
+from django.core.cache import cache
+from django.db import connection, models, transaction
+from django.db.models import Count, F, Max, Q, Sum, Window
+from django.db.models.functions import Coalesce, RowNumber
 from django.core.validators import FileExtensionValidator
 
 
@@ -84,39 +89,40 @@ class Group(models.Model):
         Calculate and return the ranking of group members based on their profile scores.
         Returns a list of tuples containing user and their score, sorted in descending order.
         """
-        members = GroupMembers.objects.filter(group=self, pending=False).select_related('member__profile')
-        ranking = sorted(
-            [(member.member, member.member.profile.score) for member in members],
-            key=lambda x: x[1],
-            reverse=True
+        members = (
+            GroupMembers.objects.filter(group=self, pending=False)
+            .select_related('member__profile')
+            .order_by('-member__profile__score', 'id')
         )
 
-        return ranking
+        return [(member.member, member.member.profile.score) for member in members]
 
     def user_position(self, user):
         """
         Get the rank of a specific user within the group.
         Returns the rank position (1-based index) or None if the user is not a member.
         """
-        ranking = self.rank()
-
-        for index, (member, _) in enumerate(ranking, start=1):
-            if member == user:
-                return index
+        position = (
+            GroupMembers.objects.filter(group=self, pending=False)
+            .annotate(position=Window(RowNumber(), order_by=[F('member__profile__score').desc(), F('id').asc()]))
+            # Disjunction with the window column, so the member filter runs after numbering (positions start at 1)
+            .filter(Q(member_id=user.id) | Q(position__lt=1))
+            .values_list('position', flat=True)
+            .first()
+        )
 
-        return None
+        return position
 
     def points_first_place(self):
         """
         Get the score of the top-ranked member in the group.
         Returns the score or 0 if there are no members.
         """
-        ranking = self.rank()
+        top_score = GroupMembers.objects.filter(group=self, pending=False).aggregate(
+            top_score=Max('member__profile__score')
+        )['top_score']
 
-        if ranking:
-            return ranking[0][1]
-
-        return 0
+        return top_score if top_score is not None else 0
 
 
 class GroupMembers(models.Model):
@@ -135,3 +141,173 @@ class GroupMembers(models.Model):
 
     def __str__(self):
         return f'Member: {self.member}'
+
+
+class GroupSummary(models.Model):
+    """
+    Model storing the active member count and the summed profile scores of a group, so the "other groups" panel of
+    a client reads one row per group instead of aggregating every membership. Rows are refreshed after commit when a
+    membership or a member's profile changes (see groups.signals), and all of them are rebuilt daily by the
+    `refresh_group_summaries` job to absorb writes that bypass the signals.
+    """
+    group = models.OneToOneField(Group, on_delete=models.CASCADE, primary_key=True, related_name='summary')
+    member_count = models.PositiveIntegerField(default=0)
+    total_points = models.FloatField(default=0.0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'Group summary'
+        verbose_name_plural = 'Group summaries'
+
+    def __str__(self):
+        return f'Summary of group {self.group_id}'
+
+    @classmethod
+    def refresh(cls, group_ids=None):
+        """
+        Recompute the summaries of ``group_ids`` (every group when None) from the active memberships and upsert them.
+        Ids of groups that no longer exist are ignored. Returns the number of summaries written.
+        """
+        groups = Group.objects.all()
+
+        if group_ids is not None:
+            groups = groups.filter(id__in=group_ids)
+
+        active = Q(groupmembers__pending=False)
+        totals = groups.annotate(
+            active_members=Count('groupmembers', filter=active),
+            points=Coalesce(Sum('groupmembers__member__profile__score', filter=active), 0.0),
+        ).values_list('id', 'active_members', 'points')
+
+        summaries = [
+            cls(group_id=group_id, member_count=member_count, total_points=points)
+            for group_id, member_count, points in totals
+        ]
+        cls.objects.bulk_create(
+            summaries,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['group'],
+            update_fields=['member_count', 'total_points', 'updated_at'],
+        )
+
+        return len(summaries)
+
+    @classmethod
+    def refresh_on_commit(cls, group_ids):
+        """
+        Refresh the summaries of ``group_ids`` once the current transaction commits, so they only sum committed scores.
+        """
+        group_ids = list(group_ids)
+
+        if group_ids:
+            transaction.on_commit(lambda: cls.refresh(group_ids))
+
+    @classmethod
+    def refresh_member_groups_on_commit(cls, user_id):
+        """
+        Refresh the summaries of the active groups of ``user_id`` once the current transaction commits. The groups
+        are looked up in the callback, where the memberships map is usually already cached.
+        """
+        transaction.on_commit(lambda: cls.refresh(GroupMemberships.active_group_ids(user_id)))
+
+
+Membership = namedtuple('Membership', ['is_admin', 'pending'])
+
+
+class GroupMemberships:
+    """
+    Per-user map of memberships, {group_id: Membership(is_admin, pending)}, for the group permission checks and the
+    group tagging of new check-ins and meals.
+    Loaded with one query (one per batch of users with load_many), kept on the request for the rest of it and in the
+    shared cache until the user's memberships change (GroupMembers save/delete signals). Maps read inside a
+    transaction are only cached once it commits, so a rolled back membership is never served.
+    """
+    CACHE_KEY = 'group-memberships:{user_id}'
+    REQUEST_ATTR = '_group_memberships'
+
+    @classmethod
+    def _key(cls, user_id):
+        return cls.CACHE_KEY.format(user_id=user_id)
+
+    @classmethod
+    def load(cls, user_id):
+        return cls.load_many([user_id])[user_id]
+
+    @classmethod
+    def load_many(cls, user_ids):
+        """
+        Return {user_id: memberships} for ``user_ids``, reading the shared cache once and loading the users missing
+        from it with a single query.
+        """
+        keys = {cls._key(user_id): user_id for user_id in user_ids}
+        memberships = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+        missing = [user_id for user_id in keys.values() if user_id not in memberships]
+
+        if missing:
+            loaded = {user_id: {} for user_id in missing}
+
+            for group_id, is_admin, pending, user_id in GroupMembers.objects.filter(member_id__in=missing).values_list(
+                'group_id', 'is_admin', 'pending', 'member_id'
+            ):
+                loaded[user_id][group_id] = Membership(is_admin, pending)
+
+            values = {cls._key(user_id): value for user_id, value in loaded.items()}
+            timeout = getattr(settings, 'GROUP_MEMBERSHIPS_CACHE_TIMEOUT', 60)
+
+            if connection.in_atomic_block:
+                transaction.on_commit(lambda: cache.set_many(values, timeout))
+            else:
+                cache.set_many(values, timeout)
+
+            memberships.update(loaded)
+
+        return memberships
+
+    @staticmethod
+    def _active(memberships):
+        return [group_id for group_id, membership in memberships.items() if not membership.pending]
+
+    @classmethod
+    def active_group_ids(cls, user_id):
+        """
+        Return the ids of the groups ``user_id`` is an active (non-pending) member of.
+        """
+        return cls._active(cls.load(user_id))
+
+    @classmethod
+    def active_group_ids_many(cls, user_ids):
+        """
+        Return {user_id: active group ids} for ``user_ids``, with the same cache and a single query for all of them.
+        """
+        return {user_id: cls._active(memberships) for user_id, memberships in cls.load_many(user_ids).items()}
+
+    @classmethod
+    def for_request(cls, request):
+        """
+        Return the memberships of the request user, loading them at most once per request.
+        """
+        memberships = getattr(request, cls.REQUEST_ATTR, None)
+
+        if memberships is None:
+            memberships = cls.load(request.user.id)
+            setattr(request, cls.REQUEST_ATTR, memberships)
+
+        return memberships
+
+    @classmethod
+    def get(cls, request, group_id):
+        """
+        Return the Membership of the request user in ``group_id``, or None.
+        """
+        try:
+            group_id = int(group_id)
+        except (TypeError, ValueError):
+            return None
+
+        return cls.for_request(request).get(group_id)
+
+    @classmethod
+    def invalidate(cls, user_ids):
+        cache.delete_many([cls._key(user_id) for user_id in user_ids])
+
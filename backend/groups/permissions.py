@@ -1,6 +1,11 @@
 from rest_framework.exceptions import NotFound
 from rest_framework.permissions import BasePermission
-from groups.models import GroupMembers, Group
+from groups.models import GroupMemberships, Group
+
+
+def _group_exists(group_id, membership):
+    # Members of a group prove it exists without querying it
+    return membership is not None or Group.objects.filter(pk=group_id).exists()
 
 
 class IsGroupMember(BasePermission):
@@ -19,10 +24,12 @@ class IsGroupMember(BasePermission):
         if not group_id:
             return False
 
-        if not Group.objects.filter(pk=group_id).exists():
+        membership = GroupMemberships.get(request, group_id)
+
+        if not _group_exists(group_id, membership):
             raise NotFound("Group does not exist.")
 
-        return GroupMembers.objects.filter(group_id=group_id, member_id=request.user.id, pending=False).exists()
+        return membership is not None and not membership.pending
 
     def has_object_permission(self, request, view, obj):
         if getattr(request.user, 'is_superuser', False):
@@ -33,7 +40,9 @@ class IsGroupMember(BasePermission):
         if not group_id:
             return False
 
-        return GroupMembers.objects.filter(group_id=group_id, member_id=request.user.id, pending=False).exists()
+        membership = GroupMemberships.get(request, group_id)
+
+        return membership is not None and not membership.pending
 
 
 class IsMember(BasePermission):
@@ -51,15 +60,12 @@ class IsMember(BasePermission):
         if not group_id:
             return False
 
-        if not Group.objects.filter(pk=group_id).exists():
-            raise NotFound("Group does not exist.")
+        membership = GroupMemberships.get(request, group_id)
 
-        try:
-            membership = GroupMembers.objects.get(group_id=group_id, member_id=request.user.id)
-        except GroupMembers.DoesNotExist:
-            return False
+        if not _group_exists(group_id, membership):
+            raise NotFound("Group does not exist.")
 
-        return membership.pending is False
+        return membership is not None and not membership.pending
 
     def has_object_permission(self, request, view, obj):
         if getattr(request.user, 'is_superuser', False):
@@ -69,12 +75,10 @@ class IsMember(BasePermission):
 
         if not group_id:
             return False
-        try:
-            membership = GroupMembers.objects.get(group_id=group_id, member_id=request.user.id)
-        except GroupMembers.DoesNotExist:
-            return False
 
-        return membership.pending is False
+        membership = GroupMemberships.get(request, group_id)
+
+        return membership is not None and not membership.pending
 
 
 class IsAdminMember(BasePermission):
@@ -91,12 +95,10 @@ class IsAdminMember(BasePermission):
 
         if not group_id:
             return False
-        try:
-            membership = GroupMembers.objects.get(group_id=group_id, member_id=request.user.id)
-        except GroupMembers.DoesNotExist:
-            return False
 
-        return membership.is_admin
+        membership = GroupMemberships.get(request, group_id)
+
+        return membership is not None and membership.is_admin
 
     def has_object_permission(self, request, view, obj):
         if getattr(request.user, 'is_superuser', False):
@@ -106,9 +108,7 @@ class IsAdminMember(BasePermission):
 
         if not group_id:
             return False
-        try:
-            membership = GroupMembers.objects.get(group_id=group_id, member_id=request.user.id)
-        except GroupMembers.DoesNotExist:
-            return False
 
-        return membership.is_admin and membership.pending is False
+        membership = GroupMemberships.get(request, group_id)
+
+        return membership is not None and membership.is_admin and not membership.pending
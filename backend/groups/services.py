@@ -1,10 +1,11 @@
 from django.apps import apps
+from django.core.files.storage import default_storage
 from django.db import transaction
 from django.utils import timezone
-from django.db.models import Sum, Count, FloatField, OuterRef, Value, Subquery, IntegerField, Q
-from django.db.models.functions import Coalesce
+from django.db.models import Sum, Count, F, FloatField, OuterRef, Value, Subquery, IntegerField, Q, Window
+from django.db.models.functions import Coalesce, DenseRank, Rank, RowNumber
 
-from groups.models import GroupMembers, Group
+from groups.models import GroupMembers, GroupMemberships, GroupSummary, Group
 
 
 def create_group_for_client(
@@ -66,6 +67,9 @@ def create_group_for_client(
         ]
         if to_create:
             GroupMembers.objects.bulk_create(to_create)
+            # bulk_create does not send the signals that invalidate the cached memberships
+            GroupMemberships.invalidate([member.member_id for member in to_create])
+            GroupSummary.refresh_on_commit([group.id])
 
         return group
 
@@ -322,25 +326,187 @@ def compute_group_members_data(group):
     }
 
 
-def compute_another_groups(main_group):
-    client = main_group.client.first()
-    groups = list(client.groups.all())
+def _subquery_total(queryset, aggregate):
+    totals = queryset.order_by().annotate(total_group=Value(1)).values('total_group').annotate(
+        total=aggregate
+    ).values('total')
+
+    return Coalesce(Subquery(totals, output_field=FloatField()), Value(0.0), output_field=FloatField())
+
+
+def current_month_start():
+    return timezone.localtime(timezone.now()).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def monthly_member_score(month_start):
+    """
+    Expression of a GroupMembers row's monthly score in its group: the same score as compute_group_members_data
+    (group-linked workouts and meals since ``month_start`` plus their bonuses minus penalties), as subqueries.
+    """
+    Meal = apps.get_model('nutrition', 'Meal')
+    Workout = apps.get_model('workouts', 'WorkoutCheckin')
+    Bonus = apps.get_model('gamification', 'GamificationBonus')
+    Penalty = apps.get_model('gamification', 'GamificationPenalty')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    def month_workouts(member, group):
+        return Workout.objects.filter(user=member, groups=group, workout_date__gte=month_start)
+
+    def month_meals(member, group):
+        return Meal.objects.filter(user=member, groups=group, meal_time__gte=month_start)
+
+    def adjustments(model):
+        # Adjustments given to the member's group-linked items of the month (nested in the points subqueries)
+        member, group = OuterRef(OuterRef('member')), OuterRef(OuterRef('group'))
+
+        return _subquery_total(
+            model.objects.filter(
+                Q(
+                    content_type_id=ContentType.objects.get_for_model(Workout).id,
+                    object_id__in=month_workouts(member, group).values('id'),
+                ) | Q(
+                    content_type_id=ContentType.objects.get_for_model(Meal).id,
+                    object_id__in=month_meals(member, group).values('id'),
+                )
+            ),
+            Sum('score'),
+        )
 
-    aggregations = GroupMembers.objects.filter(group__in=groups, pending=False).values('group').annotate(
-        members_count=Count('id'),
-        members_score_sum=Coalesce(Sum('member__profile__score'), 0.0)
+    return (
+        _subquery_total(month_workouts(OuterRef('member'), OuterRef('group')), Sum('base_points'))
+        + _subquery_total(month_meals(OuterRef('member'), OuterRef('group')), Sum('base_points'))
+        + adjustments(Bonus)
+        - adjustments(Penalty)
     )
 
-    aggregations_map = {item['group']: item for item in aggregations}
+
+def only_member(user_id, window_alias, user_field='member_id'):
+    """
+    Filter keeping the rows of ``user_id`` (matched on ``user_field``) after the window functions are computed.
+    Window values start at 1, so the second branch never matches; a disjunction with the window column makes Django
+    filter after ranking (QUALIFY) instead of ranking the user's rows alone (WHERE).
+    """
+    return Q(**{user_field: user_id}) | Q(**{f'{window_alias}__lt': 1})
+
+
+def compute_member_positions(user_id, group_ids):
+    """
+    Return {group_id: {"member_count": ..., "position": ...}} for a user across several groups with two queries.
+    Positions use the monthly score of monthly_member_score, ranked with RANK() per group in the database; only the
+    user's rows are returned. The position is None where the user is not an active member.
+    """
+    group_ids = list(group_ids)
+
+    if not group_ids:
+        return {}
+
+    active_members = GroupMembers.objects.filter(group_id__in=group_ids, pending=False)
+    result = {
+        row['group_id']: {'member_count': row['member_count'], 'position': None}
+        for row in active_members.order_by().values('group_id').annotate(member_count=Count('id'))
+    }
+    positions = (
+        active_members
+        .annotate(score=monthly_member_score(current_month_start()))
+        .annotate(position=Window(Rank(), partition_by=F('group_id'), order_by=F('score').desc()))
+        .filter(only_member(user_id, 'position'))
+        .values_list('group_id', 'position')
+    )
+
+    for group_id, position in positions:
+        result[group_id]['position'] = position
+
+    return result
+
+
+class GroupLeaderboard:
+    """
+    Leaderboard slices of a group computed with window functions, so only the requested rows leave the database.
+    ``period`` is "month" (monthly score of monthly_member_score) or "all" (profile score); ``ranking`` picks RANK()
+    (ties share a position and leave gaps) or DENSE_RANK() (no gaps). Rows with the same score are ordered by member id.
+    """
+    PERIODS = ('month', 'all')
+    RANKINGS = {'rank': Rank, 'dense': DenseRank}
+
+    def __init__(self, group, period='month', ranking='rank'):
+        if period not in self.PERIODS:
+            raise ValueError(f'Invalid period "{period}". Use one of: {", ".join(self.PERIODS)}.')
+
+        if ranking not in self.RANKINGS:
+            raise ValueError(f'Invalid ranking "{ranking}". Use one of: {", ".join(self.RANKINGS)}.')
+
+        self.group = group
+        self.period = period
+        self.ranking = ranking
+
+    def _ranked(self):
+        if self.period == 'month':
+            score = monthly_member_score(current_month_start())
+        else:
+            score = Coalesce(F('member__profile__score'), Value(0.0), output_field=FloatField())
+
+        order_by = [F('score').desc(), F('member_id').asc()]
+
+        return (
+            GroupMembers.objects.filter(group=self.group, pending=False)
+            .annotate(score=score)
+            .annotate(
+                position=Window(self.RANKINGS[self.ranking](), order_by=F('score').desc()),
+                row_number=Window(RowNumber(), order_by=order_by),
+            )
+            .values(
+                'member_id', 'member__username', 'member__first_name', 'member__last_name', 'member__profile__photo',
+                'score', 'position', 'row_number',
+            )
+            .order_by('row_number')
+        )
+
+    @staticmethod
+    def _entry(row):
+        return {
+            'id': row['member_id'],
+            'username': row['member__username'],
+            'full_name': f"{row['member__first_name']} {row['member__last_name']}".strip(),
+            'photo': default_storage.url(row['member__profile__photo']) if row['member__profile__photo'] else None,
+            'score': row['score'],
+            'position': row['position'],
+        }
+
+    def top(self, limit):
+        return [self._entry(row) for row in self._ranked()[:limit]]
+
+    def around(self, user_id, distance):
+        """
+        Return the user's entry and the ``distance`` entries above and below it, or (None, []) for non-members.
+        """
+        me = next(iter(self._ranked().filter(only_member(user_id, 'row_number'))), None)
+
+        if me is None:
+            return None, []
+
+        neighbours = self._ranked().filter(
+            row_number__gte=me['row_number'] - distance, row_number__lte=me['row_number'] + distance,
+        )
+
+        return self._entry(me), [self._entry(row) for row in neighbours]
+
+
+def compute_another_groups(main_group):
+    """
+    Return the groups of the client owning ``main_group`` with their points and active member counts, read from the
+    maintained GroupSummary rows (groups without a summary yet report zero).
+    """
+    client = main_group.client.first()
+    groups = Group.objects.filter(clients=client).select_related('summary').order_by('id')
     other_groups = []
 
     for group in groups:
-        data = aggregations_map.get(group.id, {'members_count': 0, 'members_score_sum': 0.0})
+        summary = getattr(group, 'summary', None)
         other_groups.append({
             "id": group.id,
             "name": group.name,
-            "pts": data['members_score_sum'],
-            "n_members": data['members_count'],
+            "pts": summary.total_points if summary else 0.0,
+            "n_members": summary.member_count if summary else 0,
         })
 
     return other_groups
@@ -0,0 +1,36 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from profiles.models import Profile
+from .models import GroupMembers, GroupMemberships, GroupSummary
+
+
+@receiver(post_save, sender=GroupMembers)
+@receiver(post_delete, sender=GroupMembers)
+def invalidate_group_memberships(sender, instance, **kwargs):
+    """
+    Drop the cached memberships of the member; dropped again on commit so maps loaded meanwhile are discarded too.
+    """
+    GroupMemberships.invalidate([instance.member_id])
+    transaction.on_commit(lambda: GroupMemberships.invalidate([instance.member_id]))
+
+
+@receiver(post_save, sender=GroupMembers)
+@receiver(post_delete, sender=GroupMembers)
+def refresh_group_summary(sender, instance, **kwargs):
+    """
+    Recount the group of a joined, approved or removed member.
+    """
+    GroupSummary.refresh_on_commit([instance.group_id])
+
+
+@receiver(post_save, sender=Profile)
+def refresh_member_group_summaries(sender, instance, update_fields=None, **kwargs):
+    """
+    Re-sum the points of the groups of a member whose score may have changed.
+    """
+    if update_fields is not None and 'score' not in update_fields:
+        return
+
+    GroupSummary.refresh_member_groups_on_commit(instance.user_id)
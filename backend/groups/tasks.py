@@ -0,0 +1,32 @@
+"""
+Scheduled group jobs.
+
+refresh_group_summaries runs once a day (see notifications runapscheduler) and rebuilds every GroupSummary, catching
+up on score and membership writes that bypass the signals keeping the summaries current (queryset updates, raw SQL).
+"""
+import logging
+import time
+
+from django_apscheduler.util import close_old_connections
+
+from groups.models import GroupSummary
+
+logger = logging.getLogger(__name__)
+
+
+@close_old_connections
+def refresh_group_summaries():
+    """
+    Recompute the member count and points of every group.
+    Returns the run metrics (summaries written and duration).
+    """
+    started = time.monotonic()
+    refreshed = GroupSummary.refresh()
+
+    metrics = {
+        'groups_refreshed': refreshed,
+        'duration_ms': round((time.monotonic() - started) * 1000, 2),
+    }
+    logger.info('[group_summaries] groups=%(groups_refreshed)s duration=%(duration_ms)sms', metrics)
+
+    return metrics
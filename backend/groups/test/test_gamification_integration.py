@@ -55,11 +55,6 @@ class GroupRankingTest(TestCase):
         GroupMembers.objects.create(group=self.group, member=self.user2, pending=False)
         GroupMembers.objects.create(group=self.group, member=self.user3, pending=False)
 
-        # Add groups to profiles
-        self.profile1.groups.add(self.group)
-        self.profile2.groups.add(self.group)
-        self.profile3.groups.add(self.group)
-
     def test_group_rank_ordering(self):
         """Test that group ranking returns users ordered by score descending"""
         ranking = self.group.rank()
@@ -166,9 +161,6 @@ class GamificationIntegrationWithGroupsTest(TestCase):
         GroupMembers.objects.filter(group=self.group, member=self.user1).update(pending=False)
         GroupMembers.objects.create(group=self.group, member=self.user2, pending=False)
 
-        self.profile1.groups.add(self.group)
-        self.profile2.groups.add(self.group)
-
         # Create season
         self.season = Season.objects.create(
             client=self.client_obj,
@@ -244,7 +236,6 @@ class GamificationIntegrationWithGroupsTest(TestCase):
 
         # Add user1 to second group
         GroupMembers.objects.create(group=group2, member=self.user1, pending=False)
-        self.profile1.groups.add(group2)
 
         # Rankings should be independent
         group1_ranking = self.group.rank()
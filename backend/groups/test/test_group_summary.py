@@ -0,0 +1,116 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase
+
+from clients.models import Client
+from gamification.services import Gamification
+from groups.models import Group, GroupMembers, GroupSummary
+from groups.services import compute_another_groups
+from groups.tasks import refresh_group_summaries
+from profiles.models import Profile
+
+
+class GroupSummaryTest(TestCase):
+    """
+    Test the maintained group summaries behind the "other groups" panel of the main group.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(username='summaryowner', password='pass')
+        self.alice = User.objects.create_user(username='summaryalice', password='pass')
+        self.bob = User.objects.create_user(username='summarybob', password='pass')
+        self.main_group = Group.objects.create(name='Main', owner=self.owner, created_by=self.owner, main=True)
+        self.team_a = Group.objects.create(name='Team A', owner=self.owner, created_by=self.owner)
+        self.team_b = Group.objects.create(name='Team B', owner=self.owner, created_by=self.owner)
+        self.client_obj = Client.objects.create(
+            name='Summary Client',
+            cnpj='12.345.678/0001-44',
+            owners=self.owner,
+            main_group=self.main_group,
+            contact_email='summary@cliente.test',
+            phone='(11)99999-9999',
+            address='Rua Exemplo, 123, Bairro, Cidade - SP',
+        )
+        self.client_obj.groups.add(self.team_a, self.team_b)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Profile.objects.create(user=self.owner, employer=self.client_obj, score=5.0)
+            Profile.objects.create(user=self.alice, employer=self.client_obj, score=10.0)
+            Profile.objects.create(user=self.bob, employer=self.client_obj, score=20.0)
+            GroupMembers.objects.create(group=self.team_a, member=self.alice, pending=False)
+            GroupMembers.objects.create(group=self.team_a, member=self.bob, pending=False)
+            GroupMembers.objects.create(group=self.team_b, member=self.bob, pending=True)
+
+    def _summary(self, group):
+        return GroupSummary.objects.get(group=group)
+
+    def test_membership_changes_refresh_the_group_summary(self):
+        summary = self._summary(self.team_a)
+        self.assertEqual(summary.member_count, 2)
+        self.assertEqual(summary.total_points, 30.0)
+        # Pending members are not counted
+        self.assertEqual(self._summary(self.team_b).member_count, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            membership = GroupMembers.objects.get(group=self.team_b, member=self.bob)
+            membership.pending = False
+            membership.save()
+
+        self.assertEqual(self._summary(self.team_b).member_count, 1)
+        self.assertEqual(self._summary(self.team_b).total_points, 20.0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GroupMembers.objects.filter(group=self.team_a, member=self.alice).delete()
+
+        self.assertEqual(self._summary(self.team_a).member_count, 1)
+        self.assertEqual(self._summary(self.team_a).total_points, 20.0)
+
+    def test_score_changes_refresh_the_member_groups(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Gamification().add_xp(self.alice, 7.5)
+
+        self.assertEqual(self._summary(self.team_a).total_points, 37.5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Gamification().remove_xp(self.bob, 5.0)
+
+        self.assertEqual(self._summary(self.team_a).total_points, 32.5)
+        # Bob's pending membership does not add his points
+        self.assertEqual(self._summary(self.team_b).total_points, 0.0)
+
+    def test_summaries_are_only_written_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            Gamification().add_xp(self.alice, 100.0)
+
+        self.assertEqual(self._summary(self.team_a).total_points, 30.0)
+        self.assertTrue(callbacks)
+
+    def test_another_groups_are_read_from_the_summaries(self):
+        self.main_group.refresh_from_db()
+
+        with self.assertNumQueries(2):
+            other_groups = compute_another_groups(self.main_group)
+
+        self.assertEqual(other_groups, [
+            {'id': self.team_a.id, 'name': 'Team A', 'pts': 30.0, 'n_members': 2},
+            {'id': self.team_b.id, 'name': 'Team B', 'pts': 0.0, 'n_members': 0},
+        ])
+
+    def test_groups_without_summary_report_zero(self):
+        GroupSummary.objects.filter(group=self.team_a).delete()
+
+        other_groups = compute_another_groups(self.main_group)
+
+        self.assertEqual(other_groups[0], {'id': self.team_a.id, 'name': 'Team A', 'pts': 0.0, 'n_members': 0})
+
+    def test_scheduled_refresh_catches_up_on_bypassed_writes(self):
+        # Queryset updates skip the signals, so the summary goes stale until the daily job runs
+        Profile.objects.filter(user=self.alice).update(score=50.0)
+        self.assertEqual(self._summary(self.team_a).total_points, 30.0)
+
+        metrics = refresh_group_summaries()
+
+        self.assertEqual(metrics['groups_refreshed'], Group.objects.count())
+        self.assertEqual(self._summary(self.team_a).total_points, 70.0)
+        self.assertEqual(self._summary(self.main_group).member_count, 0)
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from groups.models import Group, GroupMembers
+from groups.services import GroupLeaderboard, compute_group_members_data
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin
+
+
+class GroupLeaderboardTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='leaderboardowner', password='pass')
+        self.client_obj = Client.objects.create(
+            name='Leaderboard Client',
+            cnpj='12.345.678/0001-44',
+            owners=self.owner,
+            contact_email='leaderboard@cliente.test',
+            phone='(11)99999-9999',
+            address='Rua Exemplo, 123, Bairro, Cidade - SP',
+        )
+        self.group = Group.objects.create(name='Leaderboard', owner=self.owner, created_by=self.owner)
+        self.api = APIClient()
+        # Monthly points per member; ties on 6.0 and 3.0
+        self.users = [self._member(f'leader{index}', points) for index, points in enumerate([9, 6, 6, 5, 3, 3, 1, 0])]
+
+    def _member(self, username, points, score=0.0):
+        user = User.objects.create_user(username=username, password='pass', first_name=username.title())
+        Profile.objects.create(user=user, employer=self.client_obj, score=score or points * 10)
+        GroupMembers.objects.create(group=self.group, member=user, pending=False)
+
+        if points:
+            workout = WorkoutCheckin.objects.create(
+                user=user, workout_date=timezone.now() - timedelta(minutes=5), duration=timedelta(minutes=30)
+            )
+            WorkoutCheckin.objects.filter(pk=workout.pk).update(base_points=points)
+
+        return user
+
+    def _get(self, user, **params):
+        self.api.force_authenticate(user)
+
+        return self.api.get(reverse('groups-leaderboard', args=[self.group.id]), params)
+
+    def test_top_matches_full_leaderboard(self):
+        """Top entries and positions equal the ones of compute_group_members_data"""
+        expected = [(member['id'], member['position']) for member in compute_group_members_data(self.group)['members']]
+
+        top = GroupLeaderboard(self.group).top(len(self.users))
+
+        self.assertEqual([(entry['id'], entry['position']) for entry in top], expected)
+        self.assertEqual([entry['score'] for entry in top[:3]], [9.0, 6.0, 6.0])
+
+    def test_dense_ranking(self):
+        """DENSE_RANK leaves no gaps after ties"""
+        top = GroupLeaderboard(self.group, ranking='dense').top(5)
+
+        self.assertEqual([entry['position'] for entry in top], [1, 2, 2, 3, 4])
+
+    def test_all_time_uses_profile_score(self):
+        """The all-time board ranks by profile score"""
+        Profile.objects.filter(user=self.users[-1]).update(score=1000)
+
+        top = GroupLeaderboard(self.group, period='all').top(2)
+
+        self.assertEqual([entry['id'] for entry in top], [self.users[-1].id, self.users[0].id])
+
+    def test_around_me(self):
+        """The window holds the requesting user and k members above and below"""
+        me, around = GroupLeaderboard(self.group).around(self.users[4].id, 2)
+
+        self.assertEqual(me['id'], self.users[4].id)
+        self.assertEqual(me['position'], 5)
+        self.assertEqual([entry['id'] for entry in around], [user.id for user in self.users[2:7]])
+
+    def test_around_me_at_the_edges(self):
+        """The window is cut at the ends of the board and empty for non-members"""
+        _, around = GroupLeaderboard(self.group).around(self.users[0].id, 2)
+
+        self.assertEqual([entry['id'] for entry in around], [user.id for user in self.users[:3]])
+        self.assertEqual(GroupLeaderboard(self.group).around(self.owner.id, 2), (None, []))
+
+    def test_endpoint(self):
+        """Members get the top slice and their neighbours"""
+        response = self._get(self.users[5], top=3, around=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['member_count'], len(self.users))
+        self.assertEqual([entry['id'] for entry in response.data['top']], [user.id for user in self.users[:3]])
+        self.assertEqual(response.data['me']['position'], 5)
+        self.assertEqual([entry['id'] for entry in response.data['around_me']], [user.id for user in self.users[4:7]])
+
+    def test_endpoint_rejects_invalid_params(self):
+        """Invalid periods and oversized slices are rejected"""
+        self.assertEqual(self._get(self.users[0], period='year').status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get(self.users[0], top=1000).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self._get(self.users[0], around='x').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_endpoint_requires_membership(self):
+        """Non-members cannot read the leaderboard"""
+        self.assertEqual(self._get(self.owner).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_query_count_does_not_grow_with_members(self):
+        """The response costs the same queries for small and large groups"""
+        self._get(self.users[0])
+
+        with CaptureQueriesContext(connection) as small:
+            self._get(self.users[0])
+
+        for index in range(20):
+            self._member(f'extra{index}', index % 4)
+
+        with CaptureQueriesContext(connection) as large:
+            response = self._get(self.users[0])
+
+        self.assertEqual(len(response.data['top']), 10)
+        self.assertEqual(len(small), len(large))
+
+    def test_group_user_position_and_first_place(self):
+        """Group.user_position and points_first_place are answered by the database"""
+        with self.assertNumQueries(1):
+            self.assertEqual(self.group.user_position(self.users[3]), 4)
+
+        top_score = max(Profile.objects.filter(user__in=self.users).values_list('score', flat=True))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.group.points_first_place(), top_score)
+
+        self.assertIsNone(self.group.user_position(self.owner))
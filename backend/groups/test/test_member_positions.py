@@ -0,0 +1,111 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from gamification.models import GamificationBonus, GamificationPenalty
+from groups.models import Group, GroupMembers
+from groups.services import compute_group_members_data, compute_member_positions
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin
+
+
+class ComputeMemberPositionsTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(username='positionsowner', password='pass')
+        self.client_obj = Client.objects.create(
+            name='Positions Client',
+            cnpj='12.345.678/0001-11',
+            owners=self.owner,
+            contact_email='positions@cliente.test',
+            phone='(11)99999-9999',
+            address='Rua Exemplo, 123, Bairro, Cidade - SP',
+        )
+        self.groups = [
+            Group.objects.create(name=f'Group {index}', created_by=self.owner, owner=self.owner)
+            for index in range(3)
+        ]
+        self.users = []
+
+        for index in range(5):
+            user = User.objects.create_user(username=f'positions{index}', password='pass')
+            Profile.objects.create(user=user, employer=self.client_obj)
+            self.users.append(user)
+
+            for group in self.groups:
+                GroupMembers.objects.create(group=group, member=user, pending=False)
+
+        self.now = timezone.now()
+
+    def _workout(self, user, points, group=None, days_ago=0):
+        workout = WorkoutCheckin.objects.create(
+            user=user,
+            workout_date=self.now - timedelta(days=days_ago, minutes=len(self.users)),
+            duration=timedelta(minutes=30),
+        )
+        WorkoutCheckin.objects.filter(pk=workout.pk).update(base_points=points)
+
+        if group is not None:
+            workout.groups.set([group])
+
+        return workout
+
+    def _assert_matches_leaderboards(self):
+        for user in self.users:
+            positions = compute_member_positions(user.id, [group.id for group in self.groups])
+
+            for group in self.groups:
+                members = compute_group_members_data(group)['members']
+                expected = next((member['position'] for member in members if member['id'] == user.id), None)
+
+                self.assertEqual(positions[group.id]['position'], expected, (user.username, group.name))
+                self.assertEqual(positions[group.id]['member_count'], len(members))
+
+    def test_positions_match_group_leaderboards(self):
+        """Positions equal the ones of the full leaderboard, including adjustments and ties"""
+        self._workout(self.users[0], 5.0, self.groups[0])
+        self._workout(self.users[1], 5.0, self.groups[0])
+        boosted = self._workout(self.users[2], 4.0, self.groups[0])
+        self._workout(self.users[3], 8.0, self.groups[1])
+        penalized = self._workout(self.users[4], 9.0, self.groups[1], days_ago=1)
+        # Previous month (or older) workouts do not count
+        old = self._workout(self.users[1], 50.0, self.groups[2], days_ago=40)
+
+        GamificationBonus.objects.create(created_by=self.owner, score=3.0, content_object=boosted, reason='Bonus')
+        GamificationPenalty.objects.create(created_by=self.owner, score=2.0, content_object=penalized, reason='Late')
+        GamificationBonus.objects.create(created_by=self.owner, score=30.0, content_object=old, reason='Old')
+
+        self._assert_matches_leaderboards()
+
+    def test_pending_member_has_no_position(self):
+        """Users whose membership is pending are counted out and get no position"""
+        GroupMembers.objects.filter(group=self.groups[0], member=self.users[0]).update(pending=True)
+
+        positions = compute_member_positions(self.users[0].id, [self.groups[0].id])
+
+        self.assertEqual(positions[self.groups[0].id], {'member_count': 4, 'position': None})
+
+    def test_query_count_does_not_grow_with_groups(self):
+        """Two queries whatever the number of groups and members"""
+        with self.assertNumQueries(2):
+            compute_member_positions(self.users[0].id, [self.groups[0].id])
+
+        with self.assertNumQueries(2):
+            compute_member_positions(self.users[0].id, [group.id for group in self.groups])
+
+    def test_profile_me_reports_positions(self):
+        """The profile serializer reads positions from the batched query"""
+        self._workout(self.users[1], 7.0, self.groups[0])
+        api = APIClient()
+        api.force_authenticate(self.users[1])
+
+        response = api.get(reverse('profile-me'))
+
+        groups = {group['id']: group for group in response.data['groups']}
+        self.assertEqual(groups[self.groups[0].id]['position'], 1)
+        self.assertEqual(groups[self.groups[0].id]['member_count'], 5)
+        self.assertEqual(groups[self.groups[1].id]['position'], 1)
@@ -0,0 +1,149 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from gamification.services import WorkoutGamification
+from groups.models import Group, GroupMembers, GroupMemberships, Membership
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin
+
+
+class GroupMembershipsTest(TestCase):
+    """
+    Test the cached memberships map behind the group permission checks.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.api = APIClient()
+        self.owner = User.objects.create_user(username='membershipowner', password='pass')
+        self.admin = User.objects.create_user(username='membershipadmin', password='pass')
+        self.member = User.objects.create_user(username='membershipmember', password='pass')
+        client = Client.objects.create(
+            name='Memberships Client',
+            cnpj='12.345.678/0001-33',
+            owners=self.owner,
+            contact_email='memberships@cliente.test',
+            phone='(11)99999-9999',
+            address='Rua Exemplo, 123, Bairro, Cidade - SP',
+        )
+        self.group = Group.objects.create(name='Group A', owner=self.owner, created_by=self.owner)
+        self.other_group = Group.objects.create(name='Group B', owner=self.owner, created_by=self.owner)
+
+        for user in (self.owner, self.admin, self.member):
+            Profile.objects.create(user=user, employer=client)
+
+        GroupMembers.objects.create(group=self.group, member=self.owner, is_admin=True, pending=False)
+        GroupMembers.objects.create(group=self.other_group, member=self.owner, is_admin=True, pending=False)
+        # Admin of group A, regular member of group B
+        GroupMembers.objects.create(group=self.group, member=self.admin, is_admin=True, pending=False)
+        GroupMembers.objects.create(group=self.other_group, member=self.admin, pending=False)
+        GroupMembers.objects.create(group=self.group, member=self.member, pending=False)
+        GroupMembers.objects.create(group=self.other_group, member=self.member, pending=False)
+
+    def _url(self, group, member):
+        return reverse('group-members-detail', kwargs={'group_id': group.id, 'member_id': member.id})
+
+    @staticmethod
+    def _membership_queries(queries):
+        table = GroupMembers._meta.db_table
+
+        return [
+            query for query in queries
+            if query['sql'].startswith(f'SELECT "{table}"."group_id" AS "group_id", "{table}"."is_admin" AS "is_admin"')
+        ]
+
+    def test_load_map(self):
+        """The map holds every membership of the user, pending ones included"""
+        GroupMembers.objects.create(group=Group.objects.create(name='Group C', owner=self.owner, created_by=self.owner),
+                                    member=self.member)
+
+        memberships = GroupMemberships.load(self.member.id)
+
+        self.assertEqual(len(memberships), 3)
+        self.assertEqual(memberships[self.group.id], Membership(is_admin=False, pending=False))
+        self.assertTrue(list(memberships.values())[-1].pending)
+
+    def test_one_membership_query_per_request(self):
+        """Permission and object permission checks share a single query, and none once cached"""
+        self.api.force_authenticate(self.member)
+
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as queries:
+            response = self.api.get(self._url(self.group, self.owner))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._membership_queries(queries)), 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.api.get(self._url(self.group, self.owner))
+
+        self.assertEqual(self._membership_queries(queries), [])
+
+    def test_membership_changes_invalidate_map(self):
+        """Removing a member drops the cached map, so the next request is denied"""
+        self.api.force_authenticate(self.member)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.api.get(self._url(self.group, self.owner))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GroupMembers.objects.filter(group=self.group, member=self.member).delete()
+
+        response = self.api.get(self._url(self.group, self.owner))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_unknown_group_is_not_found(self):
+        """Non-members still get a 404 for missing groups"""
+        self.api.force_authenticate(self.member)
+
+        response = self.api.get(reverse('group-members-detail', kwargs={'group_id': 999999, 'member_id': 1}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_removal_checks_admin_rights_in_the_group(self):
+        """An admin of another group cannot remove members of a group where they are a regular member"""
+        self.api.force_authenticate(self.admin)
+
+        response = self.api.delete(self._url(self.other_group, self.member))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(GroupMembers.objects.filter(group=self.other_group, member=self.member).exists())
+
+        response = self.api.delete(self._url(self.group, self.member))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_profile_groups_are_active_memberships(self):
+        """Profile.groups reads the active GroupMembers rows"""
+        pending_group = Group.objects.create(name='Group C', owner=self.owner, created_by=self.owner)
+        GroupMembers.objects.create(group=pending_group, member=self.member)
+
+        self.assertEqual(
+            set(self.member.profile.groups.values_list('id', flat=True)), {self.group.id, self.other_group.id}
+        )
+
+    @patch.object(WorkoutGamification, 'base_xp', return_value=2)
+    def test_checkins_are_tagged_with_active_groups(self, base_xp):
+        """New check-ins are tagged with the active groups in one insert, whatever their number"""
+        pending_group = Group.objects.create(name='Group C', owner=self.owner, created_by=self.owner)
+        GroupMembers.objects.create(group=pending_group, member=self.member)
+        through_table = WorkoutCheckin.groups.through._meta.db_table
+
+        with CaptureQueriesContext(connection) as queries:
+            workout = WorkoutCheckin.objects.create(
+                user=self.member, workout_date=timezone.now() - timedelta(hours=1), duration=timedelta(minutes=30)
+            )
+
+        self.assertEqual(set(workout.groups.values_list('id', flat=True)), {self.group.id, self.other_group.id})
+        self.assertEqual(len([query for query in queries if f'INSERT INTO "{through_table}"' in query['sql']]), 1)
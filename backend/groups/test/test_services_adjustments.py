@@ -47,9 +47,6 @@ class ComputeGroupMembersDataAdjustmentsTest(TestCase):
         GroupMembers.objects.create(group=self.group, member=self.owner, pending=False, is_admin=True)
         GroupMembers.objects.create(group=self.group, member=self.member, pending=False, is_admin=False)
 
-        self.owner_profile.groups.add(self.group)
-        self.member_profile.groups.add(self.group)
-
         self.meal_config = MealConfig.objects.create(
             meal_name='breakfast',
             interval_start=timezone.datetime(2026, 1, 1, 6, 0).time(),
@@ -1,11 +1,12 @@
 from django.urls import path
 from .views import GroupsAPIView, GroupAPIView, InviteGroupAPIView, GroupMemberAPIView, InviteGroupAccept, \
-    QuitingGroupAPIView, GroupMeAPIView, GroupsAdminAPIView, CreateGroupFromMainAPIView
+    QuitingGroupAPIView, GroupMeAPIView, GroupsAdminAPIView, CreateGroupFromMainAPIView, GroupLeaderboardAPIView
 
 urlpatterns = [
     path('', GroupsAPIView.as_view(), name='groups-list'),
     path('admin/', GroupsAdminAPIView.as_view(), name='groups-list-admin'),
     path('<int:pk>/', GroupAPIView.as_view(), name='groups-detail'),
+    path('<int:pk>/leaderboard/', GroupLeaderboardAPIView.as_view(), name='groups-leaderboard'),
     # path('<int:pk>/stats/', GroupStatsAPIView.as_view(), name='groups-stats'),
     path('me/', GroupMeAPIView.as_view(), name='groups-me'),
     path('<int:group_id>/members/<int:member_id>/', GroupMemberAPIView.as_view(), name='group-members-detail'),
@@ -1,21 +1,24 @@
 from django.contrib.auth.models import User
-from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError as RequestValidationError
 from rest_framework.generics import RetrieveUpdateDestroyAPIView, ListCreateAPIView, ListAPIView, CreateAPIView
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from clients.models import Client
-from groups.models import Group, GroupMembers
+from core.replica import ReplicaReadMixin
+from groups.models import Group, GroupMembers, GroupMemberships
 from groups.permissions import IsMember, IsAdminMember, IsGroupMember
+from groups.services import GroupLeaderboard
 from groups.serializer import GroupMemberSerializer, GroupListSerializer, GroupDetailSerializer, \
     GroupAdminListSerializer, GroupCreateFromMainSerializer
 
+LEADERBOARD_MAX_SLICE = 100
+
 
 @extend_schema(tags=['groups'])
 class GroupsAdminAPIView(ListAPIView):
@@ -54,7 +57,7 @@ class GroupsAPIView(ListCreateAPIView):
 
 
 @extend_schema(tags=['Groups'])
-class GroupAPIView(RetrieveUpdateDestroyAPIView):
+class GroupAPIView(ReplicaReadMixin, RetrieveUpdateDestroyAPIView):
     """
     API view for individual group operations (retrieve, update, delete).
     Only group owners can delete groups.
@@ -128,8 +131,64 @@ class CreateGroupFromMainAPIView(CreateAPIView):
         return Response(response_serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+@extend_schema(
+    tags=['Groups'],
+    parameters=[
+        OpenApiParameter('period', str, enum=list(GroupLeaderboard.PERIODS), description='month (default) or all'),
+        OpenApiParameter('ranking', str, enum=list(GroupLeaderboard.RANKINGS), description='rank (default) or dense'),
+        OpenApiParameter('top', int, description=f'Size of the top slice (default 10, max {LEADERBOARD_MAX_SLICE})'),
+        OpenApiParameter('around', int, description='Members above and below the requesting user (default 2, max 25)'),
+    ],
+)
+class GroupLeaderboardAPIView(ReplicaReadMixin, APIView):
+    """
+    API view for the leaderboard of a group.
+    Returns the top members and a window around the requesting user, ranked in the database, so large groups do
+    not transfer their whole member list.
+    """
+    permission_classes = [IsAuthenticated, IsGroupMember]
+
+    @staticmethod
+    def _int_param(request, name, default, maximum):
+        value = request.query_params.get(name, default)
+
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            raise RequestValidationError({name: 'Must be an integer.'})
+
+        if not 0 <= value <= maximum:
+            raise RequestValidationError({name: f'Must be between 0 and {maximum}.'})
+
+        return value
+
+    def get(self, request, *args, **kwargs):
+        group = get_object_or_404(Group, pk=self.kwargs['pk'])
+        top = self._int_param(request, 'top', 10, LEADERBOARD_MAX_SLICE)
+        around = self._int_param(request, 'around', 2, 25)
+
+        try:
+            leaderboard = GroupLeaderboard(
+                group,
+                period=request.query_params.get('period', 'month'),
+                ranking=request.query_params.get('ranking', 'rank'),
+            )
+        except ValueError as e:
+            raise RequestValidationError({'detail': str(e)})
+
+        me, around_me = leaderboard.around(request.user.id, around)
+
+        return Response({
+            'period': leaderboard.period,
+            'member_count': group.member_count(),
+            'top': leaderboard.top(top),
+            'me': me,
+            'around_me': around_me,
+        }, status=status.HTTP_200_OK)
+
+
 @extend_schema(tags=['Groups'])
-class GroupMeAPIView(APIView):
+class GroupMeAPIView(ReplicaReadMixin, APIView):
     """
     API view for retrieving groups the authenticated user is a member of.
     Returns groups associated with the user's profile.
@@ -195,8 +254,8 @@ class GroupMemberAPIView(RetrieveUpdateDestroyAPIView):
         Implements permission hierarchy: admins can remove regular members,
         only owner can remove admin members.
         """
-        # Get current user's membership status
-        member = GroupMembers.objects.filter(member_id=request.user.id).first()
+        # Current user's membership in this group, already loaded by the permission check
+        member = GroupMemberships.get(request, self.kwargs['group_id'])
         group = Group.objects.get(pk=self.kwargs['group_id'])
         member_removed = self.get_object()
 
@@ -206,19 +265,11 @@ class GroupMemberAPIView(RetrieveUpdateDestroyAPIView):
                 raise PermissionDenied("Only admin group can delete another members")
 
             # Only group owner can remove admin members
-            if member_removed.is_admin and member.member != group.owner:
+            if member_removed.is_admin and request.user != group.owner:
                 raise PermissionDenied("Only group owner can delete admin members")
         else:
             return Response({"detail": "User not a member of this groups"}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            # Remove group from member's profile
-            member_removed.member.profile.groups.remove(group)
-        except ObjectDoesNotExist:
-            pass  # Profile doesn't exist, continue with member removal
-        except Exception as e:
-            return Response({"detail": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
         return super().delete(request, *args, **kwargs)
 
 
@@ -295,11 +346,6 @@ class InviteGroupAccept(APIView):
         if action == 'accept':
             group_member.pending = False
             group_member.save()
-            # Add group to user's profile groups
-            try:
-                request.user.profile.groups.add(group_member.group)
-            except ObjectDoesNotExist:
-                pass
 
             return Response({"detail": "You have successfully joined the group."}, status=status.HTTP_200_OK)
         else:
@@ -340,12 +386,6 @@ class QuitingGroupAPIView(APIView):
             return Response({"detail": "Group owner cannot quit the group. Transfer ownership or delete the group."},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            # Remove group from user's profile groups
-            request.user.profile.groups.remove(group_member.group)
-        except ObjectDoesNotExist:
-            pass
-
         group_member.delete()
 
         return Response({"detail": "You have successfully quit the group."}, status=status.HTTP_200_OK)
@@ -19,6 +19,9 @@ from django_apscheduler.jobstores import DjangoJobStore
 from django_apscheduler.models import DjangoJobExecution
 from django_apscheduler import util
 
+from core.media import process_pending_media
+from gamification.tasks import close_ended_seasons, reset_broken_streaks
+from groups.tasks import refresh_group_summaries
 from notifications.services import send_meal_reminders
 
 logger = logging.getLogger(__name__)
@@ -84,6 +87,66 @@ class Command(BaseCommand):
         logger.info("Job registrado: 'meal_reminder_check' (a cada 10 minutos).")
         self.stdout.write(f"  → meal_reminder_check: a cada 10 minutos")
 
+        # ------------------------------------------------------------------ #
+        # Job: miniaturas e prévias das mídias enviadas — a cada minuto       #
+        # ------------------------------------------------------------------ #
+        scheduler.add_job(
+            process_pending_media,
+            trigger=IntervalTrigger(minutes=1),
+            id='process_pending_media',
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=60,
+        )
+        logger.info("Job registrado: 'process_pending_media' (a cada minuto).")
+        self.stdout.write("  → process_pending_media: a cada minuto")
+
+        # ------------------------------------------------------------------ #
+        # Job: reset diário dos streaks quebrados de treino e refeição         #
+        # ------------------------------------------------------------------ #
+        scheduler.add_job(
+            reset_broken_streaks,
+            trigger=CronTrigger(hour='0', minute='10'),
+            id='reset_broken_streaks',
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=60 * 60,
+        )
+        logger.info("Job registrado: 'reset_broken_streaks' (todo dia às 00h10).")
+        self.stdout.write("  → reset_broken_streaks: todo dia às 00h10")
+
+        # ------------------------------------------------------------------ #
+        # Job: congela a classificação das temporadas encerradas               #
+        # ------------------------------------------------------------------ #
+        scheduler.add_job(
+            close_ended_seasons,
+            trigger=CronTrigger(hour='0', minute='20'),
+            id='close_ended_seasons',
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=60 * 60,
+        )
+        logger.info("Job registrado: 'close_ended_seasons' (todo dia às 00h20).")
+        self.stdout.write("  → close_ended_seasons: todo dia às 00h20")
+
+        # ------------------------------------------------------------------ #
+        # Job: reconstrução diária dos resumos de pontos/membros dos grupos    #
+        # ------------------------------------------------------------------ #
+        scheduler.add_job(
+            refresh_group_summaries,
+            trigger=CronTrigger(hour='0', minute='30'),
+            id='refresh_group_summaries',
+            max_instances=1,
+            replace_existing=True,
+            coalesce=True,
+            misfire_grace_time=60 * 60,
+        )
+        logger.info("Job registrado: 'refresh_group_summaries' (todo dia às 00h30).")
+        self.stdout.write("  → refresh_group_summaries: todo dia às 00h30")
+
         # ------------------------------------------------------------------ #
         # Job: limpeza semanal do histórico de execuções                      #
         # ------------------------------------------------------------------ #
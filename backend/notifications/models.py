@@ -1,6 +1,8 @@
 from django.contrib.auth.models import User
 from django.db import models
 
+from profiles.models import Profile
+
 
 class NotificationType(models.TextChoices):
     SOCIAL_LIKE = 'social_like', 'Curtiu seu post'
@@ -48,10 +50,11 @@ class Notification(models.Model):
         related_name='notifications',
         verbose_name='Usuário',
     )
-    # Permite associar ao employer para broadcast; nullable para notificações pessoais
+    # Employer do usuário, copiado do profile na criação para consultas por tenant sem joins;
+    # nulo para usuários sem profile. Remover o client não apaga as notificações dos funcionários
     employer = models.ForeignKey(
         'clients.Client',
-        on_delete=models.CASCADE,
+        on_delete=models.SET_NULL,
         null=True,
         blank=True,
         related_name='notifications',
@@ -80,3 +83,9 @@ class Notification(models.Model):
 
     def __str__(self):
         return f"[{self.get_notification_type_display()}] {self.user.username} — {self.title}"
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.employer_id is None:
+            self.employer_id = Profile.employer_id_of(self.user)
+
+        super().save(*args, **kwargs)
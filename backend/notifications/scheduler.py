@@ -71,6 +71,23 @@ def start():
     )
     logger.info("Job registrado: 'meal_reminder_check' (a cada 10 minutos).")
 
+    # ------------------------------------------------------------------ #
+    # Job: reset diário dos streaks quebrados de treino e refeição         #
+    # ------------------------------------------------------------------ #
+    from gamification.tasks import reset_broken_streaks
+
+    scheduler.add_job(
+        reset_broken_streaks,
+        trigger=CronTrigger(hour='0', minute='10'),
+        id='reset_broken_streaks',
+        name='Reset de streaks quebrados (diário)',
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+        misfire_grace_time=60 * 60,
+    )
+    logger.info("Job registrado: 'reset_broken_streaks' (todo dia às 00h10).")
+
     # ------------------------------------------------------------------ #
     # Job: limpeza semanal do histórico de execuções                      #
     # ------------------------------------------------------------------ #
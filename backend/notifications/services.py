@@ -13,6 +13,8 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.utils import timezone
 
+from core.utils import local_day_range
+
 try:
     from django_apscheduler.util import close_old_connections
 except ImportError:
@@ -181,6 +183,7 @@ def send_meal_reminders():
 
     now_local = timezone.localtime(timezone.now())
     today = now_local.date()
+    today_start, today_end = local_day_range(today)
     current_time = now_local.time()
 
     logger.info('[meal_reminder] Verificando às %s', current_time.strftime('%H:%M:%S'))
@@ -235,7 +238,8 @@ def send_meal_reminders():
         users_already_registered_ids = set(
             User.objects.filter(
                 meals__meal_type=config,
-                meals__meal_time__date=today,
+                meals__meal_time__gte=today_start,
+                meals__meal_time__lt=today_end,
             ).distinct().values_list('pk', flat=True)
         )
 
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 23:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_employer(apps, schema_editor):
+    Meal = apps.get_model('nutrition', 'Meal')
+    Profile = apps.get_model('profiles', 'Profile')
+
+    Meal.objects.filter(employer__isnull=True).update(
+        employer_id=Subquery(Profile.objects.filter(user_id=OuterRef('user_id')).values('employer_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_profile_employer'),
+        ('clients', '0010_alter_client_client_code'),
+        ('groups', '0008_alter_group_photo'),
+        ('nutrition', '0005_meal_groups'),
+        ('status', '0005_alter_status_app_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meal',
+            name='employer',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='meals', to='clients.client'),
+        ),
+        migrations.AddIndex(
+            model_name='meal',
+            index=models.Index(fields=['employer', 'meal_time'], name='nutrition_m_employe_0de321_idx'),
+        ),
+        migrations.RunPython(backfill_employer, migrations.RunPython.noop),
+    ]
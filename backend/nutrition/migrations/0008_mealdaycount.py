@@ -0,0 +1,46 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_day_counts(apps, schema_editor):
+    Meal = apps.get_model('nutrition', 'Meal')
+    MealDayCount = apps.get_model('nutrition', 'MealDayCount')
+
+    day_counts = Meal.objects.order_by().annotate(day=TruncDate('meal_time')).values('user_id', 'day').annotate(
+        count=Count('id')
+    )
+
+    MealDayCount.objects.bulk_create([
+        MealDayCount(user_id=row['user_id'], date=row['day'], count=row['count']) for row in day_counts
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nutrition', '0007_meal_user_meal_type_meal_time_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MealDayCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='meal_day_counts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Meal day count',
+                'verbose_name_plural': 'Meal day counts',
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='unique_meal_day_count')],
+            },
+        ),
+        migrations.RunPython(backfill_day_counts, migrations.RunPython.noop),
+    ]
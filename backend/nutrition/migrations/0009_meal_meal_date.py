@@ -0,0 +1,58 @@
+# Generated by Django 5.2.3 on 2026-10-19 01:18
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_meal_dates(apps, schema_editor):
+    """
+    Set the local day of the existing meals. Earlier duplicates of a (user, meal type, day) keep the first meal dated
+    and leave the others NULL, so the constraint can be added without deleting data.
+    """
+    Meal = apps.get_model('nutrition', 'Meal')
+    seen = set()
+    batch = []
+
+    for meal in Meal.objects.order_by('user_id', 'meal_type_id', 'meal_time', 'id').only(
+        'id', 'user_id', 'meal_type_id', 'meal_time'
+    ).iterator(chunk_size=2000):
+        key = (meal.user_id, meal.meal_type_id, timezone.localdate(meal.meal_time))
+
+        if key in seen:
+            continue
+
+        seen.add(key)
+        meal.meal_date = key[2]
+        batch.append(meal)
+
+        if len(batch) >= 1000:
+            Meal.objects.bulk_update(batch, ['meal_date'])
+            batch = []
+
+    if batch:
+        Meal.objects.bulk_update(batch, ['meal_date'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0010_alter_client_client_code'),
+        ('groups', '0008_alter_group_photo'),
+        ('nutrition', '0008_mealdaycount'),
+        ('status', '0005_alter_status_app_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meal',
+            name='meal_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_meal_dates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='meal',
+            constraint=models.UniqueConstraint(fields=('user', 'meal_type', 'meal_date'), name='unique_meal_type_per_day'),
+        ),
+    ]
@@ -2,15 +2,21 @@ from datetime import timedelta
 
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.validators import FileExtensionValidator
-from django.db import models
-from django.db.models import Sum
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
 from django.core.exceptions import ObjectDoesNotExist as RelatedObjectDoesNotExist, ValidationError
 from django.utils import timezone
 
+from core.media import MediaVariantsModel
+from core.utils import increment_counter, local_date, violates_constraint
 from gamification.models import GamificationBonus, GamificationPenalty
 from gamification.services import Gamification
-from status.models import Status
+from groups.models import GroupMemberships
+from profiles.models import Profile
+from status.models import Status, StatusRegistry
 
 meal_choices = [
     ('breakfast', 'Café da manhã'),
@@ -22,14 +28,7 @@ meal_choices = [
 
 
 def get_published_status_id():
-    obj, _ = Status.objects.get_or_create(
-        app_name='NUTRITION',
-        action='PUBLISHED',
-        is_active=True,
-        defaults={'name': 'Publicado'}
-    )
-
-    return obj.id
+    return StatusRegistry.get_id('NUTRITION', 'PUBLISHED', 'Publicado')
 
 
 class MealConfig(models.Model):
@@ -41,9 +40,31 @@ class MealConfig(models.Model):
     def __str__(self):
         return f"{self.get_meal_name_display()}"
 
+    MEALS_COUNT_CACHE_KEY = 'meal-configs-count'
+    MEALS_COUNT_CACHE_TIMEOUT = 60 * 10
+
     @classmethod
     def all_meals_count(cls):
-        return cls.objects.count()
+        """
+        Return the number of configured meals, kept in the shared cache for MEALS_COUNT_CACHE_TIMEOUT seconds.
+        A count read inside a transaction is only cached after it commits; MealConfig changes clear it.
+        """
+        key = cls.MEALS_COUNT_CACHE_KEY
+        count = cache.get(key)
+
+        if count is None:
+            count = cls.objects.count()
+
+            if connection.in_atomic_block:
+                transaction.on_commit(lambda: cache.set(key, count, cls.MEALS_COUNT_CACHE_TIMEOUT))
+            else:
+                cache.set(key, count, cls.MEALS_COUNT_CACHE_TIMEOUT)
+
+        return count
+
+    @classmethod
+    def clear_meals_count(cls):
+        cache.delete(cls.MEALS_COUNT_CACHE_KEY)
 
     class Meta:
         ordering = ['interval_start']
@@ -59,46 +80,89 @@ class Meal(models.Model):
     fasting = models.BooleanField(default=False)
     multiplier = models.FloatField(default=1.0)
     groups = models.ManyToManyField('groups.Group', blank=True)
+    # Employer of the meal's author at creation, like WorkoutCheckin.employer
+    employer = models.ForeignKey(
+        'clients.Client',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='meals'
+    )
+    # Local calendar day of meal_time, set on creation; backs the one-meal-per-type-per-day constraint
+    meal_date = models.DateField(null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employer', 'meal_time']),
+            models.Index(fields=['user', 'meal_type', 'meal_time']),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'meal_type', 'meal_date'], name='unique_meal_type_per_day'),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.meal_type.meal_name} at {self.meal_time.strftime('%Y-%m-%d %H:%M')}"
 
     def save(self, *args, **kwargs):
-        self.clean()
-        self.validation_status, _ = Status.objects.get_or_create(app_name='NUTRITION', action='PUBLISHED', defaults={
-            'name': 'Aceito',
-            'app_name': 'NUTRITION',
-            'action': 'PUBLISHED',
-        })
-
-        streak, created = MealStreak.objects.get_or_create(
-            user=self.user,
-            defaults={
-                'current_streak': 1,
-                'longest_streak': 1,
-                'last_meal_datetime': self.meal_time.astimezone(),
-            }
-        )
+        """
+        Save the meal and, on creation, update the streak, day counter, groups and the user's score in one transaction.
+        A second meal of the same type on the same local day violates the unique constraint and is reported as a
+        ValidationError.
+        """
+        is_new = self.pk is None
+        self.validation_status_id = get_published_status_id()
+
+        if not is_new:
+            return super().save(*args, **kwargs)
+
+        self.meal_date = local_date(self.meal_time)
+
+        if self.employer_id is None:
+            self.employer_id = Profile.employer_id_of(self.user)
+
+        with transaction.atomic():
+            streak = MealStreak.objects.select_for_update().filter(user_id=self.user_id).first()
+
+            if streak is None:
+                MealStreak.objects.create(
+                    user_id=self.user_id,
+                    current_streak=1,
+                    longest_streak=1,
+                    last_meal_datetime=self.meal_time.astimezone(),
+                )
+            else:
+                streak.update_streak(self.meal_time.astimezone())
+
+            # Calculate multiplier and points based on streak
+            self.multiplier = Gamification.Meal.get_multiplier(self.user)
+            self.base_points = Gamification.Meal.calculate(self.user)
 
-        if not created:
-            streak.update_streak(self.meal_time.astimezone())
+            try:
+                super().save(*args, **kwargs)
+            except IntegrityError as e:
+                # Leaving the block rolls the streak update back as well
+                if violates_constraint(e, Meal, 'unique_meal_type_per_day'):
+                    raise ValidationError({"meal_type": "A meal of this type has already been recorded for today."})
 
-        # Calculate multiplier and points based on streak
-        self.multiplier = Gamification.Meal.get_multiplier(self.user)
-        self.base_points = Gamification.Meal.calculate(self.user)
+                raise
 
-        super().save(*args, **kwargs)
+            MealDayCount.bump(self.user_id, self.meal_date, 1)
 
-        self.groups.set([group.id for group in self.user.profile.groups.all()])
+            Meal.groups.through.objects.bulk_create([
+                Meal.groups.through(meal_id=self.id, group_id=group_id)
+                for group_id in GroupMemberships.active_group_ids(self.user_id)
+            ])
 
-        # Update the user's profile with the new points
-        Gamification().add_xp(self.user, self.base_points)
+            # Update the user's profile with the new points
+            Gamification().add_xp(self.user, self.base_points)
 
     def delete(self, *args, **kwargs):
         # Before deleting the meal, deduct the points from the user's profile
         meal_points = self.base_points
         user = self.user
         meal_id = self.id
+        meal_day = local_date(self.meal_time)
 
         meal_content_type = ContentType.objects.get_for_model(Meal)
         bonus_qs = GamificationBonus.objects.filter(content_type=meal_content_type, object_id=meal_id)
@@ -111,6 +175,7 @@ class Meal(models.Model):
         except Exception as e:
             raise e
 
+        MealDayCount.bump(user.id, meal_day, -1)
         Gamification().remove_xp(user, meal_points)
 
         # Revert bonus/penalty side effects for this meal and remove adjustment records.
@@ -123,15 +188,21 @@ class Meal(models.Model):
         penalty_qs.delete()
 
     def clean(self):
+        # Early feedback for forms; on save the unique constraint is what enforces it
         if self.id is None:  # Only check for duplicates on creation
-            if Meal.objects.filter(user=self.user, meal_type=self.meal_type, meal_time__date=self.meal_time.date()).exists():
+            if Meal.objects.filter(
+                user=self.user,
+                meal_type=self.meal_type,
+                meal_date=local_date(self.meal_time),
+            ).exists():
                 raise ValidationError({"meal_type": "A meal of this type has already been recorded for today."})
 
 
-class MealProof(models.Model):
+class MealProof(MediaVariantsModel):
     """
     Model for storing proof files (images/videos) attached to meals.
-    Supports validation of file types to ensure only allowed media formats.
+    Supports validation of file types to ensure only allowed media formats; thumbnail/preview variants are built
+    asynchronously by the media pipeline (core.media).
     """
     checkin = models.ForeignKey(
         Meal,
@@ -143,6 +214,13 @@ class MealProof(models.Model):
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'mp4'])]
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['id'], name='meal_proof_pending_idx', condition=models.Q(variants_processed_at__isnull=True)
+            ),
+        ]
+
 
 class NutritionPlan(models.Model):
     title = models.CharField(max_length=100)
@@ -227,28 +305,21 @@ class MealStreak(models.Model):
 
     def check_streak_ended(self, meal_datetime):
         # Cache date conversions to avoid repeated calls
-        meal_date = meal_datetime.astimezone().date()
-        last_meal_date = self.last_meal_datetime.astimezone().date()
+        meal_date = local_date(meal_datetime)
+        last_meal_date = local_date(self.last_meal_datetime)
 
         # Cache the expected meals count
         expected_meals_count = MealConfig.all_meals_count()
 
         if last_meal_date == meal_date:
             # Same day: check if we've already reached the daily goal
-            # Use exists() for better performance when we just need a count check
-            meals_on_day = Meal.objects.filter(
-                user=self.user,
-                meal_time__date=meal_date
-            ).count()
+            meals_on_day, = MealDayCount.get_counts(self.user_id, meal_date)
 
             # Streak continues if we haven't exceeded the expected count
             return meals_on_day > expected_meals_count
         else:
             # Different day: check if previous day met the goal
-            meals_on_last_day = Meal.objects.filter(
-                user=self.user,
-                meal_time__date=last_meal_date
-            ).count()
+            meals_on_last_day, = MealDayCount.get_counts(self.user_id, last_meal_date)
 
             # Streak ended if we didn't meet the goal on the previous day
             return meals_on_last_day < expected_meals_count
@@ -257,3 +328,62 @@ class MealStreak(models.Model):
         if self.check_streak_ended(meal_datetime):
             self.current_streak = 0
             self.save()
+
+
+class MealDayCount(models.Model):
+    """
+    Number of meals of a user per local day.
+    Kept up to date by the meal save/delete, so streak decisions read a single row instead of counting meals.
+    Can be rebuilt with the `rebuild_streak_counters` command.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='meal_day_counts')
+    date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Meal day count'
+        verbose_name_plural = 'Meal day counts'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_meal_day_count'),
+        ]
+
+    def __str__(self):
+        return f'{self.count} meals of {self.user_id} on {self.date}'
+
+    @classmethod
+    def bump(cls, user_id, day, step):
+        """
+        Apply ``step`` (+1/-1) to the count of the local ``day``.
+        """
+        increment_counter(cls, step, user_id=user_id, date=day)
+
+    @classmethod
+    def get_counts(cls, user_id, *days):
+        """
+        Return the counts of the given days, in the same order, reading only their rows.
+        """
+        counts = dict(cls.objects.filter(user_id=user_id, date__in=days).values_list('date', 'count'))
+
+        return [counts.get(day, 0) for day in days]
+
+    @classmethod
+    def rebuild(cls, user_ids=None):
+        """
+        Recount the days of the given users (all users by default) from the meals.
+        Returns the number of rows written.
+        """
+        meals = Meal.objects.order_by()
+
+        if user_ids is not None:
+            meals = meals.filter(user_id__in=user_ids)
+
+        day_counts = meals.annotate(day=TruncDate('meal_time')).values('user_id', 'day').annotate(count=Count('id'))
+
+        with transaction.atomic():
+            existing = cls.objects.all() if user_ids is None else cls.objects.filter(user_id__in=user_ids)
+            existing.delete()
+            created = cls.objects.bulk_create([
+                cls(user_id=row['user_id'], date=row['day'], count=row['count']) for row in day_counts
+            ], batch_size=1000)
+
+        return len(created)
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class MealsPagination(CursorPagination):
+    """
+    Cursor pagination for meal lists, most recent first.
+    Pages are read by position on (meal_time, id), so deep pages cost the same as the first one.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-meal_time', '-id')
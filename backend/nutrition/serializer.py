@@ -2,6 +2,7 @@ from django.core.validators import FileExtensionValidator
 from django.contrib.contenttypes.models import ContentType
 from rest_framework import serializers
 
+from core.media import BatchedMediaListSerializer
 from gamification.models import GamificationBonus, GamificationPenalty
 from nutrition.models import Meal, MealProof, NutritionPlan, MealConfig
 
@@ -29,13 +30,14 @@ class MealConfigSerializer(serializers.ModelSerializer):
 class MealProofSerializer(serializers.ModelSerializer):
     """
     Serializer for workout check-in proof files.
-    Handles serialization of uploaded images and videos as workout evidence.
+    Handles serialization of uploaded images and videos as workout evidence, with their thumbnail/preview variants
+    (null until the media pipeline has processed the file).
     """
 
     class Meta:
         model = MealProof
-        fields = ['id', 'file']
-        read_only_fields = ['id']
+        fields = ['id', 'file', 'thumbnail', 'preview']
+        read_only_fields = ['id', 'thumbnail', 'preview']
 
 
 class MealSerializer(serializers.ModelSerializer):
@@ -66,6 +68,9 @@ class MealSerializer(serializers.ModelSerializer):
             'current_streak', 'longest_streak', 'level_up', 'fasting',
             'total_bonus', 'total_penalty', 'bonus_list', 'penalties_list'
         ]
+        # Proof URLs of a whole page are signed in one batch
+        media_paths = ('proofs.file', 'proofs.thumbnail', 'proofs.preview')
+        list_serializer_class = BatchedMediaListSerializer
         # Prevent modification of automatically calculated fields
         read_only_fields = ('user', 'base_points', 'multiplier', 'validation_status')
 
@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, post_migrate
+from django.dispatch import receiver
+
+from .models import MealConfig
+
+
+@receiver(post_save, sender=MealConfig)
+@receiver(post_delete, sender=MealConfig)
+def clear_meals_count(sender, **kwargs):
+    """
+    Drop the cached number of meal configurations; cleared again on commit so counts read meanwhile are dropped too.
+    """
+    MealConfig.clear_meals_count()
+    transaction.on_commit(MealConfig.clear_meals_count)
+
+
+@receiver(post_migrate)
+def clear_meals_count_after_migrate(sender, **kwargs):
+    """
+    Migrations and flushes rewrite the table without model signals.
+    """
+    MealConfig.clear_meals_count()
@@ -0,0 +1,80 @@
+"""
+Tests for the local-day range lookups on meals
+"""
+import unittest
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from clients.models import Client
+from core.utils import local_day_range
+from nutrition.models import Meal, MealConfig
+from profiles.models import Profile
+
+
+class MealDayRangeTest(TestCase):
+    """Test that meal day lookups use local-day ranges"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='rangeuser', email='range@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Range Company',
+            cnpj='11222333000177',
+            contact_email='range@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        self.meal_config = MealConfig.objects.create(
+            meal_name='dinner',
+            interval_start=time(0, 0),
+            interval_end=time(23, 59),
+        )
+        self.day = timezone.localdate() - timedelta(days=2)
+
+    def _local(self, day, hour, minute=0):
+        return timezone.make_aware(datetime.combine(day, time(hour, minute)))
+
+    def test_duplicate_is_checked_on_the_local_day(self):
+        """Meals late at night and early next morning belong to different local days"""
+        Meal.objects.create(user=self.user, meal_type=self.meal_config, meal_time=self._local(self.day, 23, 30))
+
+        # 00:30 of the next local day is the same UTC day as 23:30, but a different local day
+        Meal.objects.create(
+            user=self.user,
+            meal_type=self.meal_config,
+            meal_time=self._local(self.day + timedelta(days=1), 0, 30)
+        )
+
+        with self.assertRaises(ValidationError):
+            Meal.objects.create(user=self.user, meal_type=self.meal_config, meal_time=self._local(self.day, 8))
+
+    def test_meal_creation_does_not_cast_dates(self):
+        """Creating a meal filters the day with a range instead of casting the column"""
+        with CaptureQueriesContext(connection) as queries:
+            Meal.objects.create(user=self.user, meal_type=self.meal_config, meal_time=self._local(self.day, 20))
+
+        self.assertFalse(any('cast_date' in query['sql'] for query in queries.captured_queries))
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are checked on PostgreSQL only')
+    def test_duplicate_lookup_uses_index(self):
+        """The duplicate check is answered by the (user, meal_type, meal_time) index"""
+        day_start, day_end = local_day_range(self.day)
+        queryset = Meal.objects.filter(
+            user=self.user,
+            meal_type=self.meal_config,
+            meal_time__gte=day_start,
+            meal_time__lt=day_end,
+        )
+
+        # The test tables are tiny, so sequential scans are turned off and the plan must name the new index
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        self.assertIn('nutrition_m_user_id_327778_idx', queryset.explain())
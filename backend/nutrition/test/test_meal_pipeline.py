@@ -0,0 +1,135 @@
+"""
+Tests for the meal creation pipeline
+"""
+from datetime import time, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+
+from clients.models import Client
+from gamification.models import Season
+from gamification.services import MealGamification
+from groups.models import Group, GroupMembers
+from nutrition.models import Meal, MealConfig, MealDayCount, MealStreak, get_published_status_id
+from profiles.models import Profile
+from social_feed.models import get_post_published_status_id
+from status.models import StatusRegistry
+
+
+class MealPipelineTest(TestCase):
+    """Test that creating a meal is atomic, constraint-checked and runs a fixed number of queries"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(MealGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(StatusRegistry.clear)
+        self.addCleanup(MealConfig.clear_meals_count)
+        self.addCleanup(lambda: Season.clear_active_cache(self.client_obj.id))
+
+        self.owner = User.objects.create_user(username='mealowner', email='owner@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Meal Pipeline Company',
+            cnpj='11222333000111',
+            contact_email='meal@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.group = Group.objects.create(name='Meal Group', owner=self.owner, created_by=self.owner)
+        self.breakfast = MealConfig.objects.create(meal_name='breakfast', interval_start=time(6), interval_end=time(10))
+        self.lunch = MealConfig.objects.create(meal_name='lunch', interval_start=time(11), interval_end=time(14))
+        self.now = timezone.now()
+
+    def _user(self, username):
+        user = User.objects.create_user(username=username, password='pass1234')
+        Profile.objects.create(user=user, employer=self.client_obj)
+        GroupMembers.objects.create(group=self.group, member=user, pending=False)
+
+        return User.objects.select_related('profile').get(id=user.id)
+
+    def _warm_caches(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            get_published_status_id()
+            get_post_published_status_id()
+            MealConfig.all_meals_count()
+            Season.active_id_for_client(self.client_obj.id)
+
+    def test_duplicate_meal_type_on_same_day_is_rejected(self):
+        """A second meal of the same type on the same local day fails without side effects"""
+        user = self._user('duplicatemeal')
+        Meal.objects.create(user=user, meal_type=self.breakfast, meal_time=self.now - timedelta(minutes=5))
+        score = user.profile.score
+        streak = MealStreak.objects.get(user=user).current_streak
+
+        with self.assertRaises(ValidationError):
+            Meal.objects.create(user=user, meal_type=self.breakfast, meal_time=self.now - timedelta(minutes=1))
+
+        user.profile.refresh_from_db()
+        self.assertEqual(Meal.objects.filter(user=user).count(), 1)
+        self.assertEqual(user.profile.score, score)
+        self.assertEqual(MealStreak.objects.get(user=user).current_streak, streak)
+        self.assertEqual(MealDayCount.get_counts(user.id, timezone.localdate(self.now)), [1])
+
+    def test_other_integrity_errors_are_not_reported_as_duplicates(self):
+        """Only the one-meal-per-type-and-day constraint becomes a validation error"""
+        user = self._user('integrityerror')
+        error = IntegrityError('NOT NULL constraint failed: nutrition_meal.meal_type_id')
+
+        with patch.object(Meal, 'save_base', side_effect=error), self.assertRaises(IntegrityError):
+            Meal.objects.create(user=user, meal_type=self.breakfast, meal_time=self.now)
+
+        self.assertFalse(MealStreak.objects.filter(user=user).exists())
+
+    def test_meal_date_and_side_effects(self):
+        """Creating a meal stores its local day, groups, points and counters"""
+        user = self._user('sideeffects')
+        meal = Meal.objects.create(user=user, meal_type=self.lunch, meal_time=self.now - timedelta(days=1))
+
+        meal.refresh_from_db()
+        user.profile.refresh_from_db()
+        self.assertEqual(meal.meal_date, timezone.localdate(meal.meal_time))
+        self.assertEqual(list(meal.groups.values_list('id', flat=True)), [self.group.id])
+        self.assertEqual(meal.base_points, 2.0)
+        self.assertEqual(user.profile.score, 2.0)
+        self.assertEqual(MealDayCount.get_counts(user.id, meal.meal_date), [1])
+
+    def test_query_budget_is_fixed(self):
+        """With warm caches a meal costs the same queries whatever the user's history"""
+        short_user = self._user('shortmeals')
+        long_user = self._user('longmeals')
+        Meal.objects.create(user=short_user, meal_type=self.breakfast, meal_time=self.now - timedelta(days=1))
+
+        for days in range(1, 15):
+            Meal.objects.create(user=long_user, meal_type=self.breakfast, meal_time=self.now - timedelta(days=days))
+            Meal.objects.create(user=long_user, meal_type=self.lunch, meal_time=self.now - timedelta(days=days))
+
+        self._warm_caches()
+
+        # Streak, insert, feed post, analytics receivers, day counter, groups, settings and profile update
+        with self.assertNumQueries(29):
+            Meal.objects.create(user=short_user, meal_type=self.breakfast, meal_time=self.now)
+
+        with self.assertNumQueries(29):
+            Meal.objects.create(user=long_user, meal_type=self.breakfast, meal_time=self.now)
+
+    def test_meal_config_count_is_cached_and_invalidated(self):
+        """The meal configuration count is shared through the cache after commit and cleared on changes"""
+        self._warm_caches()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(MealConfig.all_meals_count(), 2)
+
+        self.assertEqual(cache.get(MealConfig.MEALS_COUNT_CACHE_KEY), 2)
+
+        MealConfig.objects.create(meal_name='dinner', interval_start=time(18), interval_end=time(21))
+
+        self.assertIsNone(cache.get(MealConfig.MEALS_COUNT_CACHE_KEY))
+
+        self.assertEqual(MealConfig.all_meals_count(), 3)
@@ -0,0 +1,109 @@
+"""
+Tests for the paginated meal lists
+"""
+from datetime import time, timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from nutrition.models import Meal, MealConfig, MealProof
+from profiles.models import Profile
+
+
+class MealsPaginationTest(TestCase):
+    """Test cursor pagination, date filters and prefetching of the meal lists"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='mealpage', email='mealpage@example.com', password='pass1234')
+        self.other_user = User.objects.create_user(username='othermealpage', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Meal Page Company',
+            cnpj='11222333000100',
+            contact_email='mealpage@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        Profile.objects.create(user=self.other_user, employer=self.client_obj)
+        self.meal_config = MealConfig.objects.create(
+            meal_name='breakfast',
+            interval_start=time(6, 0),
+            interval_end=time(10, 0)
+        )
+        self.now = timezone.now()
+        self.meals = [self._meal(self.user, days) for days in range(1, 8)]
+        self._meal(self.other_user, 1)
+
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def _meal(self, user, days_ago):
+        meal = Meal.objects.create(user=user, meal_type=self.meal_config, meal_time=self.now - timedelta(days=days_ago))
+        MealProof.objects.create(checkin=meal, file=f'meal/proof_{meal.id}.jpg')
+
+        return meal
+
+    def test_cursor_walks_every_meal_once(self):
+        """Following the next links returns each meal once, most recent first"""
+        url, params, ids = reverse('meals-by-user', args=[self.user.pk]), {'page_size': 3}, []
+
+        while url:
+            response = self.api.get(url, params)
+            ids += [item['id'] for item in response.data['results']]
+            url, params = response.data['next'], None
+
+        self.assertEqual(ids, [meal.id for meal in self.meals])
+
+    def test_list_is_scoped_to_the_authenticated_user(self):
+        """The meal list only returns the requesting user's meals"""
+        response = self.api.get(reverse('meals-list'), {'page_size': 100})
+
+        self.assertEqual(
+            sorted(item['id'] for item in response.data['results']),
+            sorted(meal.id for meal in self.meals)
+        )
+
+    def test_date_range_filter(self):
+        """start_date/end_date restrict the list to whole local days"""
+        start_date = timezone.localdate(self.meals[4].meal_time)
+        end_date = timezone.localdate(self.meals[2].meal_time)
+
+        response = self.api.get(reverse('meals-list'), {'start_date': start_date, 'end_date': end_date})
+
+        self.assertEqual([item['id'] for item in response.data['results']], [meal.id for meal in self.meals[2:5]])
+
+    def test_invalid_date_is_rejected(self):
+        """Malformed dates return 400"""
+        response = self.api.get(reverse('meals-list'), {'end_date': 'yesterday'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        """Proofs and streaks are fetched with the page instead of per meal"""
+        url = reverse('meals-by-user', args=[self.user.pk])
+
+        with CaptureQueriesContext(connection) as small_page:
+            self.api.get(url, {'page_size': 2})
+
+        with CaptureQueriesContext(connection) as large_page:
+            self.api.get(url, {'page_size': 7})
+
+        self.assertEqual(len(small_page), len(large_page))
+
+    def test_interval_endpoint_is_not_paginated(self):
+        """The date-interval list returns every meal of the range as a plain list"""
+        start_date = timezone.localdate(self.meals[-1].meal_time)
+        end_date = timezone.localdate(self.meals[0].meal_time)
+        url = reverse('meals-by-user-by-interval', args=[self.user.pk, start_date, end_date])
+
+        response = self.api.get(url)
+
+        self.assertEqual([item['id'] for item in response.data], [meal.id for meal in self.meals])
@@ -186,7 +186,7 @@ class MealProofSerializerTest(TestCase):
     def test_meal_proof_serializer_fields(self):
         """Test that serializer includes correct fields"""
         serializer = MealProofSerializer()
-        expected_fields = ['id', 'file']
+        expected_fields = ['id', 'file', 'thumbnail', 'preview']
         self.assertEqual(serializer.Meta.fields, expected_fields)
 
 
@@ -519,8 +519,8 @@ class MealsByUserAPIViewTestCase(APITestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['id'], self.user_meal.pk)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], self.user_meal.pk)
 
     def test_list_meals_by_user_unauthenticated(self):
         """Test listing meals without authentication"""
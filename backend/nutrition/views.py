@@ -1,13 +1,17 @@
 from django.core.exceptions import ValidationError
+from django.utils.dateparse import parse_date
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework import status, permissions
+from rest_framework.exceptions import ValidationError as RequestValidationError
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, ListAPIView
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
+from core.utils import filter_local_dates
 from nutrition.models import Meal, NutritionPlan, MealConfig, meal_choices
+from nutrition.pagination import MealsPagination
 from nutrition.serializer import MealSerializer, NutritionPlanSerializer, MealConfigSerializer, MealChoicesSerializer
 
 
@@ -27,6 +31,30 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         return obj.user == request.user
 
 
+class MealListMixin:
+    """
+    Shared behaviour of the meal list endpoints: cursor pagination (most recent first), optional
+    ``start_date``/``end_date`` query params (YYYY-MM-DD, local days) and the relations read by the serializer
+    fetched with the page instead of per meal.
+    """
+    pagination_class = MealsPagination
+
+    def filter_meals(self, queryset, start_date=None, end_date=None):
+        params = self.request.query_params
+
+        try:
+            queryset = filter_local_dates(
+                queryset,
+                'meal_time',
+                start_date or params.get('start_date'),
+                end_date or params.get('end_date'),
+            )
+        except ValueError as e:
+            raise RequestValidationError({"detail": str(e)})
+
+        return queryset.select_related('user__meal_streak').prefetch_related('proofs')
+
+
 @extend_schema(tags=['Nutrition'])
 class MealChoicesAPIView(ListAPIView):
     serializer_class = MealChoicesSerializer
@@ -110,16 +138,18 @@ class MealTypeAPIView(RetrieveUpdateDestroyAPIView):
 
 
 @extend_schema(tags=['Nutrition'])
-class MealsAPIView(ListCreateAPIView):
+class MealsAPIView(MealListMixin, ListCreateAPIView):
     """
-    API view for listing all nutrition entries and creating new ones.
-    - GET: Returns list of all nutrition entries
+    API view for listing the authenticated user's nutrition entries and creating new ones.
+    - GET: Returns a cursor-paginated list of the user's meals (filterable by start_date/end_date)
     - POST: Creates new nutrition entry for authenticated user
     """
-    queryset = Meal.objects.all()
     serializer_class = MealSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return self.filter_meals(Meal.objects.filter(user=self.request.user))
+
     def perform_create(self, serializer):
         """
         Create nutrition entry with the authenticated user as owner.
@@ -194,10 +224,10 @@ class MealAPIView(RetrieveUpdateDestroyAPIView):
 
 
 @extend_schema(tags=['Nutrition'])
-class MealsByUserAPIView(ListAPIView):
+class MealsByUserAPIView(MealListMixin, ListAPIView):
     """
     API view for retrieving meal check-ins for a specific user.
-    Returns meals ordered by meal date and time (most recent first).
+    Returns meals cursor-paginated by meal date and time (most recent first), filterable by start_date/end_date.
     """
     serializer_class = MealSerializer
     permission_classes = [IsAuthenticated]
@@ -210,17 +240,19 @@ class MealsByUserAPIView(ListAPIView):
         """
         user_id = self.kwargs.get('user_id')
 
-        return Meal.objects.filter(user=user_id).order_by('-meal_time')
+        return self.filter_meals(Meal.objects.filter(user=user_id))
 
 
 @extend_schema(tags=['Nutrition'])
-class MealsByUserByIntervalDateAPIView(ListAPIView):
+class MealsByUserByIntervalDateAPIView(MealListMixin, ListAPIView):
     """
     API view for retrieving meal check-ins for a specific user on a interval date.
-    Returns meals ordered by meal time (most recent first).
+    Returns every meal of the interval ordered by meal time (most recent first); the date range already bounds the
+    list, so it is not paginated.
     """
     serializer_class = MealSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = None
     lookup_field = 'user_id'
 
     def get_queryset(self):
@@ -229,14 +261,13 @@ class MealsByUserByIntervalDateAPIView(ListAPIView):
         Returns check-ins ordered by most recent first.
         """
         user_id = self.kwargs.get('user_id')
-        initial_date = self.kwargs.get('initial_date')
-        end_date = self.kwargs.get('end_date')
-
-        return Meal.objects.filter(
-            user=user_id,
-            meal_time__date__gte=initial_date,
-            meal_time__date__lte=end_date,
-        ).order_by('-meal_time')
+        initial_date = parse_date(self.kwargs.get('initial_date'))
+        end_date = parse_date(self.kwargs.get('end_date'))
+
+        if initial_date is None or end_date is None:
+            return Meal.objects.none()
+
+        return self.filter_meals(Meal.objects.filter(user=user_id), initial_date, end_date).order_by('-meal_time', '-id')
 
 
 @extend_schema(tags=['Nutrition'])
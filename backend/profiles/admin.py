@@ -1,6 +1,5 @@
 from django.contrib import admin
 from django.contrib import messages
-from django.core.exceptions import ValidationError
 from django.utils.html import format_html
 
 from .models import Profile
@@ -11,8 +10,7 @@ class ProfileAdmin(admin.ModelAdmin):
     list_display = ('get_username', 'get_full_name', 'employer', 'score', 'level', 'height', 'weight')
     list_filter = ('employer', 'level')
     search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
-    readonly_fields = ('score', 'level')
-    filter_horizontal = ('groups',)
+    readonly_fields = ('score', 'level', 'get_groups')
 
     fieldsets = (
         ('Usuário', {
@@ -26,7 +24,8 @@ class ProfileAdmin(admin.ModelAdmin):
             'description': 'Estes campos são calculados automaticamente pelo sistema de gamificação.'
         }),
         ('Empresa e Grupos', {
-            'fields': ('employer', 'groups')
+            'fields': ('employer', 'get_groups'),
+            'description': 'Os grupos são gerenciados pelos membros de cada grupo.'
         }),
         ('Preferências', {
             'fields': ('notification_preferences',),
@@ -49,6 +48,11 @@ class ProfileAdmin(admin.ModelAdmin):
     get_full_name.short_description = 'Nome Completo'
     get_full_name.admin_order_field = 'user__first_name'
 
+    def get_groups(self, obj):
+        """Returns the names of the groups the user is an active member of"""
+        return ', '.join(obj.groups.values_list('name', flat=True)) or '-'
+    get_groups.short_description = 'Grupos'
+
     def has_delete_permission(self, request, obj=None):
         """
         Block profile deletion via admin.
@@ -56,54 +60,6 @@ class ProfileAdmin(admin.ModelAdmin):
         """
         return False
 
-    def _validate_group_ownership(self, obj, groups_to_check):
-        """
-        Validates if groups belong to employees of the same company as the profile.
-
-        Args:
-            obj: Profile instance
-            groups_to_check: List or QuerySet of groups to validate
-
-        Raises:
-            ValidationError: If any group doesn't belong to the same company
-        """
-        if not obj.employer:
-            raise ValidationError("Não é possível adicionar grupos a um perfil sem empresa associada.")
-
-        invalid_groups = []
-
-        for group in groups_to_check:
-            # Check if the group owner is an employee of the same company
-            if hasattr(group.owner, 'profile'):
-                group_employer = group.owner.profile.employer
-                if group_employer != obj.employer:
-                    invalid_groups.append({
-                        'group': group,
-                        'employer': group_employer
-                    })
-            else:
-                # If the owner doesn't have a profile, it cannot be validated
-                invalid_groups.append({
-                    'group': group,
-                    'employer': None
-                })
-
-        if invalid_groups:
-            error_msgs = []
-            for item in invalid_groups:
-                if item['employer']:
-                    error_msgs.append(
-                        f"'{item['group'].name}' pertence à empresa '{item['employer'].name}'"
-                    )
-                else:
-                    error_msgs.append(
-                        f"'{item['group'].name}' foi criado por usuário sem empresa"
-                    )
-
-            raise ValidationError(
-                f"Os seguintes grupos não podem ser associados pois não pertencem à empresa '{obj.employer.name}': {'; '.join(error_msgs)}"
-            )
-
     def save_model(self, request, obj, form, change):
         """Additional validation when saving"""
         if change and 'user' in form.changed_data:
@@ -115,44 +71,3 @@ class ProfileAdmin(admin.ModelAdmin):
             return
 
         super().save_model(request, obj, form, change)
-
-    def save_related(self, request, form, formsets, change):
-        """Validate ManyToMany groups before saving"""
-        super().save_related(request, form, formsets, change)
-
-        # Validate groups after saving relationships
-        obj = form.instance
-        if obj.groups.exists():
-            try:
-                self._validate_group_ownership(obj, obj.groups.all())
-            except ValidationError as e:
-                # Remove invalid groups
-                obj.groups.clear()
-                self.message_user(request, str(e), messages.ERROR)
-                self.message_user(
-                    request,
-                    'Os grupos inválidos foram removidos automaticamente.',
-                    messages.WARNING
-                )
-
-    def formfield_for_manytomany(self, db_field, request, **kwargs):
-        """Filter available groups based on the profile's company"""
-        if db_field.name == "groups":
-            # If we are editing (there's an object_id in the URL)
-            if request.resolver_match.kwargs.get('object_id'):
-                try:
-                    from django.contrib.admin.utils import unquote
-                    object_id = unquote(request.resolver_match.kwargs['object_id'])
-                    profile = Profile.objects.get(pk=object_id)
-
-                    if profile.employer:
-                        # Filter groups whose owner is employee of the same company
-                        from groups.models import Group
-                        kwargs["queryset"] = Group.objects.filter(
-                            owner__profile__employer=profile.employer
-                        )
-                except (Profile.DoesNotExist, KeyError):
-                    pass
-
-        return super().formfield_for_manytomany(db_field, request, **kwargs)
-
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from profiles.services import create_missing_streaks
+
+
+class Command(BaseCommand):
+    help = 'Create the workout and meal streak rows of users that do not have them yet'
+
+    def handle(self, *args, **options):
+        created = create_missing_streaks()
+        self.stdout.write(self.style.SUCCESS(f'Created streaks for {created} users.'))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:07
+
+from django.db import migrations
+
+
+def copy_profile_groups_to_members(apps, schema_editor):
+    """
+    Turn the Profile.groups links without a GroupMembers row into active memberships before dropping the field.
+    Existing GroupMembers rows (pending or not) are kept as they are.
+    """
+    Profile = apps.get_model('profiles', 'Profile')
+    GroupMembers = apps.get_model('groups', 'GroupMembers')
+    existing = set(GroupMembers.objects.values_list('member_id', 'group_id'))
+    missing = {
+        (user_id, group_id)
+        for user_id, group_id in Profile.groups.through.objects.values_list('profile__user_id', 'group_id')
+    } - existing
+
+    GroupMembers.objects.bulk_create(
+        [GroupMembers(member_id=user_id, group_id=group_id, pending=False) for user_id, group_id in missing],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('groups', '0008_alter_group_photo'),
+        ('profiles', '0009_profile_employer'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_profile_groups_to_members, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='profile',
+            name='groups',
+        ),
+    ]
@@ -8,7 +8,7 @@ from groups.models import Group
 class Profile(models.Model):
     """
     User profile model that extends Django's User model with additional information.
-    Stores fitness-related data, preferences, and group memberships for each user.
+    Stores fitness-related data and preferences for each user; group memberships live in GroupMembers.
     """
     user = models.OneToOneField(User, on_delete=models.CASCADE)
     height = models.PositiveSmallIntegerField(null=True, blank=True)
@@ -17,8 +17,25 @@ class Profile(models.Model):
     notification_preferences = models.JSONField(default=dict, null=True, blank=True)
     score = models.FloatField(default=0.0)
     level = models.PositiveIntegerField(default=0)
-    groups = models.ManyToManyField(Group, blank=True)
     employer = models.ForeignKey(Client, on_delete=models.PROTECT, related_name='employees')
 
     def __str__(self):
         return f'Profile of {self.user.get_full_name()}'
+
+    @property
+    def groups(self):
+        """
+        Groups the user is an active (non-pending) member of.
+        """
+        return Group.objects.filter(groupmembers__member_id=self.user_id, groupmembers__pending=False)
+
+    @classmethod
+    def employer_id_of(cls, user):
+        """
+        Return the employer id of the user's profile, or None when the user has no profile.
+        Used to denormalize the tenant onto activity rows at creation.
+        """
+        try:
+            return user.profile.employer_id
+        except cls.DoesNotExist:
+            return None
@@ -1,17 +1,30 @@
-from collections import defaultdict
-
-from django.db.models import Window, F
-from django.db.models.functions.window import Rank
 from rest_framework import serializers
 
 from gamification.services import Gamification
 from groups.models import GroupMembers
-from groups.services import compute_group_members_data
+from groups.services import compute_member_positions
 from nutrition.models import MealStreak, MealConfig
 from workouts.models import WorkoutStreak
 from .models import Profile
 
 
+class ProfileListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight serializer for profile lists: profile fields only, without group rankings or streaks.
+    """
+    class Meta:
+        model = Profile
+        fields = (
+            'id',
+            'user',
+            'height',
+            'weight',
+            'photo',
+            'score',
+            'level',
+        )
+
+
 class ProfilesSerialializer(serializers.ModelSerializer):
     """
     Serializer for Profile model with additional workout streak information.
@@ -47,23 +60,20 @@ class ProfilesSerialializer(serializers.ModelSerializer):
     def get_groups(self, obj):
         """
         Get detailed information about groups the user participates in.
-        Uses compute_group_members_data to get monthly ranking per group.
+        Member counts and the user's monthly position come from compute_member_positions, batched across the groups.
         """
-        user_groups = obj.groups.all()
+        user_groups = list(obj.groups.all())
+        positions = compute_member_positions(obj.user_id, [group.id for group in user_groups])
         groups_data = []
 
         for group in user_groups:
-            data = compute_group_members_data(group)
-            members = data['members']
-            member_count = len(members)
-            user_member = next((m for m in members if m['id'] == obj.user.id), None)
-            user_position = user_member['position'] if user_member else None
+            group_position = positions.get(group.id, {})
 
             groups_data.append({
                 'id': group.id,
                 'name': group.name,
-                'member_count': member_count,
-                'position': user_position,
+                'member_count': group_position.get('member_count', 0),
+                'position': group_position.get('position'),
             })
 
         return groups_data
@@ -97,21 +107,11 @@ class ProfilesSerialializer(serializers.ModelSerializer):
         """
         Get workout streak information for the profile's user.
         Returns current streak, longest streak, and last workout date.
-        Returns default values if no workout streak record exists.
+        Returns default values if no workout streak record exists (rows are created at registration, never here).
         """
-        # Fetch workout streak data for the user
-        streak_workout, created = WorkoutStreak.objects.get_or_create(user=obj.user)
-
-        if not created:
-            return {
-                'current_streak': streak_workout.current_streak,
-                'longest_streak': streak_workout.longest_streak,
-                'weekly_remaining': streak_workout.weekly_remaining,
-                'weekly_expected': streak_workout.frequency,
-                'last_workout_date': streak_workout.last_workout_datetime.astimezone() if streak_workout.last_workout_datetime else None  # Convert to user's timezone
-            }
-        else:
-            # Return default values if no streak record exists
+        try:
+            streak_workout = obj.user.workout_streak
+        except WorkoutStreak.DoesNotExist:
             return {
                 'current_streak': 0,
                 'longest_streak': 0,
@@ -120,25 +120,35 @@ class ProfilesSerialializer(serializers.ModelSerializer):
                 'last_workout_date': None
             }
 
-    def get_meal_streak(self, obj):
-        # Fetch workout streak data for the user
-        streak_meal, created = MealStreak.objects.get_or_create(user=obj.user)
-        meals_registered = MealConfig.all_meals_count()
+        return {
+            'current_streak': streak_workout.current_streak,
+            'longest_streak': streak_workout.longest_streak,
+            'weekly_remaining': streak_workout.weekly_remaining,
+            'weekly_expected': streak_workout.frequency,
+            'last_workout_date': streak_workout.last_workout_datetime.astimezone() if streak_workout.last_workout_datetime else None  # Convert to user's timezone
+        }
 
-        if not created:
-            return {
-                'current_streak': streak_meal.current_streak,
-                'longest_streak': streak_meal.longest_streak,
-                'weekly_remaining': streak_meal.weekly_remaining,
-                'weekly_expected': meals_registered * 7,
-                'last_meal_date': streak_meal.last_meal_datetime.astimezone() if streak_meal.last_meal_datetime else None  # Convert to user's timezone
-            }
-        else:
-            # Return default values if no streak record exists
+    def get_meal_streak(self, obj):
+        """
+        Get meal streak information for the profile's user, or default values if no meal streak record exists.
+        """
+        try:
+            streak_meal = obj.user.meal_streak
+        except MealStreak.DoesNotExist:
             return {
                 'current_streak': 0,
                 'longest_streak': 0,
                 'weekly_remaining': 0,
                 'weekly_expected': 0,
-                'last_workout_date': None
+                'last_meal_date': None
             }
+
+        meals_registered = MealConfig.all_meals_count()
+
+        return {
+            'current_streak': streak_meal.current_streak,
+            'longest_streak': streak_meal.longest_streak,
+            'weekly_remaining': streak_meal.weekly_remaining,
+            'weekly_expected': meals_registered * 7,
+            'last_meal_date': streak_meal.last_meal_datetime.astimezone() if streak_meal.last_meal_datetime else None  # Convert to user's timezone
+        }
@@ -0,0 +1,32 @@
+from django.contrib.auth.models import User
+from django.db.models import Q
+
+from nutrition.models import MealStreak
+from workouts.models import WorkoutStreak
+
+
+def create_streaks(user_ids):
+    """
+    Create the workout and meal streak rows missing for ``user_ids``, two INSERTs whatever the number of users.
+    Called at registration so profile reads never have to create them.
+    """
+    user_ids = list(user_ids)
+
+    for model in (WorkoutStreak, MealStreak):
+        model.objects.bulk_create([model(user_id=user_id) for user_id in user_ids], ignore_conflicts=True)
+
+
+def create_missing_streaks(batch_size=1000):
+    """
+    Backfill the streak rows of the users registered before they were created eagerly.
+    Returns the number of users that were missing at least one of them.
+    """
+    user_ids = list(
+        User.objects.filter(Q(workout_streak__isnull=True) | Q(meal_streak__isnull=True))
+        .order_by('id').values_list('id', flat=True)
+    )
+
+    for start in range(0, len(user_ids), batch_size):
+        create_streaks(user_ids[start:start + batch_size])
+
+    return len(user_ids)
@@ -0,0 +1,111 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from clients.models import Client
+from gamification.models import GamificationSettings
+from groups.models import Group
+from nutrition.models import MealStreak
+from profiles.models import Profile
+from workouts.models import WorkoutStreak
+
+
+class ProfileStreakReadsTestCase(APITestCase):
+    """
+    Streak rows are created at registration and profile reads never write.
+    """
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username='streakowner', password='testpassword123')
+        self.client_obj = Client.objects.create(
+            name='Streak Client',
+            cnpj='12.345.678/0001-22',
+            owners=self.owner,
+            contact_email='streak@cliente.test',
+            phone='(11)99999-9999',
+            address='Rua Exemplo, 123, Bairro, Cidade - SP',
+        )
+        self.client_obj.main_group = Group.objects.create(
+            name='Streak Group', owner=self.owner, main=True, created_by=self.owner
+        )
+        self.client_obj.save()
+        # The settings singleton is created once, on its first load
+        GamificationSettings.load()
+
+    def _register(self, username):
+        response = self.client.post(reverse('users-list'), {
+            'username': username,
+            'password': 'password1',
+            'password2': 'password1',
+            'first_name': 'Streak',
+            'last_name': 'User',
+            'email': f'{username}@example.com',
+            'client_code': self.client_obj.client_code,
+        })
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        return User.objects.get(username=username)
+
+    def test_registration_creates_streaks(self):
+        """Registering a user creates both streak rows"""
+        user = self._register('registered')
+
+        self.assertTrue(WorkoutStreak.objects.filter(user=user).exists())
+        self.assertTrue(MealStreak.objects.filter(user=user).exists())
+
+    def test_profile_reads_do_not_write(self):
+        """The detail and me endpoints only issue SELECTs"""
+        user = self._register('reader')
+        self.client.force_authenticate(user)
+
+        with CaptureQueriesContext(connection) as queries:
+            detail = self.client.get(reverse('profile-detail', args=[user.profile.id]))
+            me = self.client.get(reverse('profile-me'))
+
+        self.assertEqual(detail.status_code, status.HTTP_200_OK)
+        self.assertEqual(me.status_code, status.HTTP_200_OK)
+        self.assertEqual(me.data['workout_streak']['weekly_expected'], 5)
+        self.assertTrue(all(query['sql'].lstrip().upper().startswith('SELECT') for query in queries))
+
+    def test_missing_streaks_are_not_created_on_read(self):
+        """Users without streak rows get default values and nothing is created"""
+        user = User.objects.create_user(username='nostreaks', password='testpassword123')
+        Profile.objects.create(user=user, employer=self.client_obj)
+        self.client.force_authenticate(user)
+
+        response = self.client.get(reverse('profile-me'))
+
+        self.assertEqual(response.data['workout_streak']['current_streak'], 0)
+        self.assertIsNone(response.data['meal_streak']['last_meal_date'])
+        self.assertFalse(WorkoutStreak.objects.filter(user=user).exists())
+        self.assertFalse(MealStreak.objects.filter(user=user).exists())
+
+    def test_me_without_profile_returns_not_found(self):
+        """The me endpoint does not create missing profiles"""
+        self.client.force_authenticate(self.owner)
+
+        response = self.client.get(reverse('profile-me'))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Profile.objects.filter(user=self.owner).exists())
+
+    def test_backfill_command(self):
+        """The command creates the streak rows of users registered before them"""
+        user = User.objects.create_user(username='backfilled', password='testpassword123')
+        WorkoutStreak.objects.create(user=user, current_streak=3)
+
+        stdout = StringIO()
+        call_command('create_missing_streaks', stdout=stdout)
+
+        self.assertIn('Created streaks for', stdout.getvalue())
+        self.assertEqual(WorkoutStreak.objects.get(user=user).current_streak, 3)
+        self.assertTrue(MealStreak.objects.filter(user=user).exists())
+        self.assertTrue(WorkoutStreak.objects.filter(user=self.owner).exists())
+        self.assertFalse(User.objects.filter(workout_streak__isnull=True).exists())
+        self.assertFalse(User.objects.filter(meal_streak__isnull=True).exists())
@@ -1,3 +1,4 @@
+from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema
 from rest_framework import status, generics
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -6,18 +7,18 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.views import APIView
 
 from .models import Profile
-from .serializers import ProfilesSerialializer
+from .serializers import ProfileListSerializer, ProfilesSerialializer
 
 
 @extend_schema(tags=['Profiles'])
 class ProfilesAPIView(generics.ListCreateAPIView):
     """
     API view for listing all user profiles.
-    Read-only endpoint that returns all profiles with workout streak information.
-    Requires authentication to access profile data.
+    Read-only endpoint that returns the profile fields of every profile; group positions and streaks are served by
+    the detail and `me` endpoints. Requires authentication to access profile data.
     """
     queryset = Profile.objects.all()
-    serializer_class = ProfilesSerialializer
+    serializer_class = ProfileListSerializer
     permission_classes = [IsAuthenticated]  # Require authentication to view profiles
     http_method_names = ['get']  # Only allow GET requests (read-only)
 
@@ -29,7 +30,7 @@ class ProfileAPIView(generics.RetrieveUpdateAPIView):
     Allows authenticated users to view and update specific profile information.
     Supports file uploads for profile photos.
     """
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related('user__workout_streak', 'user__meal_streak')
     serializer_class = ProfilesSerialializer
     permission_classes = [IsAuthenticated]  # Require authentication for profile access
     http_method_names = ['get', 'put', 'patch']  # Allow GET (retrieve) and PUT (update) operations
@@ -39,15 +40,13 @@ class ProfileAPIView(generics.RetrieveUpdateAPIView):
 class ProfileMeAPIView(APIView):
     """
     API view for retrieving profile the authenticated user.
-    Returns Profile associated with the user.
+    Returns Profile associated with the user. Read-only: users without a profile get a 404.
     """
+    queryset = Profile.objects.select_related('user__workout_streak', 'user__meal_streak')
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        try:
-            profile = Profile.objects.get(user=self.request.user)
-        except Profile.DoesNotExist:
-            profile = Profile.objects.create(user=self.request.user)
+        profile = get_object_or_404(self.queryset, user=self.request.user)
 
         serializer = ProfilesSerialializer(profile)
 
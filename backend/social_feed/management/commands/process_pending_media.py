@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from core.media import PROCESS_BATCH_SIZE, process_pending_media
+
+
+class Command(BaseCommand):
+    help = (
+        'Build the thumbnail/preview variants of pending proof and post media '
+        '(the same job run every minute by the scheduler)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=PROCESS_BATCH_SIZE, help='Files processed per media model'
+        )
+
+    def handle(self, *args, **options):
+        metrics = process_pending_media(batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Media processed: {metrics["files_processed"]} ({metrics["variants_created"]} with variants, '
+            f'{metrics["duration_ms"]} ms).'
+        ))
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.3 on 2026-10-18 23:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_employer(apps, schema_editor):
+    Post = apps.get_model('social_feed', 'Post')
+    Profile = apps.get_model('profiles', 'Profile')
+
+    Post.objects.filter(employer__isnull=True).update(
+        employer_id=Subquery(Profile.objects.filter(user_id=OuterRef('user_id')).values('employer_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_profile_employer'),
+        ('clients', '0010_alter_client_client_code'),
+        ('nutrition', '0006_meal_employer'),
+        ('social_feed', '0005_alter_post_meal_alter_post_workout_checkin'),
+        ('status', '0005_alter_status_app_name'),
+        ('workouts', '0019_workoutcheckin_employer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='employer',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='posts', to='clients.client'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['employer', '-created_at'], name='social_feed_employe_e8fd72_idx'),
+        ),
+        migrations.RunPython(backfill_employer, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:06
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_employer(apps, schema_editor):
+    Comment = apps.get_model('social_feed', 'Comment')
+    Profile = apps.get_model('profiles', 'Profile')
+
+    Comment.objects.filter(employer__isnull=True).update(
+        employer_id=Subquery(Profile.objects.filter(user_id=OuterRef('user_id')).values('employer_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_profile_employer'),
+        ('clients', '0010_alter_client_client_code'),
+        ('social_feed', '0006_post_employer'),
+        ('status', '0005_alter_status_app_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='employer',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='comments', to='clients.client'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['employer', '-created_at'], name='social_feed_employe_2e4511_idx'),
+        ),
+        migrations.RunPython(backfill_employer, migrations.RunPython.noop),
+    ]
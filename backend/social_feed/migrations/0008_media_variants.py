@@ -0,0 +1,33 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:51
+
+import core.media
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social_feed', '0007_comment_employer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentfilepost',
+            name='preview',
+            field=models.FileField(blank=True, editable=False, max_length=255, null=True, upload_to=core.media.media_variant_path),
+        ),
+        migrations.AddField(
+            model_name='contentfilepost',
+            name='thumbnail',
+            field=models.FileField(blank=True, editable=False, max_length=255, null=True, upload_to=core.media.media_variant_path),
+        ),
+        migrations.AddField(
+            model_name='contentfilepost',
+            name='variants_processed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='contentfilepost',
+            index=models.Index(condition=models.Q(('variants_processed_at__isnull', True)), fields=['id'], name='post_file_pending_idx'),
+        ),
+    ]
@@ -2,32 +2,20 @@ from django.contrib.auth.models import User
 from django.core.validators import FileExtensionValidator
 from django.db import models
 
+from core.media import MediaVariantsModel
 from nutrition.models import Meal
-from status.models import Status
+from profiles.models import Profile
+from status.models import Status, StatusRegistry
 from workouts.models import WorkoutCheckin
 
 
 # ---------------------------------- Helper Functions ---------------------------------- #
 def get_post_published_status_id():
-    obj, _ = Status.objects.get_or_create(
-        app_name='POST',
-        action='PUBLISHED',
-        is_active=True,
-        defaults={'name': 'Publicado'}
-    )
-
-    return obj.id
+    return StatusRegistry.get_id('POST', 'PUBLISHED', 'Publicado')
 
 
 def get_comment_published_status_id():
-    obj, _ = Status.objects.get_or_create(
-        app_name='COMMENT',
-        action='PUBLISHED',
-        is_active=True,
-        defaults={'name': 'Publicado'}
-    )
-
-    return obj.id
+    return StatusRegistry.get_id('COMMENT', 'PUBLISHED', 'Publicado')
 
 
 # ------------------------------------- Models ------------------------------------- #
@@ -79,6 +67,15 @@ class Post(models.Model):
         blank=True,
         related_name='posts'
     )
+    # Employer of the post's author at creation, like WorkoutCheckin.employer
+    employer = models.ForeignKey(
+        'clients.Client',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='posts'
+    )
 
     class Meta:
         ordering = ['-created_at']
@@ -86,15 +83,23 @@ class Post(models.Model):
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['visibility', '-created_at']),
             models.Index(fields=['content_type', '-created_at']),
+            models.Index(fields=['employer', '-created_at']),
         ]
 
     def __str__(self):
         return f"{self.user.username} - {self.content_type} post - {self.created_at}"
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.employer_id is None:
+            self.employer_id = Profile.employer_id_of(self.user)
 
-class ContentFilePost(models.Model):
+        super().save(*args, **kwargs)
+
+
+class ContentFilePost(MediaVariantsModel):
     """
     Model to handle multiple media files for a single post.
+    Thumbnail/preview variants are built asynchronously by the media pipeline (core.media).
     """
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='content_files')
     file = models.FileField(
@@ -106,6 +111,9 @@ class ContentFilePost(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=['post', 'uploaded_at']),
+            models.Index(
+                fields=['id'], name='post_file_pending_idx', condition=models.Q(variants_processed_at__isnull=True)
+            ),
         ]
 
     def __str__(self):
@@ -148,17 +156,33 @@ class Comment(models.Model):
         limit_choices_to={'is_active': True, 'app_name': 'COMMENT'},
         default=get_comment_published_status_id
     )
+    # Employer of the comment's author at creation, like WorkoutCheckin.employer
+    employer = models.ForeignKey(
+        'clients.Client',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='comments'
+    )
 
     class Meta:
         ordering = ['created_at']
         indexes = [
             models.Index(fields=['post', 'created_at']),
             models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['employer', '-created_at']),
         ]
 
     def __str__(self):
         return f"{self.user.username} comment on {self.post.id} - {self.created_at}"
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.employer_id is None:
+            self.employer_id = Profile.employer_id_of(self.user)
+
+        super().save(*args, **kwargs)
+
 
 class CommentLike(models.Model):
     """
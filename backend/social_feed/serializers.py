@@ -1,17 +1,18 @@
 from rest_framework import serializers
 
 from authentication.serializer import UserSimpleSerializer
+from core.media import BatchedMediaListSerializer
 from .models import Post, Comment, Report, PostLike, CommentLike, ContentFilePost
 from workouts.serializer import WorkoutCheckinSerializer
 from nutrition.serializer import MealSerializer
 
 
 class ContentFilePostSerializer(serializers.ModelSerializer):
-    """Serializer for post media files"""
+    """Serializer for post media files and their thumbnail/preview variants (null until processed)"""
     class Meta:
         model = ContentFilePost
-        fields = ['id', 'file', 'uploaded_at']
-        read_only_fields = ['id', 'uploaded_at']
+        fields = ['id', 'file', 'thumbnail', 'preview', 'uploaded_at']
+        read_only_fields = ['id', 'thumbnail', 'preview', 'uploaded_at']
 
 
 class PostLikeSerializer(serializers.ModelSerializer):
@@ -117,6 +118,13 @@ class PostListSerializer(serializers.ModelSerializer):
             'comments_count', 'likes_count', 'created_at', 'visibility',
             'allow_comments', 'is_liked_by_user', 'is_superuser_post', 
         ]
+        # Media URLs of a whole page are signed in one batch
+        media_paths = tuple(
+            f'{relation}.{field}'
+            for relation in ('content_files', 'workout_checkin.proofs', 'meal.proofs')
+            for field in ('file', 'thumbnail', 'preview')
+        )
+        list_serializer_class = BatchedMediaListSerializer
         read_only_fields = ['id', 'profile_id', 'created_at', 'comments_count', 'likes_count', 'is_superuser_post']
 
     def get_profile_id(self, obj):
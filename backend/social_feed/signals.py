@@ -3,8 +3,9 @@ from django.dispatch import receiver
 from django.db.models import F
 
 from workouts.models import WorkoutCheckin
+from workouts.signals import workouts_imported
 from nutrition.models import Meal
-from .models import Post, PostLike, Comment, CommentLike
+from .models import Post, PostLike, Comment, CommentLike, get_post_published_status_id
 
 
 # ---------------------------------- WorkoutCheckin Signals ---------------------------------- #
@@ -18,11 +19,33 @@ def create_post_from_workout_checkin(sender, instance, created, **kwargs):
             user=instance.user,
             content_type='workout',
             workout_checkin=instance,
+            employer_id=instance.employer_id,
             visibility='global',
             allow_comments=True
         )
 
 
+@receiver(workouts_imported)
+def create_posts_from_imported_workouts(sender, workouts, **kwargs):
+    """
+    Create the posts of bulk imported check-ins with a single insert.
+    """
+    status_id = get_post_published_status_id()
+
+    Post.objects.bulk_create([
+        Post(
+            user_id=workout.user_id,
+            content_type='workout',
+            workout_checkin=workout,
+            employer_id=workout.employer_id,
+            status_id=status_id,
+            visibility='global',
+            allow_comments=True
+        )
+        for workout in workouts
+    ], batch_size=500)
+
+
 # ---------------------------------- Meal Signals ---------------------------------- #
 @receiver(post_save, sender=Meal)
 def create_post_from_meal(sender, instance, created, **kwargs):
@@ -34,6 +57,7 @@ def create_post_from_meal(sender, instance, created, **kwargs):
             user=instance.user,
             content_type='meal',
             meal=instance,
+            employer_id=instance.employer_id,
             visibility='global',
             allow_comments=True
         )
@@ -76,6 +76,31 @@ class PostModelTest(SocialFeedBaseTestCase):
         self.assertEqual(post.meal, meal)
         self.assertIsNone(post.workout_checkin)
 
+    def test_posts_copy_employer(self):
+        """Teste que workouts, meals e posts herdam o employer do profile."""
+        workout_checkin = WorkoutCheckin.objects.create(
+            user=self.user1,
+            workout_date=timezone.now() - timedelta(hours=1),
+            duration=timedelta(minutes=60)
+        )
+        meal_config = MealConfig.objects.create(
+            meal_name='lunch',
+            interval_start=time(11, 0),
+            interval_end=time(14, 0)
+        )
+        meal = Meal.objects.create(
+            user=self.user1,
+            meal_type=meal_config,
+            meal_time=timezone.make_aware(datetime.combine(timezone.localdate() - timedelta(days=1), time(12, 0)))
+        )
+        social_post = Post.objects.create(user=self.user2, content_type='social', content_text=fake.text())
+
+        self.assertEqual(workout_checkin.employer, self.test_client)
+        self.assertEqual(meal.employer, self.test_client)
+        self.assertEqual(workout_checkin.posts.get().employer, self.test_client)
+        self.assertEqual(meal.posts.get().employer, self.test_client)
+        self.assertEqual(social_post.employer, self.test_client)
+
     def test_post_str_method(self):
         """Teste método __str__ do Post."""
         post = Post.objects.create(
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from django.db.models import Q
+from core.replica import ReplicaReadMixin
 from .models import Post, Comment, Report, PostLike, CommentLike
 from .serializers import (
     PostSerializer, PostListSerializer, PostCreateSerializer, PostUpdateSerializer,
@@ -14,7 +15,7 @@ from .pagination import PostsPagination, CommentsPagination, ReportsPagination
 
 
 @extend_schema(tags=['Social Feed'])
-class PostViewSet(ModelViewSet):
+class PostViewSet(ReplicaReadMixin, ModelViewSet):
     """ViewSet for managing posts in the social feed."""
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = PostsPagination
@@ -44,7 +45,7 @@ class PostViewSet(ModelViewSet):
         queryset = Post.objects.select_related(
             'user__profile', 'workout_checkin', 'meal'
         ).prefetch_related(
-            'comments__user', 'likes__user', 'content_files'
+            'comments__user', 'likes__user', 'content_files', 'workout_checkin__proofs', 'meal__proofs'
         )
 
         # In general listing, expose only published posts.
@@ -84,13 +85,13 @@ class PostViewSet(ModelViewSet):
 
         if visibility_filter:
             queryset = queryset.filter(
-                Q(visibility=visibility_filter, user__profile__employer=employer) |
+                Q(visibility=visibility_filter, employer=employer) |
                 Q(visibility=visibility_filter, user__is_superuser=True)  # Include posts from superusers with specified visibility
             )
         else:
             # Default: show global posts from same employer and all posts from superusers
             queryset = queryset.filter(
-                Q(visibility='global', user__profile__employer=employer) |
+                Q(visibility='global', employer=employer) |
                 Q(user__is_superuser=True)  # Include all posts from superusers
             )
 
@@ -308,7 +309,7 @@ class ReportDetailView(generics.RetrieveUpdateAPIView):
 
 
 @extend_schema(tags=['Social Feed'])
-class UserPostsView(generics.ListAPIView):
+class UserPostsView(ReplicaReadMixin, generics.ListAPIView):
     """Get all posts from a specific user."""
     serializer_class = PostListSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -320,7 +321,9 @@ class UserPostsView(generics.ListAPIView):
 
         return Post.objects.filter(
             user_id=user_id
-        ).select_related('user').order_by('-created_at')
+        ).select_related('user', 'workout_checkin', 'meal').prefetch_related(
+            'content_files', 'workout_checkin__proofs', 'meal__proofs'
+        ).order_by('-created_at')
 
 
 # class UserFeedView(generics.ListAPIView):
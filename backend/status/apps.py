@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class StatusConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'status'
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        import status.signals  # noqa
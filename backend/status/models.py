@@ -1,5 +1,7 @@
+import threading
+
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import connection, models, transaction
 import importlib
 
 
@@ -84,3 +86,66 @@ class Status(models.Model):
 
             if related_objs.exists():
                 related_objs.update(status=new_status)
+
+
+class StatusRegistry:
+    """
+    In-process cache of the active Status ids keyed by (app_name, action).
+    The first lookup loads every active status with one query, so the create paths (and the default= callables of
+    the status foreign keys) stop querying the Status table. It is cleared on every Status save/delete of this process.
+    Ids read inside a transaction are only cached once it commits, so a rolled back status is never served.
+    """
+    _ids = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _remember(cls, ids):
+        def store():
+            with cls._lock:
+                if cls._ids is None:
+                    cls._ids = {}
+
+                cls._ids.update(ids)
+
+        if connection.in_atomic_block:
+            transaction.on_commit(store)
+        else:
+            store()
+
+    @classmethod
+    def warm(cls):
+        """
+        Load the ids of every active status.
+        """
+        cls._remember({
+            (app_name, action): status_id
+            for status_id, app_name, action in Status.objects.filter(is_active=True).values_list('id', 'app_name', 'action')
+        })
+
+    @classmethod
+    def get_id(cls, app_name, action, default_name=None):
+        """
+        Return the id of the active status of ``app_name``/``action``, creating it (named ``default_name``) if missing.
+        """
+        if cls._ids is None and not connection.in_atomic_block:
+            cls.warm()
+
+        ids = cls._ids or {}
+
+        if (app_name, action) in ids:
+            return ids[(app_name, action)]
+
+        status, _ = Status.objects.get_or_create(
+            app_name=app_name,
+            action=action,
+            is_active=True,
+            defaults={'name': default_name or action.title()}
+        )
+        cls._remember({(app_name, action): status.id})
+
+        return status.id
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._ids = None
@@ -0,0 +1,23 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, post_migrate
+from django.dispatch import receiver
+
+from .models import Status, StatusRegistry
+
+
+@receiver(post_save, sender=Status)
+@receiver(post_delete, sender=Status)
+def clear_status_registry(sender, **kwargs):
+    """
+    Drop the cached status ids when a status changes; cleared again on commit so lookups made meanwhile are dropped too.
+    """
+    StatusRegistry.clear()
+    transaction.on_commit(StatusRegistry.clear)
+
+
+@receiver(post_migrate)
+def clear_status_registry_after_migrate(sender, **kwargs):
+    """
+    Migrations and flushes rewrite the table without model signals.
+    """
+    StatusRegistry.clear()
@@ -0,0 +1,73 @@
+from django.test import TestCase
+
+from social_feed.models import Comment, Post, get_comment_published_status_id, get_post_published_status_id
+from status.models import Status, StatusRegistry, StatusAction, TargetApp
+from workouts.models import WorkoutCheckin
+
+
+class StatusRegistryTest(TestCase):
+
+    def setUp(self):
+        StatusRegistry.clear()
+        self.addCleanup(StatusRegistry.clear)
+        self.workout_status = Status.objects.create(
+            name='Publicado',
+            app_name=TargetApp.WORKOUT,
+            action=StatusAction.PUBLISHED
+        )
+
+    def _warm(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            StatusRegistry.clear()
+            StatusRegistry.warm()
+
+    def test_lookups_are_cached_after_commit(self):
+        """Ids are served from memory once the transaction that read them commits"""
+        with self.captureOnCommitCallbacks(execute=True):
+            status_id = StatusRegistry.get_id(TargetApp.WORKOUT, StatusAction.PUBLISHED)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(StatusRegistry.get_id(TargetApp.WORKOUT, StatusAction.PUBLISHED), status_id)
+
+        self.assertEqual(status_id, self.workout_status.id)
+
+    def test_uncommitted_lookups_are_not_cached(self):
+        """A status read or created in a transaction that is not committed is never cached"""
+        StatusRegistry.get_id(TargetApp.POST, StatusAction.PUBLISHED, 'Publicado')
+
+        with self.assertNumQueries(1):
+            StatusRegistry.get_id(TargetApp.POST, StatusAction.PUBLISHED, 'Publicado')
+
+    def test_missing_status_is_created(self):
+        """Missing statuses are created with the default name"""
+        with self.captureOnCommitCallbacks(execute=True):
+            status_id = StatusRegistry.get_id(TargetApp.COMMENT, StatusAction.PUBLISHED, 'Publicado')
+
+        status = Status.objects.get(id=status_id)
+        self.assertEqual((status.app_name, status.action, status.name), ('COMMENT', 'PUBLISHED', 'Publicado'))
+        self.assertTrue(status.is_active)
+
+    def test_status_changes_clear_the_registry(self):
+        """Saving or deleting a status drops the cached ids"""
+        self._warm()
+
+        self.workout_status.is_active = False
+        self.workout_status.save()
+
+        new_status_id = StatusRegistry.get_id(TargetApp.WORKOUT, StatusAction.PUBLISHED, 'Publicado')
+        self.assertNotEqual(new_status_id, self.workout_status.id)
+
+    def test_default_callables_do_not_query_when_warm(self):
+        """Instantiating check-ins, posts and comments without a status reads the cached ids"""
+        Status.objects.create(name='Publicado', app_name=TargetApp.POST, action=StatusAction.PUBLISHED)
+        Status.objects.create(name='Publicado', app_name=TargetApp.COMMENT, action=StatusAction.PUBLISHED)
+        self._warm()
+
+        with self.assertNumQueries(0):
+            workout = WorkoutCheckin()
+            post = Post()
+            comment = Comment()
+
+        self.assertEqual(workout.validation_status_id, self.workout_status.id)
+        self.assertEqual(post.status_id, get_post_published_status_id())
+        self.assertEqual(comment.status_id, get_comment_published_status_id())
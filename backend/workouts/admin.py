@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib import messages
 
-from .models import WorkoutCheckin, WorkoutCheckinProof, WorkoutPlan, WorkoutStreak
+from .models import WorkoutCheckin, WorkoutCheckinProof, WorkoutDailySummary, WorkoutPlan, WorkoutStreak
 
 
 class WorkoutCheckinProofInline(admin.TabularInline):
@@ -76,6 +76,20 @@ class WorkoutCheckinAdmin(admin.ModelAdmin):
         )
 
 
+@admin.register(WorkoutDailySummary)
+class WorkoutDailySummaryAdmin(admin.ModelAdmin):
+    list_display = ('user', 'date', 'workout_count', 'total_duration', 'awarded_points', 'bonus_points', 'penalty_points')
+    list_filter = ('date',)
+    search_fields = ('user__username', 'user__email')
+    date_hierarchy = 'date'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(WorkoutCheckinProof)
 class WorkoutCheckinProofAdmin(admin.ModelAdmin):
     list_display = ('checkin', 'file', 'get_user')
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class WorkoutsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'workouts'
+
+    def ready(self):
+        """Import signals when the app is ready."""
+        import workouts.signals  # noqa
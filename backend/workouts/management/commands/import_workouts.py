@@ -0,0 +1,54 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from workouts.serializer import WorkoutBulkItemSerializer
+from workouts.services import WorkoutBulkImportService
+
+
+class Command(BaseCommand):
+    help = 'Import workout check-ins from a JSON file with a list of workouts (same items as the bulk endpoint)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('file', type=str, help='Path of the JSON file')
+        parser.add_argument('--dry-run', action='store_true', help='Only validate the workouts')
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['file']) as file:
+                items = json.load(file)
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read the workouts file: {e}')
+
+        if not isinstance(items, list):
+            raise CommandError('The workouts file must contain a list of workouts.')
+
+        errors = 0
+        created = 0
+
+        for start in range(0, len(items), WorkoutBulkImportService.MAX_BATCH_SIZE):
+            batch = items[start:start + WorkoutBulkImportService.MAX_BATCH_SIZE]
+            valid_items = []
+
+            for index, item in enumerate(batch, start=start):
+                serializer = WorkoutBulkItemSerializer(data=item)
+
+                if serializer.is_valid():
+                    valid_items.append((index, serializer.validated_data))
+                else:
+                    errors += 1
+                    self.stderr.write(f'Workout {index}: {serializer.errors}')
+
+            results = WorkoutBulkImportService([data for _, data in valid_items]).run(dry_run=options['dry_run'])
+
+            for (index, _), result in zip(valid_items, results):
+                if result['status'] == 'error':
+                    errors += 1
+                    self.stderr.write(f'Workout {index}: {result["errors"]}')
+                elif result['status'] == 'created':
+                    created += 1
+
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Dry run: {len(items) - errors} valid workouts, {errors} errors.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Workouts imported: {created} created, {errors} errors.'))
@@ -0,0 +1,59 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models.functions import TruncDate
+
+from workouts.models import WorkoutCheckin, WorkoutDailySummary
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the workout daily summaries from the check-ins, bonuses and penalties (points are not rescored)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user-id', '-i', type=int, action='append', help='Only rebuild this user (repeatable)')
+        parser.add_argument('--since', type=str, help='Only rebuild days from this date on (YYYY-MM-DD)')
+
+    def handle(self, *args, **options):
+        user_ids = options.get('user_id')
+        since = options.get('since')
+        workouts = WorkoutCheckin.objects.order_by()
+        summaries = WorkoutDailySummary.objects.all()
+
+        if user_ids:
+            workouts = workouts.filter(user_id__in=user_ids)
+            summaries = summaries.filter(user_id__in=user_ids)
+
+        if since:
+            try:
+                since = date.fromisoformat(since)
+            except ValueError:
+                raise CommandError('--since must be a date in the YYYY-MM-DD format.')
+
+            workouts = workouts.annotate(workout_day=TruncDate('workout_date')).filter(workout_day__gte=since)
+            summaries = summaries.filter(date__gte=since)
+        else:
+            workouts = workouts.annotate(workout_day=TruncDate('workout_date'))
+
+        days = set(workouts.values_list('user_id', 'workout_day').distinct())
+
+        # Summaries of days left without check-ins
+        stale_ids = [
+            summary_id
+            for summary_id, user_id, day in summaries.values_list('id', 'user_id', 'date')
+            if (user_id, day) not in days
+        ]
+        deleted, _ = WorkoutDailySummary.objects.filter(id__in=stale_ids).delete()
+
+        for index, (user_id, day) in enumerate(sorted(days), start=1):
+            WorkoutDailySummary.objects.update_or_create(
+                user_id=user_id,
+                date=day,
+                defaults=WorkoutDailySummary.aggregate_day(user_id, day),
+            )
+
+            if index % 1000 == 0:
+                self.stdout.write(f'Rebuilt {index}/{len(days)} days...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Workout daily summaries rebuilt: {len(days)} days, {deleted} stale summaries removed.'
+        ))
@@ -0,0 +1,44 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from clients.models import Client
+from workouts.services import WorkoutPointsRecalculationService
+
+
+class Command(BaseCommand):
+    help = 'Recalculate the base points of workout check-ins in bulk (e.g. after a gamification settings change)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--client', '-c', type=int, help='Only recalculate workouts of this client id')
+        parser.add_argument('--since', type=str, help='Only recalculate days from this date on (YYYY-MM-DD)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Number of workout days written per statement')
+        parser.add_argument('--dry-run', action='store_true', help='Compute the changes without writing them')
+
+    def handle(self, *args, **options):
+        client = None
+        since = None
+
+        if options.get('client'):
+            try:
+                client = Client.objects.get(pk=options['client'])
+            except Client.DoesNotExist:
+                raise CommandError(f'Client {options["client"]} not found.')
+
+        if options.get('since'):
+            try:
+                since = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError('--since must be a date in the YYYY-MM-DD format.')
+
+        service = WorkoutPointsRecalculationService(client=client, since=since, chunk_size=options['chunk_size'])
+        result = service.run(
+            dry_run=options['dry_run'],
+            progress=lambda done, total: self.stdout.write(f'Processed {done}/{total} workout days...'),
+        )
+
+        prefix = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix}Workout points recalculated: {result["processed_days"]} days processed, '
+            f'{result["updated_days"]} days updated.'
+        ))
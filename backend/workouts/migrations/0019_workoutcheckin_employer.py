@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-18 23:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_employer(apps, schema_editor):
+    WorkoutCheckin = apps.get_model('workouts', 'WorkoutCheckin')
+    Profile = apps.get_model('profiles', 'Profile')
+
+    WorkoutCheckin.objects.filter(employer__isnull=True).update(
+        employer_id=Subquery(Profile.objects.filter(user_id=OuterRef('user_id')).values('employer_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0009_profile_employer'),
+        ('clients', '0010_alter_client_client_code'),
+        ('groups', '0008_alter_group_photo'),
+        ('status', '0005_alter_status_app_name'),
+        ('workouts', '0018_delete_workoutdailysummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workoutcheckin',
+            name='employer',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='workout_checkins', to='clients.client'),
+        ),
+        migrations.AddIndex(
+            model_name='workoutcheckin',
+            index=models.Index(fields=['employer', 'workout_date'], name='workouts_wo_employe_ceae5d_idx'),
+        ),
+        migrations.RunPython(backfill_employer, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0010_alter_client_client_code'),
+        ('groups', '0008_alter_group_photo'),
+        ('status', '0005_alter_status_app_name'),
+        ('workouts', '0020_workoutdailysummary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workoutcheckin',
+            index=models.Index(fields=['user', 'workout_date'], name='workouts_wo_user_id_16b991_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:33
+
+import datetime
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+
+
+def backfill_week_counts(apps, schema_editor):
+    WorkoutCheckin = apps.get_model('workouts', 'WorkoutCheckin')
+    WorkoutWeekCount = apps.get_model('workouts', 'WorkoutWeekCount')
+    week_counts = {}
+
+    day_counts = WorkoutCheckin.objects.order_by().annotate(
+        day=TruncDate('workout_date')
+    ).values('user_id', 'day').annotate(count=Count('id'))
+
+    for row in day_counts:
+        # Weeks start on Sunday
+        week_start = row['day'] - datetime.timedelta(days=(row['day'].weekday() + 1) % 7)
+        key = (row['user_id'], week_start)
+        week_counts[key] = week_counts.get(key, 0) + row['count']
+
+    WorkoutWeekCount.objects.bulk_create([
+        WorkoutWeekCount(user_id=user_id, week_start=week_start, count=count)
+        for (user_id, week_start), count in week_counts.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workouts', '0021_workoutcheckin_user_workout_date_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkoutWeekCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workout_week_counts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Workout week count',
+                'verbose_name_plural': 'Workout week counts',
+                'constraints': [models.UniqueConstraint(fields=('user', 'week_start'), name='unique_workout_week_count')],
+            },
+        ),
+        migrations.RunPython(backfill_week_counts, migrations.RunPython.noop),
+    ]
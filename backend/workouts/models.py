@@ -4,26 +4,22 @@ from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
-from django.db import models
-from django.db.models import Count, Q, Sum
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncDate
 from django.utils import timezone
 
+from core.media import MediaVariantsModel
+from core.utils import increment_counter, local_date, local_day_range, week_start_for
 from gamification.models import GamificationBonus, GamificationPenalty
 from gamification.services import Gamification
+from groups.models import GroupMemberships
 from profiles.models import Profile
-from status.models import Status
-from django.core.exceptions import ObjectDoesNotExist as RelatedObjectDoesNotExist
+from status.models import Status, StatusRegistry
 
 
 def get_published_status_id():
-    obj, _ = Status.objects.get_or_create(
-        app_name='WORKOUT',
-        action='PUBLISHED',
-        is_active=True,
-        defaults={'name': 'Publicado'}
-    )
-
-    return obj.id
+    return StatusRegistry.get_id('WORKOUT', 'PUBLISHED', 'Publicado')
 
 
 class WorkoutCheckin(models.Model):
@@ -42,6 +38,22 @@ class WorkoutCheckin(models.Model):
     base_points = models.FloatField(null=True, blank=True, editable=False)
     multiplier = models.FloatField(default=1.0)
     groups = models.ManyToManyField('groups.Group', blank=True)
+    # Employer of the user, copied from the profile at creation. Client-scoped listings, rankings and reports filter
+    # on this column instead of joining through auth_user and profiles; meals, posts and comments keep the same copy
+    employer = models.ForeignKey(
+        'clients.Client',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='workout_checkins'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['employer', 'workout_date']),
+            models.Index(fields=['user', 'workout_date']),
+        ]
 
     def __str__(self):
         return f'Workout check-in for {self.user}'
@@ -52,110 +64,118 @@ class WorkoutCheckin(models.Model):
         Automatically sets validation status and updates user's score.
         """
         is_new = self.pk is None
-        workout_day = self.workout_date.date()
-        day_points_before_save = 0.0
-
-        if is_new:
-            day_points_before_save = self.user.workouts.filter(
-                workout_date__date=workout_day
-            ).aggregate(total_xp=Sum('base_points'))['total_xp'] or 0.0
 
         self.clean()
         # Set validation status to published for workouts
-        self.validation_status = Status.objects.filter(app_name='WORKOUT', action='PUBLISHED', is_active=True).first()
-
-        streak, created = WorkoutStreak.objects.get_or_create(
-            user=self.user,
-            defaults={
-                'current_streak': 1,
-                'longest_streak': 1,
-                'last_workout_datetime': self.workout_date.astimezone(),
-            }
-        )
+        self.validation_status_id = get_published_status_id()
+
+        with transaction.atomic():
+            streak, created = WorkoutStreak.objects.get_or_create(
+                user=self.user,
+                defaults={
+                    'current_streak': 1,
+                    'longest_streak': 1,
+                    'last_workout_datetime': self.workout_date.astimezone(),
+                }
+            )
+
+            if not created:
+                streak.update_streak(self.workout_date.astimezone())
 
-        if not created:
-            streak.update_streak(self.workout_date.astimezone())
+            if is_new:
+                if self.employer_id is None:
+                    self.employer_id = Profile.employer_id_of(self.user)
 
-        if is_new:
-            # Calculate multiplier and points based on streak and duration
-            self.multiplier = Gamification.Workout.get_multiplier(self.user)
-            self.base_points = Gamification.Workout.calculate(self.user, self.duration, self.workout_date)
+                # The day summary row is locked until commit, so concurrent check-ins of the same day are serialized
+                summary = WorkoutDailySummary.lock(self.user_id, local_date(self.workout_date))
+                day_points_before_save = summary.awarded_points
 
-        super().save(*args, **kwargs)
+                # Calculate multiplier and points based on streak and duration
+                self.multiplier = Gamification.Workout.get_multiplier(self.user)
+                self.base_points = summary.add_workout(self.user, self.duration)
 
-        self.groups.set([group.id for group in self.user.profile.groups.all()])
+            super().save(*args, **kwargs)
 
-        if is_new:
-            day_points_after_save = self.user.workouts.filter(
-                workout_date__date=workout_day
-            ).aggregate(total_xp=Sum('base_points'))['total_xp'] or 0.0
+            if is_new:
+                WorkoutCheckin.groups.through.objects.bulk_create([
+                    WorkoutCheckin.groups.through(workoutcheckin_id=self.id, group_id=group_id)
+                    for group_id in GroupMemberships.active_group_ids(self.user_id)
+                ])
+                WorkoutWeekCount.bump(self.user_id, local_date(self.workout_date), 1)
 
-            xp_to_add = max(float(day_points_after_save) - float(day_points_before_save), 0.0)
+                xp_to_add = max(float(summary.awarded_points) - float(day_points_before_save), 0.0)
 
-            # Update the user's profile with the day points difference.
-            if xp_to_add > 0:
-                Gamification().add_xp(self.user, xp_to_add)
+                # Update the user's profile with the day points difference.
+                if xp_to_add > 0:
+                    Gamification().add_xp(self.user, xp_to_add)
 
     def delete(self, *args, **kwargs):
+        """
+        Delete the check-in reverting its side effects in one transaction: day points of the remaining check-ins,
+        bonuses/penalties given to it, the daily summary and counters, the streak and a single profile update.
+        """
         user = self.user
         workout_date = self.workout_date
-        workout_day = workout_date.date()
-        workout_id = self.id
-
-        day_points_before_delete = user.workouts.filter(
-            workout_date__date=workout_day
-        ).aggregate(total_xp=Sum('base_points'))['total_xp'] or 0.0
+        workout_day = local_date(workout_date)
 
         workout_content_type = ContentType.objects.get_for_model(WorkoutCheckin)
-        bonus_qs = GamificationBonus.objects.filter(content_type=workout_content_type, object_id=workout_id)
-        penalty_qs = GamificationPenalty.objects.filter(content_type=workout_content_type, object_id=workout_id)
-        bonus_total = bonus_qs.aggregate(total=Sum('score'))['total'] or 0.0
-        penalty_total = penalty_qs.aggregate(total=Sum('score'))['total'] or 0.0
-
-        # Check if this workout is part of the current streak BEFORE deleting
-        is_part_of_streak = False
-
-        try:
-            streak = WorkoutStreak.objects.get(user=user)
-            if streak.current_streak > 0:
-                # Get the last 'current_streak' workouts to check if this workout is part of it
-                last_n_workouts = WorkoutCheckin.objects.filter(
-                    user=user
-                ).order_by('-workout_date')[:streak.current_streak]
-
-                workout_dates = [w.workout_date for w in last_n_workouts]
-                is_part_of_streak = workout_date in workout_dates
-        except RelatedObjectDoesNotExist:
-            streak = None
-
-        try:
+        bonus_qs = GamificationBonus.objects.filter(content_type=workout_content_type, object_id=self.id)
+        penalty_qs = GamificationPenalty.objects.filter(content_type=workout_content_type, object_id=self.id)
+
+        with transaction.atomic():
+            # Adjustment totals and the number of newer check-ins (streak membership) in a single query
+            side_effects = WorkoutCheckin.objects.filter(pk=self.pk).annotate(
+                bonus_total=self._subquery_total(bonus_qs, Sum('score'), models.FloatField()),
+                penalty_total=self._subquery_total(penalty_qs, Sum('score'), models.FloatField()),
+                newer_workouts=self._subquery_total(
+                    WorkoutCheckin.objects.filter(user_id=OuterRef('user_id'), workout_date__gt=OuterRef('workout_date')),
+                    Count('id'),
+                    models.IntegerField(),
+                ),
+            ).values('bonus_total', 'penalty_total', 'newer_workouts').get()
+            bonus_total = side_effects['bonus_total']
+            penalty_total = side_effects['penalty_total']
+
+            streak = WorkoutStreak.objects.select_for_update().filter(user=user).first()
+            # The current streak is made of the user's last `current_streak` check-ins
+            is_part_of_streak = streak is not None and side_effects['newer_workouts'] < streak.current_streak
+
+            summary = WorkoutDailySummary.lock(user.id, workout_day)
+            day_points_before_delete = summary.awarded_points
+
             super().delete(*args, **kwargs)
-        except Exception as e:
-            raise e
 
-        Gamification.Workout.recalculate_day_points(user, workout_day)
+            WorkoutWeekCount.bump(user.id, workout_day, -1)
+            summary.remove_workout(user, self.duration, bonus_total, penalty_total)
 
-        day_points_after_delete = user.workouts.filter(
-            workout_date__date=workout_day
-        ).aggregate(total_xp=Sum('base_points'))['total_xp'] or 0.0
+            # Day points lost, bonuses given and penalties applied to this workout, settled in one profile update
+            xp_delta = (
+                -max(float(day_points_before_delete) - float(summary.awarded_points), 0.0)
+                - float(bonus_total)
+                + float(penalty_total)
+            )
 
-        xp_to_remove = max(float(day_points_before_delete) - float(day_points_after_delete), 0.0)
+            if xp_delta < 0:
+                Gamification().remove_xp(user, -xp_delta)
+            elif xp_delta > 0:
+                Gamification().add_xp(user, xp_delta)
 
-        if xp_to_remove > 0:
-            Gamification().remove_xp(user, xp_to_remove)
+            # Remove adjustment records (rows scoring 0 too, so none is left pointing at the deleted check-in)
+            bonus_qs.delete()
+            penalty_qs.delete()
 
-        # Revert bonus/penalty side effects for this workout and remove adjustment records.
-        if bonus_total > 0:
-            Gamification().remove_xp(user, float(bonus_total))
-        if penalty_total > 0:
-            Gamification().add_xp(user, float(penalty_total))
+            # Update streak if the deleted workout was part of the current streak
+            if is_part_of_streak:
+                self._update_streak_after_deletion(streak, user)
 
-        bonus_qs.delete()
-        penalty_qs.delete()
+    @staticmethod
+    def _subquery_total(queryset, aggregate, output_field):
+        """
+        Return ``aggregate`` over ``queryset`` as a correlated subquery expression, zero when there are no rows.
+        """
+        totals = queryset.order_by().annotate(group=Value(1)).values('group').annotate(total=aggregate).values('total')
 
-        # Update streak if the deleted workout was part of the current streak
-        if streak and is_part_of_streak:
-            self._update_streak_after_deletion(streak, user)
+        return Coalesce(Subquery(totals, output_field=output_field), Value(0), output_field=output_field)
 
     def _update_streak_after_deletion(self, streak, user):
         """
@@ -165,15 +185,10 @@ class WorkoutCheckin(models.Model):
         # Decrement the streak
         streak.current_streak = max(0, streak.current_streak - 1)
 
-        # Update last_workout_datetime to the most recent remaining workout
-        latest_workout = WorkoutCheckin.objects.filter(
+        # Update last_workout_datetime to the most recent remaining workout (None when there is none left)
+        streak.last_workout_datetime = WorkoutCheckin.objects.filter(
             user=user
-        ).order_by('-workout_date').first()
-
-        if latest_workout:
-            streak.last_workout_datetime = latest_workout.workout_date
-        else:
-            streak.last_workout_datetime = None
+        ).order_by('-workout_date').values_list('workout_date', flat=True).first()
 
         streak.save()
 
@@ -204,24 +219,259 @@ class WorkoutCheckin(models.Model):
         #     raise ValidationError("This workout overlaps with an existing check-in.")
 
 
-# class WorkoutDailySummary(models.Model):
-#     """
-#     Model for storing daily workout summaries for users. Contains total duration, calories burned, and workout count
-#     for each day. Automatically updates or creates summary records when new check-ins are added.
-#     """
-#     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_summaries')
-#     date = models.DateField()
-#     total_duration = models.DurationField(default=timedelta())    
-#     workout_count = models.IntegerField(default=0)
-#     awared_points = models.FloatField(default=0.0)
-#     bonus_points = models.FloatField(default=0.0)
-#     penalty_points = models.FloatField(default=0.0)
+class WorkoutDailySummary(models.Model):
+    """
+    Model for storing daily workout summaries for users. Contains total duration, workout count and the points awarded,
+    bonuses and penalties of each local day, so per-day scoring reads a single row instead of re-aggregating the day's
+    check-ins. Rows are kept in sync inside the check-in save/delete transactions (and by the bonus/penalty signals),
+    are built lazily from the check-ins when missing and can be rebuilt with the `rebuild_workout_summaries` command.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_summaries')
+    date = models.DateField()
+    total_duration = models.DurationField(default=timedelta())
+    workout_count = models.PositiveIntegerField(default=0)
+    awarded_points = models.FloatField(default=0.0)
+    bonus_points = models.FloatField(default=0.0)
+    penalty_points = models.FloatField(default=0.0)
+
+    class Meta:
+        verbose_name = 'Workout daily summary'
+        verbose_name_plural = 'Workout daily summaries'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='unique_workout_daily_summary'),
+        ]
+
+    def __str__(self):
+        return f'Workouts of {self.user_id} on {self.date}'
+
+    @staticmethod
+    def day_workouts(user_id, day):
+        """
+        Return the check-ins of the user on the local ``day`` using an index friendly range filter.
+        """
+        start, end = local_day_range(day)
+
+        return WorkoutCheckin.objects.filter(user_id=user_id, workout_date__gte=start, workout_date__lt=end)
+
+    def workouts(self):
+        return self.day_workouts(self.user_id, self.date)
+
+    @classmethod
+    def aggregate_day(cls, user_id, day):
+        """
+        Return the summary values of the day computed from the raw check-ins and their bonuses/penalties.
+        """
+        workouts = cls.day_workouts(user_id, day)
+        totals = workouts.aggregate(
+            workout_count=Count('id'),
+            total_duration=Sum('duration'),
+            awarded_points=Sum('base_points'),
+        )
+        content_type = ContentType.objects.get_for_model(WorkoutCheckin)
+        workout_ids = workouts.values('id')
+        bonus_points = GamificationBonus.objects.filter(
+            content_type=content_type, object_id__in=workout_ids
+        ).aggregate(total=Sum('score'))['total']
+        penalty_points = GamificationPenalty.objects.filter(
+            content_type=content_type, object_id__in=workout_ids
+        ).aggregate(total=Sum('score'))['total']
+
+        return {
+            'workout_count': totals['workout_count'],
+            'total_duration': totals['total_duration'] or timedelta(),
+            'awarded_points': totals['awarded_points'] or 0.0,
+            'bonus_points': bonus_points or 0.0,
+            'penalty_points': penalty_points or 0.0,
+        }
+
+    @classmethod
+    def get_for_day(cls, user_id, day):
+        """
+        Return the summary of the day without locking it. Missing rows are computed from the check-ins but not saved.
+        """
+        summary = cls.objects.filter(user_id=user_id, date=day).first()
+
+        if summary is None:
+            summary = cls(user_id=user_id, date=day, **cls.aggregate_day(user_id, day))
+
+        return summary
+
+    @classmethod
+    def lock(cls, user_id, day):
+        """
+        Return the summary of the day locked for update, creating it from the check-ins when missing.
+        Must be called inside a transaction.
+        """
+        summary = cls.objects.select_for_update().filter(user_id=user_id, date=day).first()
+
+        if summary is None:
+            try:
+                with transaction.atomic():
+                    summary = cls.objects.create(user_id=user_id, date=day, **cls.aggregate_day(user_id, day))
+            except IntegrityError:
+                # Created by a concurrent check-in of the same day
+                summary = cls.objects.select_for_update().get(user_id=user_id, date=day)
+
+        return summary
+
+    def _rescore(self, user):
+        """
+        Recompute the day points from the totals and split them evenly among the day's check-ins.
+        Returns the points of each check-in.
+        """
+        self.awarded_points = Gamification.Workout.day_points(user, self.total_duration)
+        points_per_workout = self.awarded_points / self.workout_count
+        self.workouts().update(base_points=points_per_workout)
+
+        return points_per_workout
+
+    def add_workout(self, user, duration):
+        """
+        Account a new check-in of ``duration`` that is about to be saved and return the points it gets.
+        The check-ins already saved that day are updated to the new share of the day points.
+        """
+        return self.add_workouts(user, [duration])
+
+    def add_workouts(self, user, durations):
+        """
+        Account several new check-ins of the day at once, scoring the day a single time.
+        Returns the points each of them (and each check-in already saved that day) gets.
+        """
+        self.total_duration += sum(durations, timedelta())
+        self.workout_count += len(durations)
+        points_per_workout = self._rescore(user)
+        self.save()
+
+        return points_per_workout
+
+    def remove_workout(self, user, duration, bonus_points=0.0, penalty_points=0.0):
+        """
+        Discount a deleted check-in and redistribute the day points among the remaining ones.
+        The row is removed when the day has no check-ins left.
+        """
+        self.workout_count = max(self.workout_count - 1, 0)
+
+        if self.workout_count == 0:
+            self.delete()
+            self.total_duration = timedelta()
+            self.awarded_points = 0.0
+
+            return
+
+        self.total_duration = max(self.total_duration - duration, timedelta())
+        self.bonus_points -= bonus_points
+        self.penalty_points -= penalty_points
+        self._rescore(user)
+        self.save()
+
+    @classmethod
+    def rebuild(cls, user, day):
+        """
+        Rebuild the summary of the day from the check-ins and rescore them. Returns None when the day has no check-ins.
+        """
+        with transaction.atomic():
+            values = cls.aggregate_day(user.id, day)
+
+            if values['workout_count'] == 0:
+                cls.objects.filter(user_id=user.id, date=day).delete()
+
+                return None
+
+            summary, _ = cls.objects.update_or_create(user_id=user.id, date=day, defaults=values)
+            summary._rescore(user)
+            summary.save(update_fields=['awarded_points'])
+
+        return summary
+
+    @classmethod
+    def apply_adjustment(cls, workout_id, bonus_points=0.0, penalty_points=0.0):
+        """
+        Add a bonus/penalty score given to a check-in to its day summary. Days without a summary row are skipped,
+        they will include the adjustment when built.
+        """
+        workout = WorkoutCheckin.objects.filter(id=workout_id).values('user_id', 'workout_date').first()
+
+        if workout is None:
+            return
+
+        cls.objects.filter(user_id=workout['user_id'], date=local_date(workout['workout_date'])).update(
+            bonus_points=F('bonus_points') + bonus_points,
+            penalty_points=F('penalty_points') + penalty_points,
+        )
 
 
-class WorkoutCheckinProof(models.Model):
+class WorkoutWeekCount(models.Model):
+    """
+    Number of check-ins of a user per week (starting on Sunday, local time).
+    Kept up to date by the check-in save/delete, so streak decisions read two rows instead of counting check-ins.
+    Can be rebuilt with the `rebuild_streak_counters` command.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='workout_week_counts')
+    week_start = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'Workout week count'
+        verbose_name_plural = 'Workout week counts'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'week_start'], name='unique_workout_week_count'),
+        ]
+
+    def __str__(self):
+        return f'{self.count} workouts of {self.user_id} on the week of {self.week_start}'
+
+    @classmethod
+    def bump(cls, user_id, day, step):
+        """
+        Apply ``step`` (+1/-1) to the count of the week containing the local ``day``.
+        """
+        increment_counter(cls, step, user_id=user_id, week_start=week_start_for(day))
+
+    @classmethod
+    def get_counts(cls, user_id, *week_starts):
+        """
+        Return the counts of the given weeks, in the same order, reading only their rows.
+        """
+        counts = dict(
+            cls.objects.filter(user_id=user_id, week_start__in=week_starts).values_list('week_start', 'count')
+        )
+
+        return [counts.get(week_start, 0) for week_start in week_starts]
+
+    @classmethod
+    def rebuild(cls, user_ids=None):
+        """
+        Recount the weeks of the given users (all users by default) from the check-ins.
+        Returns the number of rows written.
+        """
+        workouts = WorkoutCheckin.objects.order_by()
+
+        if user_ids is not None:
+            workouts = workouts.filter(user_id__in=user_ids)
+
+        day_counts = workouts.annotate(day=TruncDate('workout_date')).values('user_id', 'day').annotate(count=Count('id'))
+        week_counts = {}
+
+        for row in day_counts:
+            key = (row['user_id'], week_start_for(row['day']))
+            week_counts[key] = week_counts.get(key, 0) + row['count']
+
+        with transaction.atomic():
+            existing = cls.objects.all() if user_ids is None else cls.objects.filter(user_id__in=user_ids)
+            existing.delete()
+            cls.objects.bulk_create([
+                cls(user_id=user_id, week_start=week_start, count=count)
+                for (user_id, week_start), count in week_counts.items()
+            ], batch_size=1000)
+
+        return len(week_counts)
+
+
+class WorkoutCheckinProof(MediaVariantsModel):
     """
     Model for storing proof files (images/videos) attached to workout check-ins.
-    Supports validation of file types to ensure only allowed media formats.
+    Supports validation of file types to ensure only allowed media formats; thumbnail/preview variants are built
+    asynchronously by the media pipeline (core.media).
     """
     checkin = models.ForeignKey(
         WorkoutCheckin,
@@ -233,6 +483,13 @@ class WorkoutCheckinProof(models.Model):
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'mp4'])]
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['id'], name='workout_proof_pending_idx', condition=models.Q(variants_processed_at__isnull=True)
+            ),
+        ]
+
 
 class WorkoutPlan(models.Model):
     """
@@ -276,28 +533,8 @@ class WorkoutStreak(models.Model):
         if not self.last_workout_datetime:
             return self.frequency
 
-        # Get current date and time
-        now = timezone.now()
-
-        # Calculate the start and end of the week based on the current date
-        # Assuming the week starts on Sunday
-        days_since_sunday = now.weekday() + 1
-
-        if days_since_sunday == 7:
-            days_since_sunday = 0
-
-        # Calculate the start and end of the week
-        # Adjusting to the start of the week (Sunday)
-        week_start = now - timedelta(days=days_since_sunday)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-        # Count the number of check-ins in the current week
-        checkins_count = WorkoutCheckin.objects.filter(
-            user=self.user,
-            workout_date__gte=week_start,
-            workout_date__lte=week_end
-        ).count()
+        # Count the number of check-ins in the current week (starting on Sunday)
+        checkins_count, = WorkoutWeekCount.get_counts(self.user_id, week_start_for(timezone.localdate()))
 
         # Calculate remaining workouts needed to meet frequency
         remaining = self.frequency - checkins_count
@@ -309,26 +546,46 @@ class WorkoutStreak(models.Model):
         Update the user's workout streak based on a new workout.
         Increments streak if requirements are met, resets if not.
         """
+        streak_ended = bool(self.last_workout_datetime) and self.check_streak_ended(workout_date)
+        self._advance(workout_date, streak_ended)
+        self.save()
+
+        return self.current_streak
+
+    def register_workouts(self, workout_dates, week_counts):
+        """
+        Apply update_streak for several new workouts, in date order, without saving.
+        ``week_counts`` maps week starts to the check-ins already counted and is updated as each workout is counted.
+        """
+        for workout_date in sorted(workout_dates):
+            week_start = week_start_for(local_date(workout_date))
+            streak_ended = bool(self.last_workout_datetime) and self._is_streak_ended(
+                workout_date,
+                week_counts.get(week_start, 0),
+                week_counts.get(week_start - timedelta(days=7), 0),
+            )
+            self._advance(workout_date, streak_ended)
+            week_counts[week_start] = week_counts.get(week_start, 0) + 1
+
+        return self.current_streak
+
+    def _advance(self, workout_date, streak_ended):
         if not self.last_workout_datetime:
             # First workout ever
             self.current_streak = 1
             self.longest_streak = 1
+        elif not streak_ended:
+            # Streak continues
+            self.current_streak += 1
         else:
-            if not self.check_streak_ended(workout_date):
-                # Streak continues
-                self.current_streak += 1
-            else:
-                # Streak broken, start new one
-                self.current_streak = 1
+            # Streak broken, start new one
+            self.current_streak = 1
 
         # Update longest streak if current is better
         if self.current_streak > self.longest_streak:
             self.longest_streak = self.current_streak
 
         self.last_workout_datetime = workout_date
-        self.save()
-
-        return self.current_streak
 
     def check_streak_ended(self, current_date=None):
         """
@@ -341,47 +598,22 @@ class WorkoutStreak(models.Model):
         if current_date is None:
             current_date = timezone.now()
 
-        # Calculate the start and end of the week based on the current date
-        # Assuming the week starts on Sunday
-        days_since_sunday = current_date.weekday() + 1
-
-        if days_since_sunday == 7:
-            days_since_sunday = 0
-
-        # Calculate the start and end of the week
-        # Adjusting to the start of the week (Sunday)
-        week_start = current_date - timedelta(days=days_since_sunday)
-        week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
-        week_end = week_start + timedelta(days=6, hours=23, minutes=59, seconds=59)
-
-        # Calculate the start and end of the previous week
+        # Weeks start on Sunday (local time); both counts come from the weekly counters
+        week_start = week_start_for(local_date(current_date))
         previous_week_start = week_start - timedelta(days=7)
-        previous_week_end = week_end - timedelta(days=7)
-
-        # Count the number of check-ins in the current week and previous week
-        checkins_count = WorkoutCheckin.objects.filter(user=self.user).aggregate(
-            current_week=Count(
-                'id',
-                filter=Q(
-                    workout_date__gte=week_start,
-                    workout_date__lte=week_end
-                )
-            ),
-            previous_week=Count(
-                'id',
-                filter=Q(
-                    workout_date__gte=previous_week_start,
-                    workout_date__lte=previous_week_end
-                )
-            )
+        weekly_checkins, previous_week_checkins = WorkoutWeekCount.get_counts(
+            self.user_id, week_start, previous_week_start
         )
-        weekly_checkins = checkins_count['current_week'] or 0
-        previous_week_checkins = checkins_count['previous_week'] or 0
+
+        return self._is_streak_ended(current_date, weekly_checkins, previous_week_checkins)
+
+    def _is_streak_ended(self, current_date, weekly_checkins, previous_week_checkins):
+        week_start = week_start_for(local_date(current_date))
 
         # If the number of check-ins is less than the frequency, check if the last workout is within the week
         if weekly_checkins < self.frequency:
             # If the last workout is within the current week, the streak is not ended
-            if week_start <= self.last_workout_datetime <= week_end:
+            if week_start <= local_date(self.last_workout_datetime) < week_start + timedelta(days=7):
                 return False
             else:
                 # If the last workout is not within the current week, check the previous week
@@ -0,0 +1,12 @@
+from rest_framework.pagination import CursorPagination
+
+
+class WorkoutCheckinsPagination(CursorPagination):
+    """
+    Cursor pagination for workout check-in lists, most recent first.
+    Pages are read by position on (workout_date, id), so deep pages cost the same as the first one.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-workout_date', '-id')
@@ -1,7 +1,9 @@
 from django.core.validators import FileExtensionValidator
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 from rest_framework import serializers
 
+from core.media import BatchedMediaListSerializer
 from gamification.models import GamificationBonus, GamificationPenalty
 from workouts.models import WorkoutCheckin, WorkoutCheckinProof, WorkoutPlan
 
@@ -9,12 +11,13 @@ from workouts.models import WorkoutCheckin, WorkoutCheckinProof, WorkoutPlan
 class WorkoutCheckinProofSerializer(serializers.ModelSerializer):
     """
     Serializer for workout check-in proof files.
-    Handles serialization of uploaded images and videos as workout evidence.
+    Handles serialization of uploaded images and videos as workout evidence, with their thumbnail/preview variants
+    (null until the media pipeline has processed the file).
     """
     class Meta:
         model = WorkoutCheckinProof
-        fields = ['id', 'file']
-        read_only_fields = ['id']
+        fields = ['id', 'file', 'thumbnail', 'preview']
+        read_only_fields = ['id', 'thumbnail', 'preview']
 
 
 class WorkoutCheckinSerializer(serializers.ModelSerializer):
@@ -48,6 +51,9 @@ class WorkoutCheckinSerializer(serializers.ModelSerializer):
             'multiplier', 'proof_files', 'proofs', 'current_streak',
             'longest_streak', 'level_up', 'total_bonus', 'total_penalty', 'bonus_list', 'penalties_list'
         ]
+        # Proof URLs of a whole page are signed in one batch
+        media_paths = ('proofs.file', 'proofs.thumbnail', 'proofs.preview')
+        list_serializer_class = BatchedMediaListSerializer
         # Prevent modification of automatically calculated fields
         read_only_fields = (
             'user',
@@ -228,6 +234,38 @@ class WorkoutCheckinSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
+class WorkoutBulkItemSerializer(serializers.Serializer):
+    """
+    Serializer for one item of a bulk workout import.
+    Proofs are referenced by the storage names of files already uploaded by the integration.
+    """
+    user = serializers.IntegerField()
+    workout_date = serializers.DateTimeField()
+    duration = serializers.DurationField()
+    comments = serializers.CharField(required=False, allow_blank=True, default='')
+    location = serializers.CharField(max_length=100, required=False, allow_null=True, default=None)
+    proof_files = serializers.ListField(child=serializers.CharField(max_length=100), required=False, default=list)
+
+    def validate_proof_files(self, value):
+        for name in value:
+            if name.rsplit('.', 1)[-1].lower() not in ('jpg', 'jpeg', 'png', 'mp4'):
+                raise serializers.ValidationError(f'File extension of "{name}" is not allowed.')
+
+        return value
+
+    def validate_workout_date(self, value):
+        if value > timezone.now():
+            raise serializers.ValidationError('Workout date cannot be in the future.')
+
+        return value
+
+    def validate_duration(self, value):
+        if value.total_seconds() <= 0:
+            raise serializers.ValidationError('Duration must be a positive value.')
+
+        return value
+
+
 class WorkoutPlanSerializer(serializers.ModelSerializer):
     """
     Serializer for workout plans with PDF file validation.
@@ -0,0 +1,369 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.db.models import Count, Max, Min, Sum
+from django.db.models.functions import TruncDate
+
+from analytics.services import ActivityBitmapService, ActivityCountersService
+from core.utils import increment_counter, local_date, local_day_range, week_start_for
+from gamification.services import Gamification, WorkoutGamification, workout_day_points
+from groups.models import GroupMemberships
+from profiles.models import Profile
+from workouts.models import (
+    WorkoutCheckin, WorkoutCheckinProof, WorkoutDailySummary, WorkoutStreak, WorkoutWeekCount, get_published_status_id
+)
+from workouts.signals import workouts_imported
+
+
+class WorkoutPointsRecalculationService:
+    """
+    Bulk recalculation of workout base points.
+    Day totals of every (user, local day) are read with a single GROUP BY, scored in one Python loop with the same rules
+    as the check-in path and written back in chunks with one WITH v AS (VALUES ...) UPDATE ... FROM v statement per
+    chunk, touching only the days whose points changed. Profile scores are not adjusted, the same as the per-user recalculation mode.
+    """
+
+    def __init__(self, client=None, since=None, user_ids=None, chunk_size=1000):
+        self.client = client
+        self.since = since
+        self.user_ids = user_ids
+        self.chunk_size = chunk_size
+        # Fresh settings, so a recalculation right after a settings change does not use a cached copy
+        self.gamification = WorkoutGamification()
+        self._user_factors = {}
+
+    def get_day_totals(self):
+        """
+        Return (user_id, workout_day, total_duration, workout_count, points_sum, points_min, points_max) rows.
+        """
+        queryset = WorkoutCheckin.objects.order_by()
+
+        if self.client is not None:
+            queryset = queryset.filter(employer=self.client)
+
+        if self.user_ids is not None:
+            queryset = queryset.filter(user_id__in=self.user_ids)
+
+        if self.since is not None:
+            queryset = queryset.filter(workout_date__gte=local_day_range(self.since)[0])
+
+        return queryset.annotate(workout_day=TruncDate('workout_date')).values('user_id', 'workout_day').annotate(
+            total_duration=Sum('duration'),
+            workout_count=Count('id'),
+            points_count=Count('base_points'),
+            points_sum=Sum('base_points'),
+            points_min=Min('base_points'),
+            points_max=Max('base_points'),
+        ).order_by('user_id', 'workout_day')
+
+    def _load_user_factors(self, user_ids):
+        """
+        Cache the (base_xp, multiplier) of the users not seen yet.
+        """
+        missing = [user_id for user_id in user_ids if user_id not in self._user_factors]
+
+        for user in User.objects.select_related('profile').filter(id__in=missing):
+            self._user_factors[user.id] = (self.gamification.base_xp(user), self.gamification.get_multiplier(user))
+
+    def score(self, rows):
+        """
+        Return the day points of each row, scoring the rows one by one in a single pass.
+        """
+        self._load_user_factors({row['user_id'] for row in rows})
+        settings = self.gamification.settings
+        points = []
+
+        for row in rows:
+            base_xp, multiplier = self._user_factors[row['user_id']]
+            minutes = row['total_duration'].total_seconds() / 60
+            points.append(
+                workout_day_points(minutes, base_xp, multiplier, settings.workout_minutes, settings.max_workout_xp)
+            )
+
+        return points
+
+    @staticmethod
+    def _is_current(row, points_per_workout):
+        """
+        Return whether every check-in of the day already holds ``points_per_workout``.
+        """
+        return (
+            row['points_count'] == row['workout_count']
+            and abs(row['points_min'] - points_per_workout) < 1e-9
+            and abs(row['points_max'] - points_per_workout) < 1e-9
+        )
+
+    @staticmethod
+    def _write_chunk(changes):
+        """
+        Write the new points of a chunk of (user_id, day, points_per_workout, day_points) with two statements.
+        """
+        ops = connection.ops
+        checkins_table = ops.quote_name(WorkoutCheckin._meta.db_table)
+        summaries_table = ops.quote_name(WorkoutDailySummary._meta.db_table)
+        placeholders = ', '.join(['(%s, %s, %s, %s, %s)'] * len(changes))
+        params = []
+
+        for user_id, day, points_per_workout, day_points in changes:
+            day_start, day_end = local_day_range(day)
+            params += [
+                user_id,
+                ops.adapt_datetimefield_value(day_start),
+                ops.adapt_datetimefield_value(day_end),
+                points_per_workout,
+                day_points,
+            ]
+
+        values = f'WITH v (user_id, day_start, day_end, points, day_points) AS (VALUES {placeholders}) '
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                values +
+                f'UPDATE {checkins_table} SET base_points = v.points FROM v '
+                f'WHERE {checkins_table}.user_id = v.user_id '
+                f'AND {checkins_table}.workout_date >= v.day_start AND {checkins_table}.workout_date < v.day_end',
+                params
+            )
+
+        # Existing summaries follow; missing ones are built from the updated check-ins when first used
+        day_params = []
+
+        for user_id, day, _, day_points in changes:
+            day_params += [user_id, ops.adapt_datefield_value(day), day_points]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'WITH v (user_id, day, day_points) AS (VALUES {", ".join(["(%s, %s, %s)"] * len(changes))}) '
+                f'UPDATE {summaries_table} SET awarded_points = v.day_points FROM v '
+                f'WHERE {summaries_table}.user_id = v.user_id AND {summaries_table}.date = v.day',
+                day_params
+            )
+
+    def run(self, dry_run=False, progress=None):
+        """
+        Recalculate the points of every matching workout day.
+        ``progress`` is called with (processed_days, total_days) after each chunk.
+        Returns the number of days processed and updated and the total day points.
+        """
+        day_totals = self.get_day_totals()
+        total_days = day_totals.count() if progress else None
+        processed = updated = 0
+        total_points = 0.0
+        chunk = []
+
+        def flush():
+            nonlocal processed, updated, total_points
+
+            changes = []
+
+            for row, day_points in zip(chunk, self.score(chunk)):
+                points_per_workout = day_points / row['workout_count']
+                total_points += day_points
+
+                if not self._is_current(row, points_per_workout):
+                    changes.append((row['user_id'], row['workout_day'], points_per_workout, day_points))
+
+            if changes and not dry_run:
+                with transaction.atomic():
+                    self._write_chunk(changes)
+
+            processed += len(chunk)
+            updated += len(changes)
+            chunk.clear()
+
+            if progress:
+                progress(processed, total_days)
+
+        for row in day_totals.iterator(chunk_size=self.chunk_size):
+            chunk.append(row)
+
+            if len(chunk) >= self.chunk_size:
+                flush()
+
+        if chunk:
+            flush()
+
+        return {
+            'processed_days': processed,
+            'updated_days': updated,
+            'total_points': total_points,
+        }
+
+
+class WorkoutBulkImportService:
+    """
+    Import a batch of check-ins (e.g. synced from wearables or partner gyms) with set-based queries.
+    The batch is validated together, every (user, day) is scored once through its daily summary, rows, group links
+    and proofs are bulk created, streaks and XP are settled once per user, the `workouts_imported` signal lets the
+    feed create the posts and the activity counters and bitmaps are then rebuilt once per user. The result is equivalent to saving the check-ins one by one in date order.
+    """
+    MAX_BATCH_SIZE = 1000
+
+    def __init__(self, items):
+        """
+        ``items`` are validated WorkoutBulkItemSerializer payloads.
+        """
+        self.items = items
+        self.results = [{'index': index} for index in range(len(items))]
+
+    def _fail(self, index, errors):
+        self.results[index].update({'status': 'error', 'errors': errors})
+
+    def _validate(self):
+        """
+        Check the batch against the database and itself; returns the indexes of the importable items.
+        """
+        user_ids = {item['user'] for item in self.items}
+        self.users = User.objects.select_related('profile').filter(id__in=user_ids, profile__isnull=False).in_bulk()
+        existing = set(
+            WorkoutCheckin.objects.filter(
+                user_id__in=user_ids, workout_date__in={item['workout_date'] for item in self.items}
+            ).values_list('user_id', 'workout_date')
+        )
+        seen = set()
+        valid = []
+
+        for index, item in enumerate(self.items):
+            key = (item['user'], item['workout_date'])
+
+            if item['user'] not in self.users:
+                self._fail(index, {'user': ['User not found or without profile.']})
+            elif key in existing:
+                self._fail(index, {'workout_date': ['This workout was already registered.']})
+            elif key in seen:
+                self._fail(index, {'workout_date': ['Duplicated workout in the batch.']})
+            else:
+                seen.add(key)
+                valid.append(index)
+
+        return valid
+
+    def _load_week_counts(self, by_user):
+        """
+        Return {user_id: {week_start: count}} for the weeks the new check-ins fall into and the weeks before them.
+        """
+        weeks = set()
+
+        for items in by_user.values():
+            for item in items:
+                week_start = week_start_for(local_date(item['workout_date']))
+                weeks.update({week_start, week_start - timedelta(days=7)})
+
+        week_counts = defaultdict(dict)
+
+        for user_id, week_start, count in WorkoutWeekCount.objects.filter(
+            user_id__in=by_user.keys(), week_start__in=weeks
+        ).values_list('user_id', 'week_start', 'count'):
+            week_counts[user_id][week_start] = count
+
+        return week_counts
+
+    def run(self, dry_run=False):
+        """
+        Import the batch and return one result per item, in the input order.
+        """
+        valid = self._validate()
+
+        if dry_run or not valid:
+            for index in valid:
+                self.results[index]['status'] = 'valid'
+
+            return self.results
+
+        by_user = defaultdict(list)
+
+        for index in valid:
+            by_user[self.items[index]['user']].append(self.items[index])
+
+        with transaction.atomic():
+            self._import(by_user)
+
+        created = {id(item): item for items in by_user.values() for item in items}
+
+        for index in valid:
+            self.results[index].update({'status': 'created', 'id': created[id(self.items[index])]['instance'].id})
+
+        return self.results
+
+    def _import(self, by_user):
+        status_id = get_published_status_id()
+        employers = dict(Profile.objects.filter(user_id__in=by_user.keys()).values_list('user_id', 'employer_id'))
+        # Same source as WorkoutCheckin.save, so imported and single check-ins are tagged with the same groups
+        user_groups = GroupMemberships.active_group_ids_many(list(by_user))
+
+        week_counts = self._load_week_counts(by_user)
+        streaks = {
+            streak.user_id: streak
+            for streak in WorkoutStreak.objects.select_for_update().filter(user_id__in=by_user.keys())
+        }
+        new_workouts = []
+
+        for user_id, items in by_user.items():
+            user = self.users[user_id]
+            multiplier = Gamification.Workout.get_multiplier(user)
+            xp_to_add = 0.0
+            by_day = defaultdict(list)
+
+            for item in items:
+                by_day[local_date(item['workout_date'])].append(item)
+
+            # Score each day once, from its locked summary
+            for day, day_items in sorted(by_day.items()):
+                summary = WorkoutDailySummary.lock(user_id, day)
+                day_points_before = summary.awarded_points
+                points_per_workout = summary.add_workouts(user, [item['duration'] for item in day_items])
+                xp_to_add += max(float(summary.awarded_points) - float(day_points_before), 0.0)
+
+                for item in day_items:
+                    item['instance'] = WorkoutCheckin(
+                        user_id=user_id,
+                        location=item.get('location'),
+                        comments=item.get('comments', ''),
+                        workout_date=item['workout_date'],
+                        duration=item['duration'],
+                        validation_status_id=status_id,
+                        base_points=points_per_workout,
+                        multiplier=multiplier,
+                        employer_id=employers.get(user_id),
+                    )
+                    new_workouts.append(item['instance'])
+
+            streak = streaks.get(user_id) or WorkoutStreak(user_id=user_id)
+            streak.register_workouts([item['workout_date'] for item in items], dict(week_counts[user_id]))
+            streak.save()
+
+            for week_start, count in self._count_weeks(items).items():
+                increment_counter(WorkoutWeekCount, count, user_id=user_id, week_start=week_start)
+
+            if xp_to_add > 0:
+                Gamification().add_xp(user, xp_to_add)
+
+        WorkoutCheckin.objects.bulk_create(new_workouts, batch_size=500)
+
+        WorkoutCheckin.groups.through.objects.bulk_create([
+            WorkoutCheckin.groups.through(workoutcheckin_id=workout.id, group_id=group_id)
+            for workout in new_workouts
+            for group_id in user_groups[workout.user_id]
+        ], batch_size=500)
+        WorkoutCheckinProof.objects.bulk_create([
+            WorkoutCheckinProof(checkin=item['instance'], file=file_name)
+            for items in by_user.values()
+            for item in items
+            for file_name in item.get('proof_files', [])
+        ], batch_size=500)
+
+        workouts_imported.send(sender=WorkoutCheckin, workouts=new_workouts, user_ids=set(by_user))
+        # Rebuilt after the receivers above created the workout posts, so both are counted
+        ActivityCountersService.reconcile(set(by_user))
+        ActivityBitmapService.rebuild(set(by_user))
+
+    @staticmethod
+    def _count_weeks(items):
+        counts = defaultdict(int)
+
+        for item in items:
+            counts[week_start_for(local_date(item['workout_date']))] += 1
+
+        return counts
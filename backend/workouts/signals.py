@@ -0,0 +1,44 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+
+from gamification.models import GamificationBonus, GamificationPenalty
+from .models import WorkoutCheckin, WorkoutDailySummary
+
+# Sent after WorkoutBulkImportService bulk-creates check-ins, which bypasses their save() and post_save receivers.
+# Receivers get ``workouts`` (the created check-ins) and ``user_ids``.
+workouts_imported = Signal()
+
+# Adjustment model -> summary field its score is accumulated in
+ADJUSTMENT_FIELDS = {
+    GamificationBonus: 'bonus_points',
+    GamificationPenalty: 'penalty_points',
+}
+
+
+def _is_workout_adjustment(instance):
+    return instance.content_type_id == ContentType.objects.get_for_model(WorkoutCheckin).id
+
+
+@receiver(post_save, sender=GamificationBonus)
+@receiver(post_save, sender=GamificationPenalty)
+def add_adjustment_to_summary(sender, instance, created, **kwargs):
+    """
+    Accumulate a new bonus/penalty given to a workout check-in in its day summary.
+    """
+    if not created or not _is_workout_adjustment(instance):
+        return
+
+    WorkoutDailySummary.apply_adjustment(instance.object_id, **{ADJUSTMENT_FIELDS[sender]: instance.score or 0.0})
+
+
+@receiver(post_delete, sender=GamificationBonus)
+@receiver(post_delete, sender=GamificationPenalty)
+def remove_adjustment_from_summary(sender, instance, **kwargs):
+    """
+    Discount a deleted bonus/penalty from the day summary of its workout check-in.
+    """
+    if not _is_workout_adjustment(instance):
+        return
+
+    WorkoutDailySummary.apply_adjustment(instance.object_id, **{ADJUSTMENT_FIELDS[sender]: -(instance.score or 0.0)})
@@ -0,0 +1,291 @@
+"""
+Tests for the bulk workout import
+"""
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from analytics.models import UserActivityCounters
+from clients.models import Client
+from gamification.services import WorkoutGamification
+from groups.models import Group, GroupMembers, GroupMemberships, Membership
+from profiles.models import Profile
+from social_feed.models import Post
+from workouts.models import WorkoutCheckin, WorkoutCheckinProof, WorkoutDailySummary, WorkoutStreak, WorkoutWeekCount
+from workouts.services import WorkoutBulkImportService
+
+
+class WorkoutBulkImportTest(TestCase):
+    """Test that a bulk import leaves the same state as creating the check-ins one by one"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.owner = User.objects.create_user(username='importowner', email='owner@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Import Company',
+            cnpj='11222333000177',
+            contact_email='import@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+        self.group = Group.objects.create(name='Import Group', owner=self.owner, created_by=self.owner)
+        self.now = timezone.now()
+
+    def _user(self, username):
+        user = User.objects.create_user(username=username, password='pass1234')
+        Profile.objects.create(user=user, employer=self.client_obj)
+        GroupMembers.objects.create(group=self.group, member=user, pending=False)
+
+        return user
+
+    def _items(self, user, days_ago):
+        """Items of ``user``, one per entry of ``days_ago`` (repeated days get several check-ins)"""
+        return [
+            {
+                'user': user.id,
+                'workout_date': self.now - timedelta(days=days, minutes=index),
+                'duration': timedelta(minutes=20 + 10 * (index % 3)),
+                'comments': f'Workout {index}',
+            }
+            for index, days in enumerate(days_ago)
+        ]
+
+    def _state(self, user):
+        user = User.objects.select_related('profile', 'workout_streak').get(id=user.id)
+        workouts = WorkoutCheckin.objects.filter(user=user).order_by('workout_date')
+
+        return {
+            'points': [round(workout.base_points, 6) for workout in workouts],
+            'groups': [list(workout.groups.values_list('id', flat=True)) for workout in workouts],
+            'score': round(user.profile.score, 6),
+            'level': user.profile.level,
+            'streak': (user.workout_streak.current_streak, user.workout_streak.longest_streak),
+            'last_workout': user.workout_streak.last_workout_datetime,
+            'summaries': list(
+                WorkoutDailySummary.objects.filter(user=user).order_by('date')
+                .values_list('date', 'workout_count', 'total_duration')
+            ),
+            'summary_points': [
+                round(points, 6) for points in
+                WorkoutDailySummary.objects.filter(user=user).order_by('date').values_list('awarded_points', flat=True)
+            ],
+            'weeks': list(WorkoutWeekCount.objects.filter(user=user).order_by('week_start').values_list('week_start', 'count')),
+            'posts': Post.objects.filter(user=user, content_type='workout', workout_checkin__isnull=False).count(),
+            'workout_count': UserActivityCounters.objects.get(user=user).workout_count,
+            'post_count': UserActivityCounters.objects.get(user=user).post_count,
+        }
+
+    def test_matches_one_by_one_creation(self):
+        """Points, streak, score, summaries, counters and posts match the per check-in path"""
+        days_ago = [20, 19, 19, 15, 12, 9, 8, 8, 8, 1]
+        single_user = self._user('singleuser')
+        bulk_user = self._user('bulkuser')
+
+        for item in sorted(self._items(single_user, days_ago), key=lambda item: item['workout_date']):
+            WorkoutCheckin.objects.create(
+                user=single_user,
+                workout_date=item['workout_date'],
+                duration=item['duration'],
+                comments=item['comments']
+            )
+
+        results = WorkoutBulkImportService(self._items(bulk_user, days_ago)).run()
+
+        self.assertTrue(all(result['status'] == 'created' for result in results))
+        self.assertEqual(self._state(bulk_user), self._state(single_user))
+
+    def test_import_after_existing_history(self):
+        """Imported check-ins continue the streak and day points of the check-ins already saved"""
+        single_user = self._user('historysingle')
+        bulk_user = self._user('historybulk')
+
+        for user in (single_user, bulk_user):
+            WorkoutCheckin.objects.create(
+                user=user,
+                workout_date=self.now - timedelta(days=3, hours=2),
+                duration=timedelta(minutes=30)
+            )
+
+        days_ago = [3, 2, 1]
+
+        for item in sorted(self._items(single_user, days_ago), key=lambda item: item['workout_date']):
+            WorkoutCheckin.objects.create(user=single_user, workout_date=item['workout_date'], duration=item['duration'])
+
+        WorkoutBulkImportService(self._items(bulk_user, days_ago)).run()
+
+        self.assertEqual(self._state(bulk_user), self._state(single_user))
+
+    def test_query_count_does_not_grow_with_items_per_day(self):
+        """Several check-ins of the same days cost the same queries as one per day"""
+        few_user = self._user('fewitems')
+        many_user = self._user('manyitems')
+        # Warm the per-process caches (settings, content types)
+        WorkoutBulkImportService(self._items(self._user('warmup'), [3])).run()
+
+        with CaptureQueriesContext(connection) as few_queries:
+            WorkoutBulkImportService(self._items(few_user, [4, 2])).run()
+
+        with CaptureQueriesContext(connection) as many_queries:
+            WorkoutBulkImportService(self._items(many_user, [4, 4, 4, 4, 4, 2, 2, 2, 2, 2])).run()
+
+        self.assertEqual(len(few_queries), len(many_queries))
+
+    def test_groups_come_from_the_memberships_map(self):
+        """Imported check-ins are tagged from the same cached memberships map as WorkoutCheckin.save"""
+        cached_user = self._user('cachedmapitems')
+        users = [self._user(f'mapitems{index}') for index in range(3)]
+        other_group = Group.objects.create(name='Cached Group', owner=self.owner, created_by=self.owner)
+        cache.set(GroupMemberships._key(cached_user.id), {other_group.id: Membership(is_admin=False, pending=False)})
+        self.addCleanup(cache.delete, GroupMemberships._key(cached_user.id))
+        items = [item for user in [cached_user, *users] for item in self._items(user, [2, 1])]
+        table = GroupMembers._meta.db_table
+
+        with CaptureQueriesContext(connection) as queries:
+            WorkoutBulkImportService(items).run()
+
+        # The users missing from the cache are loaded together
+        self.assertEqual(len([query for query in queries if f'FROM "{table}"' in query['sql']]), 1)
+
+        for workout in WorkoutCheckin.objects.filter(user=cached_user):
+            self.assertEqual(list(workout.groups.values_list('id', flat=True)), [other_group.id])
+
+        for workout in WorkoutCheckin.objects.filter(user__in=users):
+            self.assertEqual(list(workout.groups.values_list('id', flat=True)), [self.group.id])
+
+    def test_per_item_errors(self):
+        """Unknown users and duplicates fail individually while the rest is imported"""
+        user = self._user('erroritems')
+        existing = WorkoutCheckin.objects.create(
+            user=user,
+            workout_date=self.now - timedelta(days=5),
+            duration=timedelta(minutes=30)
+        )
+        valid, = self._items(user, [1])
+        items = [
+            valid,
+            {**valid, 'user': 999999},
+            {**valid},
+            {**valid, 'workout_date': existing.workout_date},
+        ]
+
+        results = WorkoutBulkImportService(items).run()
+
+        self.assertEqual([result['status'] for result in results], ['created', 'error', 'error', 'error'])
+        self.assertIn('user', results[1]['errors'])
+        self.assertIn('workout_date', results[2]['errors'])
+        self.assertIn('workout_date', results[3]['errors'])
+        self.assertEqual(WorkoutCheckin.objects.filter(user=user).count(), 2)
+
+    def test_dry_run_does_not_write(self):
+        """A dry run only validates the batch"""
+        user = self._user('dryrunitems')
+
+        results = WorkoutBulkImportService(self._items(user, [2, 1])).run(dry_run=True)
+
+        self.assertEqual([result['status'] for result in results], ['valid', 'valid'])
+        self.assertFalse(WorkoutCheckin.objects.filter(user=user).exists())
+        self.assertFalse(WorkoutStreak.objects.filter(user=user).exists())
+
+
+class WorkoutBulkImportAPITest(TestCase):
+    """Test the bulk import endpoint and management command"""
+
+    def setUp(self):
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.admin = User.objects.create_superuser(username='importadmin', email='admin@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Import API Company',
+            cnpj='11222333000188',
+            contact_email='importapi@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.admin
+        )
+        self.user = User.objects.create_user(username='importapiuser', password='pass1234')
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        self.api = APIClient()
+        self.url = reverse('workout-bulk-import')
+
+    def _item(self, days_ago, **extra):
+        return {
+            'user': self.user.id,
+            'workout_date': (timezone.now() - timedelta(days=days_ago)).isoformat(),
+            'duration': '00:45:00',
+            **extra,
+        }
+
+    def test_requires_admin(self):
+        """Regular users cannot import workouts"""
+        self.api.force_authenticate(self.user)
+
+        response = self.api.post(self.url, {'workouts': [self._item(1)]}, format='json')
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_import_reports_each_item(self):
+        """Valid items are created with their proofs and invalid ones are reported in place"""
+        self.api.force_authenticate(self.admin)
+        payload = {'workouts': [
+            self._item(2, proof_files=['workouts/watch.jpg']),
+            self._item(1, duration='-00:10:00'),
+            self._item(-1),
+            self._item(1, proof_files=['workouts/data.exe']),
+            self._item(1),
+        ]}
+
+        response = self.api.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(
+            [result['status'] for result in response.data['results']],
+            ['created', 'error', 'error', 'error', 'created']
+        )
+        self.assertEqual([result['index'] for result in response.data['results']], [0, 1, 2, 3, 4])
+        workout = WorkoutCheckin.objects.get(id=response.data['results'][0]['id'])
+        self.assertEqual(list(WorkoutCheckinProof.objects.filter(checkin=workout).values_list('file', flat=True)),
+                         ['workouts/watch.jpg'])
+        self.assertEqual(Post.objects.filter(workout_checkin__user=self.user).count(), 2)
+
+    def test_rejects_oversized_batch(self):
+        """Batches over the limit are rejected as a whole"""
+        self.api.force_authenticate(self.admin)
+
+        with patch.object(WorkoutBulkImportService, 'MAX_BATCH_SIZE', 1):
+            response = self.api.post(self.url, {'workouts': [self._item(2), self._item(1)]}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(WorkoutCheckin.objects.exists())
+
+    def test_import_command(self):
+        """The command imports the workouts of a JSON file, or only validates them with --dry-run"""
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as file:
+            json.dump([self._item(2), self._item(1)], file)
+
+        stdout = StringIO()
+        call_command('import_workouts', file.name, '--dry-run', stdout=stdout)
+        self.assertIn('2 valid workouts', stdout.getvalue())
+        self.assertFalse(WorkoutCheckin.objects.exists())
+
+        call_command('import_workouts', file.name, stdout=StringIO())
+        self.assertEqual(WorkoutCheckin.objects.filter(user=self.user).count(), 2)
@@ -0,0 +1,153 @@
+"""
+Tests for the workout daily summaries
+"""
+import unittest
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from clients.models import Client
+from core.utils import local_date
+from gamification.models import GamificationBonus
+from gamification.services import Gamification, WorkoutGamification
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin, WorkoutDailySummary
+
+
+class WorkoutDailySummaryTest(TestCase):
+    """Test the daily summary maintenance on check-in creation and deletion"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username='summaryuser', email='summary@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Summary Company',
+            cnpj='11222333000166',
+            contact_email='summary@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        self.profile = Profile.objects.create(user=self.user, employer=self.client_obj)
+        self.workout_date = timezone.now() - timedelta(days=1)
+        self.day = local_date(self.workout_date)
+
+    def _create_workout(self, minutes, offset=0):
+        return WorkoutCheckin.objects.create(
+            user=self.user,
+            workout_date=self.workout_date + timedelta(minutes=offset),
+            duration=timedelta(minutes=minutes)
+        )
+
+    def _summary(self):
+        return WorkoutDailySummary.objects.get(user=self.user, date=self.day)
+
+    def test_creation_updates_summary_and_splits_points(self):
+        """Each check-in of the day gets an even share of the day points"""
+        first = self._create_workout(30)
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self._create_workout(40, offset=1)
+
+        summary = self._summary()
+        expected_points = Gamification.Workout.day_points(self.user, timedelta(minutes=70))
+        first.refresh_from_db()
+        self.profile.refresh_from_db()
+
+        self.assertEqual(summary.workout_count, 2)
+        self.assertEqual(summary.total_duration, timedelta(minutes=70))
+        self.assertAlmostEqual(summary.awarded_points, expected_points)
+        self.assertAlmostEqual(first.base_points, expected_points / 2)
+        self.assertAlmostEqual(second.base_points, expected_points / 2)
+        self.assertAlmostEqual(self.profile.score, expected_points)
+        # The day is addressed with a range filter, never with a date cast of the column
+        self.assertFalse(any('cast_date' in query['sql'] for query in queries.captured_queries))
+
+    def test_deletion_updates_summary(self):
+        """Deleting a check-in redistributes the points and removes empty days"""
+        first = self._create_workout(30)
+        second = self._create_workout(40, offset=1)
+
+        first.delete()
+
+        summary = self._summary()
+        expected_points = Gamification.Workout.day_points(self.user, timedelta(minutes=40))
+        second.refresh_from_db()
+        self.profile.refresh_from_db()
+
+        self.assertEqual(summary.workout_count, 1)
+        self.assertEqual(summary.total_duration, timedelta(minutes=40))
+        self.assertAlmostEqual(second.base_points, expected_points)
+        self.assertAlmostEqual(self.profile.score, expected_points)
+
+        second.delete()
+
+        self.assertFalse(WorkoutDailySummary.objects.filter(user=self.user).exists())
+
+    def test_missing_summary_is_built_from_checkins(self):
+        """Days without a summary row are aggregated from the check-ins on first use"""
+        self._create_workout(30)
+        WorkoutDailySummary.objects.all().delete()
+
+        self._create_workout(30, offset=1)
+
+        summary = self._summary()
+        self.assertEqual(summary.workout_count, 2)
+        self.assertEqual(summary.total_duration, timedelta(minutes=60))
+
+    def test_bonus_is_accumulated(self):
+        """Bonuses given to a check-in are added to its day summary"""
+        workout = self._create_workout(30)
+        bonus = GamificationBonus.objects.create(
+            created_by=self.user,
+            score=3.0,
+            content_type=ContentType.objects.get_for_model(WorkoutCheckin),
+            object_id=workout.id
+        )
+
+        self.assertEqual(self._summary().bonus_points, 3.0)
+
+        bonus.delete()
+
+        self.assertEqual(self._summary().bonus_points, 0.0)
+
+    def test_rebuild_command_fixes_drift(self):
+        """The management command rebuilds drifted and stale summaries"""
+        self._create_workout(30)
+        WorkoutDailySummary.objects.filter(user=self.user).update(workout_count=5)
+        WorkoutDailySummary.objects.create(user=self.user, date=self.day - timedelta(days=3), workout_count=1)
+
+        call_command('rebuild_workout_summaries', stdout=StringIO())
+
+        self.assertEqual(self._summary().workout_count, 1)
+        self.assertEqual(WorkoutDailySummary.objects.filter(user=self.user).count(), 1)
+
+
+class WorkoutDayRangeIndexTest(TestCase):
+    """Test that workout day lookups can use the (user, workout_date) index"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='indexuser', email='index@example.com', password='pass1234')
+
+    @unittest.skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are checked on PostgreSQL only')
+    def test_day_lookup_uses_index(self):
+        """The day check-ins are fetched through the (user, workout_date) index"""
+        queryset = WorkoutDailySummary.day_workouts(self.user.id, timezone.localdate())
+
+        # The test tables are tiny, so sequential scans are turned off and the plan must name the new index
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        self.assertIn('workouts_wo_user_id_16b991_idx', queryset.explain())
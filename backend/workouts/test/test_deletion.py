@@ -0,0 +1,123 @@
+"""
+Tests for the workout check-in deletion side effects
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from clients.models import Client
+from gamification.models import GamificationBonus, GamificationPenalty
+from gamification.services import WorkoutGamification
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin, WorkoutStreak
+
+
+class WorkoutDeletionTest(TestCase):
+    """Test that deleting a check-in reverts its side effects with a bounded number of queries"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.owner = User.objects.create_user(username='deleteowner', email='owner@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Delete Company',
+            cnpj='11222333000132',
+            contact_email='delete@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.owner
+        )
+
+    def _user_with_workouts(self, username, count):
+        user = User.objects.create_user(username=username, password='pass1234')
+        Profile.objects.create(user=user, employer=self.client_obj)
+        now = timezone.now()
+        workouts = [
+            WorkoutCheckin.objects.create(
+                user=user,
+                workout_date=now - timedelta(days=count - index),
+                duration=timedelta(minutes=30)
+            )
+            for index in range(count)
+        ]
+
+        return user, workouts
+
+    def _adjust(self, workout, model, score):
+        return model.objects.create(
+            created_by=self.owner,
+            score=score,
+            content_type=ContentType.objects.get_for_model(WorkoutCheckin),
+            object_id=workout.id
+        )
+
+    def _delete_capturing(self, workout):
+        workout = WorkoutCheckin.objects.select_related('user').get(id=workout.id)
+
+        with CaptureQueriesContext(connection) as queries:
+            workout.delete()
+
+        return queries.captured_queries
+
+    def test_query_count_does_not_grow_with_history(self):
+        """Deleting the latest check-in costs the same whatever the streak length and history size"""
+        short_user, short_workouts = self._user_with_workouts('shorthistory', 2)
+        long_user, long_workouts = self._user_with_workouts('longhistory', 12)
+        WorkoutStreak.objects.filter(user__in=[short_user, long_user]).update(current_streak=10)
+
+        short_queries = self._delete_capturing(short_workouts[-1])
+        long_queries = self._delete_capturing(long_workouts[-1])
+
+        self.assertEqual(len(short_queries), len(long_queries))
+
+    def test_single_profile_update(self):
+        """Day points, bonus and penalty are settled with one profile update"""
+        user, workouts = self._user_with_workouts('adjusteduser', 1)
+        self._adjust(workouts[0], GamificationBonus, 3.0)
+        self._adjust(workouts[0], GamificationPenalty, 1.0)
+        user.profile.refresh_from_db()
+        score_before = user.profile.score
+        workouts[0].refresh_from_db()
+        day_points = workouts[0].base_points
+
+        queries = self._delete_capturing(workouts[0])
+
+        profile_updates = [query for query in queries if query['sql'].startswith('UPDATE "profiles_profile"')]
+        self.assertEqual(len(profile_updates), 1)
+        user.profile.refresh_from_db()
+        self.assertAlmostEqual(user.profile.score, max(score_before - day_points - 3.0 + 1.0, 0))
+        self.assertFalse(GamificationBonus.objects.exists())
+        self.assertFalse(GamificationPenalty.objects.exists())
+
+    def test_zero_score_adjustments_are_removed(self):
+        """Adjustments scoring 0 are deleted with the check-in instead of pointing at a missing object"""
+        user, workouts = self._user_with_workouts('zeroadjusted', 1)
+        self._adjust(workouts[0], GamificationBonus, 0.0)
+        self._adjust(workouts[0], GamificationPenalty, 0.0)
+
+        workouts[0].delete()
+
+        self.assertFalse(GamificationBonus.objects.exists())
+        self.assertFalse(GamificationPenalty.objects.exists())
+
+    def test_streak_membership(self):
+        """Only check-ins among the last `current_streak` ones decrement the streak"""
+        user, workouts = self._user_with_workouts('streakmember', 4)
+        WorkoutStreak.objects.filter(user=user).update(current_streak=2)
+
+        workouts[0].delete()
+        self.assertEqual(WorkoutStreak.objects.get(user=user).current_streak, 2)
+
+        workouts[3].delete()
+        streak = WorkoutStreak.objects.get(user=user)
+        self.assertEqual(streak.current_streak, 1)
+        self.assertEqual(streak.last_workout_datetime, workouts[2].workout_date)
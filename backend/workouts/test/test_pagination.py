@@ -0,0 +1,111 @@
+"""
+Tests for the paginated workout check-in lists
+"""
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from clients.models import Client
+from gamification.services import WorkoutGamification
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin, WorkoutCheckinProof
+
+
+class WorkoutCheckinsPaginationTest(TestCase):
+    """Test cursor pagination, date filters and prefetching of the check-in lists"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username='pageuser', email='page@example.com', password='pass1234')
+        self.other_user = User.objects.create_user(username='otherpage', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Page Company',
+            cnpj='11222333000199',
+            contact_email='page@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        Profile.objects.create(user=self.other_user, employer=self.client_obj)
+        self.now = timezone.now()
+        self.workouts = [self._workout(self.user, days) for days in range(1, 8)]
+        self._workout(self.other_user, 1)
+
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def _workout(self, user, days_ago):
+        workout = WorkoutCheckin.objects.create(
+            user=user,
+            workout_date=self.now - timedelta(days=days_ago),
+            duration=timedelta(minutes=30)
+        )
+        WorkoutCheckinProof.objects.create(checkin=workout, file=f'workouts/proof_{workout.id}.jpg')
+
+        return workout
+
+    def _walk(self, url, params):
+        ids = []
+
+        while url:
+            response = self.api.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [item['id'] for item in response.data['results']]
+            url, params = response.data['next'], None
+
+        return ids
+
+    def test_cursor_walks_every_checkin_once(self):
+        """Following the next links returns each check-in once, most recent first"""
+        ids = self._walk(reverse('workout-by-user', kwargs={'user_id': self.user.id}), {'page_size': 3})
+
+        self.assertEqual(ids, [workout.id for workout in self.workouts])
+
+    def test_list_is_scoped_to_the_authenticated_user(self):
+        """The check-in list only returns the requesting user's check-ins"""
+        ids = self._walk(reverse('workout-list'), {'page_size': 100})
+
+        self.assertEqual(sorted(ids), sorted(workout.id for workout in self.workouts))
+
+    def test_date_range_filter(self):
+        """start_date/end_date restrict the list to whole local days"""
+        start_date = timezone.localdate(self.workouts[4].workout_date)
+        end_date = timezone.localdate(self.workouts[2].workout_date)
+
+        response = self.api.get(reverse('workout-list'), {'start_date': start_date, 'end_date': end_date})
+
+        self.assertEqual(
+            [item['id'] for item in response.data['results']],
+            [workout.id for workout in self.workouts[2:5]]
+        )
+
+    def test_invalid_date_is_rejected(self):
+        """Malformed dates return 400"""
+        response = self.api.get(reverse('workout-list'), {'start_date': '2024-13-45'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        """Proofs and streaks are fetched with the page instead of per check-in"""
+        url = reverse('workout-by-user', kwargs={'user_id': self.user.id})
+
+        with CaptureQueriesContext(connection) as small_page:
+            self.api.get(url, {'page_size': 2})
+
+        with CaptureQueriesContext(connection) as large_page:
+            self.api.get(url, {'page_size': 7})
+
+        self.assertEqual(len(small_page), len(large_page))
@@ -0,0 +1,132 @@
+"""
+Tests for the bulk workout points recalculation
+"""
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from clients.models import Client
+from gamification.services import Gamification, WorkoutGamification
+from profiles.models import Profile
+from workouts.models import WorkoutCheckin, WorkoutDailySummary
+from workouts.services import WorkoutPointsRecalculationService
+
+
+class WorkoutPointsRecalculationTest(TestCase):
+    """Test the bulk recalculation engine and its management command"""
+
+    def setUp(self):
+        # Keep the base XP independent from the month-end group bonus
+        patcher = patch.object(WorkoutGamification, 'base_xp', return_value=2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.user = User.objects.create_user(username='recalcuser', email='recalc@example.com', password='pass1234')
+        self.other_user = User.objects.create_user(username='recalcother', email='other@example.com', password='pass1234')
+        self.client_obj = Client.objects.create(
+            name='Recalc Company',
+            cnpj='11222333000188',
+            contact_email='recalc@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.user
+        )
+        self.other_client = Client.objects.create(
+            name='Other Company',
+            cnpj='11222333000199',
+            contact_email='other@company.com',
+            phone='11999999999',
+            address='Test Address',
+            owners=self.other_user
+        )
+        Profile.objects.create(user=self.user, employer=self.client_obj)
+        Profile.objects.create(user=self.other_user, employer=self.other_client)
+
+        now = timezone.now()
+        self.workouts = [
+            WorkoutCheckin.objects.create(user=self.user, workout_date=now - timedelta(days=3), duration=timedelta(minutes=30)),
+            WorkoutCheckin.objects.create(
+                user=self.user,
+                workout_date=now - timedelta(days=3, minutes=-1),
+                duration=timedelta(minutes=40)
+            ),
+            WorkoutCheckin.objects.create(user=self.user, workout_date=now - timedelta(days=1), duration=timedelta(minutes=20)),
+        ]
+        self.other_workout = WorkoutCheckin.objects.create(
+            user=self.other_user,
+            workout_date=now - timedelta(days=1),
+            duration=timedelta(minutes=90)
+        )
+        self.expected = self._points()
+
+    def _corrupt(self):
+        WorkoutCheckin.objects.update(base_points=0.5)
+
+    def _points(self):
+        return dict(WorkoutCheckin.objects.values_list('id', 'base_points'))
+
+    def test_recalculation_restores_points(self):
+        """The bulk engine produces the same points as the check-in path"""
+        self._corrupt()
+
+        result = WorkoutPointsRecalculationService(chunk_size=2).run()
+
+        self.assertEqual(result['processed_days'], 3)
+        self.assertEqual(result['updated_days'], 3)
+        for workout_id, points in self._points().items():
+            self.assertAlmostEqual(points, self.expected[workout_id])
+
+        day = timezone.localdate(self.workouts[0].workout_date)
+        summary = WorkoutDailySummary.objects.get(user=self.user, date=day)
+        self.assertAlmostEqual(summary.awarded_points, self.expected[self.workouts[0].id] * 2)
+
+    def test_unchanged_days_are_not_written(self):
+        """Days already holding the right points are skipped"""
+        result = WorkoutPointsRecalculationService().run()
+
+        self.assertEqual(result['updated_days'], 0)
+
+    def test_dry_run_does_not_write(self):
+        """A dry run reports the changes but keeps the stored points"""
+        self._corrupt()
+
+        result = WorkoutPointsRecalculationService().run(dry_run=True)
+
+        self.assertEqual(result['updated_days'], 3)
+        self.assertTrue(all(points == 0.5 for points in self._points().values()))
+
+    def test_client_filter(self):
+        """Only workouts of the given client are recalculated"""
+        self._corrupt()
+
+        WorkoutPointsRecalculationService(client=self.other_client).run()
+
+        points = self._points()
+        self.assertAlmostEqual(points[self.other_workout.id], self.expected[self.other_workout.id])
+        self.assertEqual(points[self.workouts[0].id], 0.5)
+
+    def test_calculate_without_args_uses_bulk_engine(self):
+        """The per-user recalculation mode returns the user's total day points"""
+        self._corrupt()
+
+        total = Gamification.Workout.calculate(self.user)
+
+        self.assertAlmostEqual(total, sum(self.expected[workout.id] for workout in self.workouts))
+        self.assertEqual(self._points()[self.other_workout.id], 0.5)
+
+    def test_command(self):
+        """The command accepts the --since filter and reports progress"""
+        self._corrupt()
+        out = StringIO()
+
+        call_command('recalculate_workout_points', since=str(timezone.localdate() - timedelta(days=2)), stdout=out)
+
+        points = self._points()
+        self.assertIn('Processed 2/2 workout days', out.getvalue())
+        self.assertAlmostEqual(points[self.workouts[2].id], self.expected[self.workouts[2].id])
+        self.assertEqual(points[self.workouts[0].id], 0.5)
@@ -71,7 +71,10 @@ class WorkoutCheckinProofSerializerTest(TestCase):
 
         self.assertIn('id', data)
         self.assertIn('file', data)
-        self.assertEqual(len(data), 2)
+        # Variants stay empty until the media pipeline processes the file
+        self.assertIsNone(data['thumbnail'])
+        self.assertIsNone(data['preview'])
+        self.assertEqual(len(data), 4)
 
     def test_proof_serializer_creation(self):
         """Testa criação através do serializer"""
@@ -172,7 +172,7 @@ class WorkoutCheckinsAPIViewTest(APITestCase):
 
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_create_workout_checkin_success(self):
         """Testa criação bem-sucedida de check-in"""
@@ -411,10 +411,10 @@ class WorkoutCheckinsByUserAPIViewTest(APITestCase):
 
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
 
         # Verificar ordenação (mais recente primeiro)
-        dates = [item['workout_date'] for item in response.data]
+        dates = [item['workout_date'] for item in response.data['results']]
         self.assertGreater(dates[0], dates[1])
 
     def test_only_authenticated_access(self):
@@ -435,7 +435,7 @@ class WorkoutCheckinsByUserAPIViewTest(APITestCase):
         self.client.force_authenticate(user=self.user)
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(len(response.data['results']), 0)
 
 
 class WorkoutPlansAPIViewTest(APITestCase):
@@ -663,7 +663,7 @@ class WorkoutViewsIntegrationTest(APITestCase):
             reverse('workout-by-user', kwargs={'user_id': self.user.id})
         )
         self.assertEqual(user_list_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(user_list_response.data), 1)
+        self.assertEqual(len(user_list_response.data['results']), 1)
 
         # 5. Deletar check-in
         delete_response = self.client.delete(
@@ -699,6 +699,6 @@ class WorkoutViewsIntegrationTest(APITestCase):
         # Pelo menos um check-in deve ter streak > 0
         has_streak = any(
             item['current_streak'] > 0
-            for item in last_checkin_response.data
+            for item in last_checkin_response.data['results']
         )
         self.assertTrue(has_streak)
@@ -1,9 +1,10 @@
 from django.urls import path
 from .views import WorkoutCheckinsAPIView, WorkoutCheckinAPIView, WorkoutCheckinsByUserAPIView, WorkoutPlanAPIView, \
-    WorkoutPlansAPIView
+    WorkoutPlansAPIView, WorkoutBulkImportAPIView
 
 urlpatterns = [
     path('', WorkoutCheckinsAPIView.as_view(), name='workout-list'),
+    path('bulk/', WorkoutBulkImportAPIView.as_view(), name='workout-bulk-import'),
     path('<int:pk>/', WorkoutCheckinAPIView.as_view(), name='workout-detail'),
     path('user/<int:user_id>/', WorkoutCheckinsByUserAPIView.as_view(), name='workout-by-user'),
     path('plans/', WorkoutPlansAPIView.as_view(), name='workout-plans-list'),
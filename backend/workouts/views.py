@@ -2,12 +2,18 @@ from django.shortcuts import render
 from django.core.exceptions import ValidationError
 from drf_spectacular.utils import extend_schema_view, extend_schema
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView, ListAPIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.views import APIView
 
 from rest_framework.response import Response
 from rest_framework import status, permissions
+from rest_framework.exceptions import ValidationError as RequestValidationError
+
+from core.utils import filter_local_dates
 from .models import WorkoutCheckin, WorkoutPlan
-from .serializer import WorkoutCheckinSerializer, WorkoutPlanSerializer
+from .pagination import WorkoutCheckinsPagination
+from .serializer import WorkoutBulkItemSerializer, WorkoutCheckinSerializer, WorkoutPlanSerializer
+from .services import WorkoutBulkImportService
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -26,17 +32,38 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         return obj.user == request.user
 
 
+class WorkoutCheckinListMixin:
+    """
+    Shared behaviour of the check-in list endpoints: cursor pagination (most recent first), optional
+    ``start_date``/``end_date`` query params (YYYY-MM-DD, local days) and the relations read by the serializer
+    fetched with the page instead of per check-in.
+    """
+    pagination_class = WorkoutCheckinsPagination
+
+    def filter_checkins(self, queryset):
+        params = self.request.query_params
+
+        try:
+            queryset = filter_local_dates(queryset, 'workout_date', params.get('start_date'), params.get('end_date'))
+        except ValueError as e:
+            raise RequestValidationError({"detail": str(e)})
+
+        return queryset.select_related('user__workout_streak').prefetch_related('proofs')
+
+
 @extend_schema(tags=['Workouts'])
-class WorkoutCheckinsAPIView(ListCreateAPIView):
+class WorkoutCheckinsAPIView(WorkoutCheckinListMixin, ListCreateAPIView):
     """
-    API view for listing all workout check-ins and creating new ones.
-    - GET: Returns list of all workout check-ins
+    API view for listing the authenticated user's workout check-ins and creating new ones.
+    - GET: Returns a cursor-paginated list of the user's check-ins (filterable by start_date/end_date)
     - POST: Creates new workout check-in for authenticated user
     """
-    queryset = WorkoutCheckin.objects.all()
     serializer_class = WorkoutCheckinSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return self.filter_checkins(WorkoutCheckin.objects.filter(user=self.request.user))
+
     def perform_create(self, serializer):
         """
         Create workout check-in with the authenticated user as owner.
@@ -108,10 +135,53 @@ class WorkoutCheckinAPIView(RetrieveUpdateDestroyAPIView):
 
 
 @extend_schema(tags=['Workouts'])
-class WorkoutCheckinsByUserAPIView(ListAPIView):
+class WorkoutBulkImportAPIView(APIView):
+    """
+    API view for importing a batch of workout check-ins from wearables and gym integrations.
+    - POST: {"workouts": [...]} with up to WorkoutBulkImportService.MAX_BATCH_SIZE items. The valid items are imported
+      together and a result (created id or errors) is returned for every item, in the input order.
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        items = request.data.get('workouts')
+
+        if not isinstance(items, list) or not items:
+            return Response({"detail": "'workouts' must be a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(items) > WorkoutBulkImportService.MAX_BATCH_SIZE:
+            return Response(
+                {"detail": f"At most {WorkoutBulkImportService.MAX_BATCH_SIZE} workouts can be imported at once."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results, valid_items = [], []
+
+        for index, item in enumerate(items):
+            serializer = WorkoutBulkItemSerializer(data=item)
+
+            if serializer.is_valid():
+                valid_items.append((index, serializer.validated_data))
+            else:
+                results.append({'index': index, 'status': 'error', 'errors': serializer.errors})
+
+        for (index, _), result in zip(valid_items, WorkoutBulkImportService([data for _, data in valid_items]).run()):
+            results.append({**result, 'index': index})
+
+        results.sort(key=lambda result: result['index'])
+        created = sum(result['status'] == 'created' for result in results)
+
+        return Response(
+            {'created': created, 'failed': len(results) - created, 'results': results},
+            status=status.HTTP_201_CREATED if created else status.HTTP_400_BAD_REQUEST
+        )
+
+
+@extend_schema(tags=['Workouts'])
+class WorkoutCheckinsByUserAPIView(WorkoutCheckinListMixin, ListAPIView):
     """
     API view for retrieving workout check-ins for a specific user.
-    Returns check-ins ordered by workout date (most recent first).
+    Returns check-ins cursor-paginated by workout date (most recent first), filterable by start_date/end_date.
     """
     serializer_class = WorkoutCheckinSerializer
     permission_classes = [IsAuthenticated]
@@ -124,7 +194,7 @@ class WorkoutCheckinsByUserAPIView(ListAPIView):
         """
         user_id = self.kwargs.get('user_id')
 
-        return WorkoutCheckin.objects.filter(user=user_id).order_by('-workout_date')
+        return self.filter_checkins(WorkoutCheckin.objects.filter(user=user_id))
 
 
 @extend_schema(tags=['Workouts'])
@@ -54,8 +54,18 @@ export async function GET(request: NextRequest) {
       return NextResponse.json({ error: "User ID required" }, { status: 400 });
     }
 
+    // Repassa a paginação por cursor (cursor, page_size) para o backend
+    const pageParams = new URLSearchParams();
+    for (const key of ["cursor", "page_size"]) {
+      const value = request.nextUrl.searchParams.get(key);
+      if (value) {
+        pageParams.set(key, value);
+      }
+    }
+    const queryString = pageParams.toString() ? `?${pageParams}` : "";
+
     const response = await fetchWithTokenRefresh(
-      `${BACKEND_URL}/workouts/user/${userId}/`,
+      `${BACKEND_URL}/workouts/user/${userId}/${queryString}`,
       {
         headers: {
           Authorization: `Bearer ${session.access}`,
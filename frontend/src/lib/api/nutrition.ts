@@ -1,3 +1,5 @@
+import { fetchAllPages } from "./pagination";
+
 export interface MealConfig {
   id: number;
   display_name: string;
@@ -83,13 +85,7 @@ export class NutritionAPI {
   }
 
   static async getMeals(userId: number): Promise<Meal[]> {
-    const response = await fetch(`/api/v1/meals/user/${userId}/`);
-
-    if (!response.ok) {
-      throw new Error("Erro ao buscar refeições");
-    }
-
-    return response.json();
+    return fetchAllPages<Meal>(`/api/v1/meals/user/${userId}/`, "Erro ao buscar refeições");
   }
 
   static async getMealsByDateRange(userId: number, startDate: string, endDate: string): Promise<Meal[]> {
@@ -0,0 +1,38 @@
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+// Maior página aceita pelas listas paginadas por cursor do backend
+export const MAX_PAGE_SIZE = 100;
+
+/**
+ * Busca todas as páginas de uma lista paginada por cursor e devolve os itens concatenados.
+ * O cursor do link `next` é repassado para a mesma URL (as rotas do Next.js fazem o proxy para o backend).
+ */
+export async function fetchAllPages<T>(url: string, errorMessage: string): Promise<T[]> {
+  const items: T[] = [];
+  const separator = url.includes("?") ? "&" : "?";
+  let cursor: string | null = null;
+
+  do {
+    const params = new URLSearchParams({ page_size: String(MAX_PAGE_SIZE) });
+
+    if (cursor) {
+      params.set("cursor", cursor);
+    }
+
+    const response = await fetch(`${url}${separator}${params}`);
+
+    if (!response.ok) {
+      throw new Error(errorMessage);
+    }
+
+    const page: CursorPage<T> = await response.json();
+    items.push(...page.results);
+    cursor = page.next ? new URL(page.next).searchParams.get("cursor") : null;
+  } while (cursor);
+
+  return items;
+}
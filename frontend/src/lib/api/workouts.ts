@@ -1,3 +1,5 @@
+import { fetchAllPages } from "./pagination";
+
 export interface WorkoutCheckin {
   id: number;
   user: number;
@@ -41,12 +43,7 @@ export interface WorkoutStats {
 
 export class WorkoutsAPI {
   static async getWorkouts(userId: number): Promise<WorkoutCheckin[]> {
-    const response = await fetch(`/api/workouts?userId=${userId}`);
-
-    if (!response.ok) {
-      throw new Error("Erro ao buscar treinos");
-    }
-    return response.json();
+    return fetchAllPages<WorkoutCheckin>(`/api/workouts?userId=${userId}`, "Erro ao buscar treinos");
   }
 
   static async createWorkout(data: CreateWorkoutData): Promise<WorkoutCheckin> {